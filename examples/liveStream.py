@@ -0,0 +1,16 @@
+import asyncio
+
+from cevlib import live
+from cevlib.types.types import LiveEventType
+
+async def main() -> None:
+    live.setRefreshInterval(10) # one LiveScores download every 10s, no matter how many streams are open
+
+    async for event in live.stream(): # every live match at once
+        if event.type == LiveEventType.ScoreChanged:
+            print(event.match.homeTeam.name, event.match.awayTeam.name, event.result)
+        else:
+            print(event.type.value, event.matchId)
+
+asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+asyncio.run(main())
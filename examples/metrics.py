@@ -0,0 +1,25 @@
+import asyncio
+import os
+
+from cevlib.helpers import metrics
+from cevlib.match import Match
+
+def printTrace(event: metrics.Event) -> None:
+    if event.kind != "trace":
+        return
+    print(f"{event.name}: {event.duration:.3f}s, {event.size} bytes downloaded")
+    for child in event.children:
+        print(f"    {child.kind:10} {child.name:28} {child.duration * 1000:8.1f}ms {child.size:8} bytes")
+
+async def main() -> None:
+    collector = metrics.PrometheusCollector()
+    metrics.addHook(collector) # aggregated counters (e.g. for a /metrics endpoint)
+    metrics.addHook(printTrace) # one structured trace per cache() call
+
+    match = await Match.byUrl("https://championsleague.cev.eu/en/match-centres/cev-champions-league-volley-2022/women/clw-38-lp-salo-v-asptt-mulhouse-vb/")
+    await match.cache()
+    print(collector.expose())
+
+if os.name == "nt": # windows only
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+asyncio.run(main())
@@ -1,5 +1,6 @@
 import asyncio
 
+from cevlib.helpers.scheduler import PollPolicy, setPollBudget
 from cevlib.match import Match
 from cevlib.types.results import Result
 
@@ -12,7 +13,11 @@ async def main() -> None:
         print(await x.duration())
 
     match.addScoreObserver(implement)
-    match.setScoreObserverInterval(10) # 10s
+    match.setScoreObserverInterval(10) # 10s while a set is played
+    # or all intervals: upcoming matches every 15min (10s from 10min before the start),
+    # live ones every 10s (up to 60s between sets), finished ones are checked once more
+    match.setScoreObserverPolicy(PollPolicy(live = 10, liveBreak = 60, upcoming = 900, nearStart = 600))
+    setPollBudget(30) # at most 30 polls per minute across all observed matches
 
     while True:
         await asyncio.sleep(1)
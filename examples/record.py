@@ -0,0 +1,25 @@
+import asyncio
+import os
+
+from cevlib.calendar import Calendar
+from cevlib.competitions import Competition
+from cevlib.featured import Featured
+from cevlib.helpers.transport import RecordingTransport, ReplayTransport, setTransport
+from cevlib.match import Match
+
+MATCH = "https://championsleague.cev.eu/en/match-centres/cev-champions-league-volley-2022/women/clw-38-lp-salo-v-asptt-mulhouse-vb/"
+COMPETITION = "https://www.cev.eu/european-cups/cev-champions-league-volley/cev-volleyball-champions-league-2023-men/"
+
+async def main() -> None:
+    setTransport(RecordingTransport("recording")) # every response is stored in ./recording
+    await (await Match.byUrl(MATCH)).cache()
+    await Competition.fromUrl(COMPETITION)
+    await Calendar.matchesOfMonth(3, 2022)
+    await Featured().init()
+
+    setTransport(ReplayTransport("recording")) # same requests, no network
+    print( await (await Match.byUrl(MATCH)).cache() )
+
+if os.name == "nt": # windows only
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+asyncio.run(main())
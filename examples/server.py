@@ -0,0 +1,5 @@
+from cevlib.server import Gateway
+
+# http://127.0.0.1:8080/match?url=<match centre link>, /competition?url=..., /calendar?month=3&year=2022
+# live updates: /live (snapshot), /live/events (server-sent events), /live/ws (websocket)
+Gateway(ttl = 30, liveInterval = 10).run(port = 8080) # all clients share one cache and one LiveScores loop
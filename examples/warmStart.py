@@ -0,0 +1,22 @@
+import asyncio
+import os
+
+from cevlib.competitions import Competition
+from cevlib.warmStart import WarmStartCache
+
+COMPETITION = "https://www.cev.eu/european-cups/cev-champions-league-volley/cev-volleyball-champions-league-2023-men/"
+
+async def main() -> None:
+    cache = WarmStartCache("competitions.cache")
+    if cache.load():
+        revalidation = cache.revalidateInBackground() # serve the cached data meanwhile
+    else:
+        await cache.revalidate([ COMPETITION ]) # cold start: download, parse and save
+        revalidation = None
+    print( await Competition.fromUrl(COMPETITION) )
+    if revalidation:
+        print("changed" if await revalidation else "unchanged")
+
+if os.name == "nt": # windows only
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+asyncio.run(main())
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""cevlib"""
+from __future__ import annotations
+__copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
+
+# everything is importable from here (e.g. from cevlib import Calendar), but a module is
+# only imported once one of its names is used (PEP 562). bs4 and aiohttp are loaded by
+# the first html parse / request.
+
+from importlib import import_module
+from typing import Any, Dict, List
+
+_MODULES: Dict[str, str] = {
+    "Match": "cevlib.match",
+    "MatchCache": "cevlib.match",
+    "Calendar": "cevlib.calendar",
+    "CalendarMatch": "cevlib.calendar",
+    "Competition": "cevlib.competitions",
+    "CompetitionLink": "cevlib.competitions",
+    "Competitions": "cevlib.competitions",
+    "Draw": "cevlib.competitions",
+    "Pool": "cevlib.competitions",
+    "Round": "cevlib.competitions",
+    "Standings": "cevlib.competitions",
+    "Featured": "cevlib.featured",
+    "Homepage": "cevlib.homepage",
+    "LiveEvent": "cevlib.live",
+    "Gateway": "cevlib.server",
+    "WarmStartCache": "cevlib.warmStart",
+    "Archive": "cevlib.archive",
+    "ArchivedMatch": "cevlib.archive",
+    "Exporter": "cevlib.export",
+    "MediaInfo": "cevlib.media",
+    "MediaResolver": "cevlib.media",
+    "StatsAggregator": "cevlib.aggregator",
+    "StatsTotal": "cevlib.aggregator",
+    "NotInitialisedException": "cevlib.exceptions",
+    "NotRecordedException": "cevlib.exceptions",
+    "MatchCompetition": "cevlib.types.competition",
+    "EntityStore": "cevlib.types.entities",
+    "Info": "cevlib.types.info",
+    "PlayByPlay": "cevlib.types.playByPlay",
+    "MatchReport": "cevlib.types.report",
+    "Result": "cevlib.types.results",
+    "SetResult": "cevlib.types.results",
+    "Player": "cevlib.types.team",
+    "Team": "cevlib.types.team",
+    "TeamRef": "cevlib.types.team",
+    "CompetitionGender": "cevlib.types.types",
+    "LiveEventType": "cevlib.types.types",
+    "MatchState": "cevlib.types.types",
+}
+
+__all__ = sorted(_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module 'cevlib' has no attribute '{name}'")
+    value = getattr(import_module(module), name)
+    globals()[name] = value # the next lookup doesn't end up here
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_MODULES))
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""cevlib"""
+from __future__ import annotations
+__copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
+
+# season totals of players and teams, summed over any number of matches.
+#
+#   aggregator = StatsAggregator()
+#   for url in urls:
+#       aggregator.addMatch(await (await Match.byUrl(url)).cache())
+#   aggregator.topPlayers("points", 10)
+#
+# every stat is a column (array) indexed by a player's / team's row. each match remembers
+# what it contributed, adding it again (e.g. a live match that went on) replaces it.
+
+from array import array
+import heapq
+import json
+from typing import TYPE_CHECKING, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+from cevlib.helpers.dictTool import DictEx
+from cevlib.types.iType import IType, JObject
+from cevlib.types.team import Team
+
+if TYPE_CHECKING:
+    from cevlib.match import MatchCache
+
+STATS: Tuple[str, ...] = ( "points", "serves", "spikes", "blocks", "receptions" )
+_PAYLOAD_STATS = ( "Points", "Serves", "Spikes", "Blocks", "Reception" )
+
+TValues = Tuple[int, ...] # one value per stat
+TPlayerRow = Tuple[str, int, TValues] # name, number, values
+TLabel = Tuple[str, int, str] # name, number, team
+
+
+class _Table:
+    """rows of accumulated stats (plus the number of matches), top n by any stat"""
+    def __init__(self) -> None:
+        self.keys: List[Hashable] = [ ]
+        self.labels: List[TLabel] = [ ] # name, number (latest), team
+        self._rows: Dict[Hashable, int] = { }
+        self.matches = array("q")
+        self.columns: Dict[str, array[int]] = { stat: array("q") for stat in STATS }
+        # per stat a max heap of (-value, row), entries of outdated values are skipped
+        # (and dropped once they outnumber the rows)
+        self._heaps: Dict[str, List[Tuple[int, int]]] = { stat: [ ] for stat in STATS }
+
+    def row(self, key: Hashable) -> Optional[int]:
+        """row of key (None if it has never been added)"""
+        return self._rows.get(key)
+
+    def add(self, key: Hashable, label: TLabel, values: TValues, sign: int) -> int:
+        """adds (sign 1) or subtracts (sign -1) one match of key"""
+        row = self._rows.get(key)
+        if row is None:
+            row = self._rows[key] = len(self.keys)
+            self.keys.append(key)
+            self.labels.append(label)
+            self.matches.append(0)
+            for column in self.columns.values():
+                column.append(0)
+        elif sign > 0:
+            self.labels[row] = label
+        self.matches[row] += sign
+        for stat, value in zip(STATS, values):
+            if value:
+                column = self.columns[stat]
+                column[row] += sign * value
+                heapq.heappush(self._heaps[stat], (-column[row], row))
+        return row
+
+    def _compact(self, stat: str) -> None:
+        heap = self._heaps[stat]
+        if len(heap) > 2 * len(self.keys) + 64:
+            column = self.columns[stat]
+            heap[:] = [ (-column[row], row) for row in range(len(self.keys)) ]
+            heapq.heapify(heap)
+
+    def top(self, stat: str, count: int) -> List[int]:
+        """rows with the highest values of stat (O(k log n), ties by insertion order)"""
+        self._compact(stat)
+        heap, column = self._heaps[stat], self.columns[stat]
+        rows: List[int] = [ ]
+        seen = set()
+        # walks the heap best first: a child is never better than its parent
+        frontier = [ (heap[0], 0) ] if heap else [ ]
+        while frontier and len(rows) < count:
+            (negativeValue, row), index = heapq.heappop(frontier)
+            if row not in seen and column[row] == -negativeValue and self.matches[row] > 0:
+                seen.add(row)
+                rows.append(row)
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        if len(rows) < count: # rows without any value of stat (never pushed)
+            for row in range(len(self.keys)):
+                if len(rows) == count:
+                    break
+                if row not in seen and self.matches[row] > 0 and not column[row]:
+                    rows.append(row)
+        return rows
+
+
+class StatsTotal(IType):
+    """a player's or team's stats, summed over the matches they've played"""
+    def __init__(self, name: str, number: int, team: str, matches: int, stats: Dict[str, int]) -> None: # pylint: disable=line-too-long
+        self._name = name
+        self._number = number
+        self._team = team
+        self._matches = matches
+        self._stats = stats
+
+    @property
+    def name(self) -> str:
+        """player's (team's) name"""
+        return self._name
+
+    @property
+    def number(self) -> int:
+        """player's number (0 for teams)"""
+        return self._number
+
+    @property
+    def team(self) -> str:
+        """team's name"""
+        return self._team
+
+    @property
+    def matches(self) -> int:
+        """matches played"""
+        return self._matches
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """totals by stat (see STATS)"""
+        return self._stats
+
+    def average(self, stat: str) -> float:
+        """stat per match"""
+        return self._stats[stat] / self._matches if self._matches else 0.0
+
+    @property
+    def valid(self) -> bool:
+        return self._matches > 0
+
+    def toJson(self) -> JObject:
+        return {
+            "name": self.name,
+            "number": self.number,
+            "team": self.team,
+            "matches": self.matches,
+            "stats": self.stats
+        }
+
+    def __repr__(self) -> str:
+        return f"(cevlib.aggregator.StatsTotal) {self._name} ({self._team}) {self._matches} matches {self._stats}" # pylint: disable=line-too-long
+
+
+class StatsAggregator:
+    """player and team totals over the matches added (keyed by e.g. the match centre link)"""
+    def __init__(self) -> None:
+        self._players = _Table()
+        self._teams = _Table()
+        # what every match added: (team, [ (player, number, values) ])
+        self._contributions: Dict[Hashable, List[Tuple[str, List[TPlayerRow]]]] = { }
+
+    @property
+    def matches(self) -> List[Hashable]:
+        """keys of the matches added"""
+        return list(self._contributions)
+
+    def __len__(self) -> int:
+        return len(self._contributions)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._contributions
+
+    def _add(self, key: Hashable, teams: List[Tuple[str, List[TPlayerRow]]]) -> None:
+        self.remove(key) # added before (e.g. live): replaced, not counted twice
+        self._contributions[key] = teams
+        self._apply(teams, 1)
+
+    def _apply(self, teams: List[Tuple[str, List[TPlayerRow]]], sign: int) -> None:
+        for team, players in teams:
+            totals = [ 0 ] * len(STATS)
+            for name, number, values in players:
+                self._players.add((team, name), (name, number, team), values, sign)
+                totals = [ total + value for total, value in zip(totals, values) ]
+            self._teams.add(team, (team, 0, team), tuple(totals), sign)
+
+    def remove(self, key: Hashable) -> bool:
+        """subtracts a match again (False if it hasn't been added)"""
+        teams = self._contributions.pop(key, None)
+        if teams is None:
+            return False
+        self._apply(teams, -1)
+        return True
+
+    @staticmethod
+    def _teamRows(team: Team) -> List[TPlayerRow]:
+        return [ (player.name, player.number, (player.stats.points, player.stats.serves,
+                                               player.stats.spikes, player.stats.blocks,
+                                               player.stats.receptions))
+                 for player in team.players if player.stats is not None ]
+
+    def addTeams(self, key: Hashable, *teams: Team) -> None:
+        """adds the players (with stats) of the teams of a match"""
+        self._add(key, [ (team.name or "", self._teamRows(team)) for team in teams ])
+
+    def addMatch(self, match: MatchCache, key: Optional[Hashable] = None) -> None:
+        """adds both teams of a match (key: the match centre link by default)"""
+        self.addTeams(key if key is not None else match.matchCentreLink,
+                      match.homeTeam, match.awayTeam)
+
+    def addPlayerStats(self,
+                       key: Hashable,
+                       data: Union[str, JObject],
+                       teams: Tuple[str, str]) -> None:
+        """adds the GetPlayerStatsComponentMC payload of a match (teams: home, away name)"""
+        if isinstance(data, str): # the component returns its json as a string
+            data = json.loads(data)
+        assert isinstance(data, dict)
+        rows: List[Tuple[str, List[TPlayerRow]]] = [ ]
+        for team, payload in zip(teams, data.get("Teams") or [ ]):
+            players: List[TPlayerRow] = [ ]
+            for player in payload.get("Players") or [ ]:
+                dex = DictEx(player)
+                players.append((dex.ensure("Name", str).title(),
+                                dex.ensure("PlayerNumber", int),
+                                tuple(dex.ensure(stat, int) for stat in _PAYLOAD_STATS)))
+            rows.append((team, players))
+        self._add(key, rows)
+
+    @staticmethod
+    def _total(table: _Table, row: int) -> StatsTotal:
+        name, number, team = table.labels[row]
+        return StatsTotal(name, number, team, table.matches[row],
+                          { stat: table.columns[stat][row] for stat in STATS })
+
+    def _check(self, stat: str) -> None:
+        if stat not in STATS:
+            raise ValueError(f"unknown stat '{stat}' (one of {', '.join(STATS)})")
+
+    def topPlayers(self, stat: str, count: int = 10) -> List[StatsTotal]:
+        """the count players with the highest totals of stat"""
+        self._check(stat)
+        return [ self._total(self._players, row) for row in self._players.top(stat, count) ]
+
+    def topTeams(self, stat: str, count: int = 10) -> List[StatsTotal]:
+        """the count teams with the highest totals of stat"""
+        self._check(stat)
+        return [ self._total(self._teams, row) for row in self._teams.top(stat, count) ]
+
+    def player(self, team: str, name: str) -> Optional[StatsTotal]:
+        """a player's totals (None if they haven't played)"""
+        row = self._players.row((team, name.title()))
+        if row is None or not self._players.matches[row]:
+            return None
+        return self._total(self._players, row)
+
+    def team(self, team: str) -> Optional[StatsTotal]:
+        """a team's totals (None if it hasn't played)"""
+        row = self._teams.row(team)
+        if row is None or not self._teams.matches[row]:
+            return None
+        return self._total(self._teams, row)
+
+    def players(self) -> Iterable[StatsTotal]:
+        """totals of all players that have played"""
+        for row in range(len(self._players.keys)):
+            if self._players.matches[row]:
+                yield self._total(self._players, row)
+
+    def __repr__(self) -> str:
+        return f"(cevlib.aggregator.StatsAggregator) {len(self._contributions)} matches, {len(self._players.keys)} players" # pylint: disable=line-too-long
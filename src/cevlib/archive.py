@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+"""cevlib"""
+from __future__ import annotations
+__copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
+
+# a local, queryable archive of matches (sqlite).
+#
+#   archive = Archive("matches.db")
+#   archive.add(await match.cache())          # MatchCache, CalendarMatch or Competition
+#   archive.query().team(12240).competition("CEV Cup").season("2022").all()
+#   archive.query().finished().between(datetime(2022, 3, 1), datetime(2022, 4, 1)).all()
+#   archive.query().official("John Doe").all()
+#
+# queries only read the indexed columns, the full model is unpickled on first use
+# (ArchivedMatch.model). only open archives written by this library.
+
+from datetime import datetime
+import pickle
+import sqlite3
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple, Type, Union
+
+from cevlib.calendar import CalendarMatch
+from cevlib.competitions import Competition
+from cevlib.types.iMatch import IMatch
+from cevlib.types.iType import IType, JObject
+from cevlib.types.team import TeamRef
+from cevlib.types.types import MatchState
+
+if TYPE_CHECKING:
+    from cevlib.match import MatchCache
+
+# bump whenever the schema or a pickled model changes (archives of other versions are rebuilt)
+FORMAT_VERSION = 1
+
+# a full snapshot is never replaced by a calendar match
+_CALENDAR, _CACHE = 0, 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    link TEXT PRIMARY KEY,
+    kind INTEGER NOT NULL,
+    competition TEXT,
+    season TEXT,
+    phase TEXT,
+    startTime TEXT,
+    venue TEXT,
+    state TEXT,
+    homeTeam TEXT,
+    awayTeam TEXT,
+    homeScore INTEGER,
+    awayScore INTEGER,
+    model BLOB
+);
+CREATE TABLE IF NOT EXISTS teams ( link TEXT NOT NULL, teamId INTEGER, name TEXT );
+CREATE TABLE IF NOT EXISTS officials ( link TEXT NOT NULL, name TEXT, type TEXT );
+CREATE INDEX IF NOT EXISTS matchesCompetition ON matches ( competition, season );
+CREATE INDEX IF NOT EXISTS matchesSeason ON matches ( season );
+CREATE INDEX IF NOT EXISTS matchesPhase ON matches ( phase );
+CREATE INDEX IF NOT EXISTS matchesStartTime ON matches ( startTime );
+CREATE INDEX IF NOT EXISTS matchesVenue ON matches ( venue );
+CREATE INDEX IF NOT EXISTS teamsId ON teams ( teamId );
+CREATE INDEX IF NOT EXISTS teamsName ON teams ( name );
+CREATE INDEX IF NOT EXISTS teamsLink ON teams ( link );
+CREATE INDEX IF NOT EXISTS officialsName ON officials ( name );
+CREATE INDEX IF NOT EXISTS officialsLink ON officials ( link );
+"""
+
+_COLUMNS = "link, competition, season, phase, startTime, venue, state, homeTeam, awayTeam, homeScore, awayScore" # pylint: disable=line-too-long
+
+TRow = Tuple[Any, ...]
+Archivable = Union["MatchCache", CalendarMatch]
+
+
+class ArchivedMatch(IType):
+    """the indexed columns of an archived match (model: the archived model itself)"""
+    def __init__(self, archive: Archive, row: TRow) -> None:
+        self._archive = archive
+        (self._link, self._competition, self._season, self._phase, startTime, self._venue,
+         state, self._homeTeam, self._awayTeam, self._homeScore, self._awayScore) = row
+        self._startTime = datetime.fromisoformat(startTime)
+        self._state = MatchState(state)
+        self._model: Optional[IMatch] = None
+
+    @property
+    def matchCentreLink(self) -> str:
+        """match centre link (the archive's key)"""
+        return str(self._link)
+
+    @property
+    def competition(self) -> str:
+        """competition name"""
+        return str(self._competition)
+
+    @property
+    def season(self) -> str:
+        """season (the year the match started if the competition doesn't tell)"""
+        return str(self._season)
+
+    @property
+    def phase(self) -> str:
+        """phase"""
+        return str(self._phase)
+
+    @property
+    def startTime(self) -> datetime:
+        """start time (utc)"""
+        return self._startTime
+
+    @property
+    def venue(self) -> str:
+        """venue"""
+        return str(self._venue)
+
+    @property
+    def state(self) -> MatchState:
+        """state when the match was archived"""
+        return self._state
+
+    @property
+    def teams(self) -> Tuple[str, str]:
+        """(home, away) names"""
+        return str(self._homeTeam), str(self._awayTeam)
+
+    @property
+    def score(self) -> Tuple[int, int]:
+        """(home, away) sets won"""
+        return int(self._homeScore), int(self._awayScore)
+
+    @property
+    def model(self) -> IMatch:
+        """the archived MatchCache / CalendarMatch (loaded on first use)"""
+        if self._model is None:
+            self._model = self._archive.load(self.matchCentreLink)
+        assert self._model is not None
+        return self._model
+
+    @property
+    def valid(self) -> bool:
+        return bool(self._link)
+
+    def toJson(self) -> JObject:
+        return {
+            "matchCentreLink": self.matchCentreLink,
+            "competition": self.competition,
+            "season": self.season,
+            "phase": self.phase,
+            "startTime": str(self.startTime),
+            "venue": self.venue,
+            "state": self.state.value,
+            "homeTeam": self.teams[0],
+            "awayTeam": self.teams[1],
+            "homeScore": self.score[0],
+            "awayScore": self.score[1]
+        }
+
+    def __repr__(self) -> str:
+        return f"(cevlib.archive.ArchivedMatch) {self._link} {self._homeTeam} {self._homeScore}:{self._awayScore} {self._awayTeam} ({self._startTime})" # pylint: disable=line-too-long
+
+
+class ArchiveQuery:
+    """filters archived matches (every filter narrows the result), see Archive.query"""
+    def __init__(self, archive: Archive) -> None:
+        self._archive = archive
+        self._conditions: List[str] = [ ]
+        self._parameters: List[Any] = [ ]
+
+    def _where(self, condition: str, *parameters: Any) -> ArchiveQuery:
+        self._conditions.append(condition)
+        self._parameters.extend(parameters)
+        return self
+
+    def team(self, team: Union[int, str, TeamRef]) -> ArchiveQuery:
+        """matches of a team (by id, name or TeamRef)"""
+        if isinstance(team, TeamRef):
+            team = team.id or team.name or ""
+        if isinstance(team, int):
+            return self._where("link IN (SELECT link FROM teams WHERE teamId = ?)", team)
+        return self._where("link IN (SELECT link FROM teams WHERE name = ?)", team)
+
+    def competition(self, name: str) -> ArchiveQuery:
+        """matches of a competition (by name, e.g. CEV Cup)"""
+        return self._where("competition = ?", name)
+
+    def season(self, season: str) -> ArchiveQuery:
+        """matches of a season"""
+        return self._where("season = ?", season)
+
+    def phase(self, phase: str) -> ArchiveQuery:
+        """matches of a phase"""
+        return self._where("phase = ?", phase)
+
+    def venue(self, venue: str) -> ArchiveQuery:
+        """matches played at a venue"""
+        return self._where("venue = ?", venue)
+
+    def official(self, name: str) -> ArchiveQuery:
+        """matches an official (e.g. a referee) was part of"""
+        return self._where("link IN (SELECT link FROM officials WHERE name = ?)", name)
+
+    def between(self, start: datetime, end: datetime) -> ArchiveQuery:
+        """matches that started at or after start and before end (utc)"""
+        return self._where("startTime >= ? AND startTime < ?",
+                           start.isoformat(sep = " "), end.isoformat(sep = " "))
+
+    def state(self, state: MatchState) -> ArchiveQuery:
+        """matches in a state (when they were archived)"""
+        return self._where("state = ?", state.value)
+
+    def finished(self) -> ArchiveQuery:
+        """finished matches"""
+        return self.state(MatchState.Finished)
+
+    def _sql(self, columns: str) -> str:
+        where = f" WHERE {' AND '.join(self._conditions)}" if self._conditions else ""
+        return f"SELECT {columns} FROM matches{where}"
+
+    def count(self) -> int:
+        """number of matches"""
+        return int(self._archive.execute(self._sql("COUNT(*)"), self._parameters)[0][0])
+
+    def all(self, limit: Optional[int] = None) -> List[ArchivedMatch]:
+        """the matches by start time"""
+        sql = self._sql(_COLUMNS) + " ORDER BY startTime"
+        parameters = list(self._parameters)
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+        return [ ArchivedMatch(self._archive, row)
+                 for row in self._archive.execute(sql, parameters) ]
+
+    def first(self) -> Optional[ArchivedMatch]:
+        """the earliest match"""
+        matches = self.all(1)
+        return matches[0] if matches else None
+
+    def __repr__(self) -> str:
+        return f"(cevlib.archive.ArchiveQuery) {self._sql('*')} {self._parameters}"
+
+
+class Archive:
+    """matches, stored in a sqlite database (':memory:' for a temporary one)"""
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._connection = sqlite3.connect(path)
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, FORMAT_VERSION):
+            # written by another version: rebuilt from scratch
+            self._connection.executescript("DROP TABLE IF EXISTS matches; "
+                                           "DROP TABLE IF EXISTS teams; "
+                                           "DROP TABLE IF EXISTS officials;")
+        self._connection.executescript(_SCHEMA)
+        self._connection.execute(f"PRAGMA user_version = {FORMAT_VERSION}")
+
+    @property
+    def path(self) -> str:
+        """the database file"""
+        return self._path
+
+    def execute(self, sql: str, parameters: Iterable[Any] = ()) -> List[TRow]:
+        """runs a (read only) statement (for queries ArchiveQuery doesn't cover)"""
+        return self._connection.execute(sql, tuple(parameters)).fetchall()
+
+    def query(self) -> ArchiveQuery:
+        """all matches (narrowed by the query's filters)"""
+        return ArchiveQuery(self)
+
+    def __len__(self) -> int:
+        return self.query().count()
+
+    def __contains__(self, link: str) -> bool:
+        return bool(self.execute("SELECT 1 FROM matches WHERE link = ?", (link, )))
+
+    def load(self, link: str) -> Optional[IMatch]:
+        """the archived model (None if the match isn't archived)"""
+        rows = self.execute("SELECT model FROM matches WHERE link = ?", (link, ))
+        if not rows:
+            return None
+        model: IMatch = pickle.loads(rows[0][0])
+        return model
+
+    def _insert(self, match: Archivable, kind: int, officials: List[Tuple[str, str]]) -> None:
+        link = match.matchCentreLink
+        if not link:
+            return # e.g. direct qualifications (Calendar.shortcutMatch)
+        competition = match.competition
+        startTime, result = match.startTime, match.result
+        home, away = match.homeTeam, match.awayTeam
+        season = (competition.season if competition else "") or str(startTime.year)
+        cursor = self._connection.execute(
+            "INSERT INTO matches VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (link) DO UPDATE SET kind = excluded.kind, "
+            "competition = excluded.competition, season = excluded.season, "
+            "phase = excluded.phase, startTime = excluded.startTime, venue = excluded.venue, "
+            "state = excluded.state, homeTeam = excluded.homeTeam, "
+            "awayTeam = excluded.awayTeam, homeScore = excluded.homeScore, "
+            "awayScore = excluded.awayScore, model = excluded.model "
+            "WHERE excluded.kind >= matches.kind",
+            (link, kind, competition.name if competition else "", season,
+             competition.phase if competition else "", startTime.isoformat(sep = " "),
+             match.venue, match.state.value, home.name, away.name,
+             result.homeScore, result.awayScore,
+             pickle.dumps(match, protocol = pickle.HIGHEST_PROTOCOL)))
+        if not cursor.rowcount:
+            return # a snapshot is archived already
+        self._connection.execute("DELETE FROM teams WHERE link = ?", (link, ))
+        self._connection.execute("DELETE FROM officials WHERE link = ?", (link, ))
+        self._connection.executemany("INSERT INTO teams VALUES (?, ?, ?)",
+                                     [ (link, team.id or None, team.name)
+                                       for team in (home, away) ])
+        self._connection.executemany("INSERT INTO officials VALUES (?, ?, ?)",
+                                     [ (link, name, type_) for name, type_ in officials ])
+
+    def add(self, item: Union[IMatch, Competition]) -> None:
+        """archives a MatchCache, a CalendarMatch or every match of a Competition"""
+        self.addAll([ item ])
+
+    def addAll(self, items: Iterable[Union[IMatch, Competition]]) -> None:
+        """archives many items (in one transaction)"""
+        from cevlib.match import MatchCache # pylint: disable=import-outside-toplevel
+        with self._connection:
+            for item in items:
+                if isinstance(item, Competition):
+                    for round_ in item.rounds:
+                        for pool in round_.pools:
+                            for draw in pool.draws:
+                                for match in draw.matches:
+                                    self._insert(match, _CALENDAR, [ ])
+                elif isinstance(item, MatchCache):
+                    officials = [ (official.name or "", official.type or "")
+                                  for official in (item.info.officials if item.info else [ ]) ]
+                    self._insert(item, _CACHE, officials)
+                elif isinstance(item, CalendarMatch):
+                    self._insert(item, _CALENDAR, [ ])
+                else:
+                    raise TypeError(f"can't archive {type(item).__name__}")
+
+    def remove(self, link: str) -> bool:
+        """removes a match (False if it isn't archived)"""
+        with self._connection:
+            cursor = self._connection.execute("DELETE FROM matches WHERE link = ?", (link, ))
+            self._connection.execute("DELETE FROM teams WHERE link = ?", (link, ))
+            self._connection.execute("DELETE FROM officials WHERE link = ?", (link, ))
+        return bool(cursor.rowcount)
+
+    def close(self) -> None:
+        """closes the database"""
+        self._connection.close()
+
+    def __enter__(self) -> Archive:
+        return self
+
+    def __exit__(self,
+                 excType: Optional[Type[BaseException]],
+                 exc: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"(cevlib.archive.Archive) {self._path}"
@@ -7,27 +7,29 @@ __copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
 # pylint: disable=invalid-overridden-method
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import aiohttp
-
-from cevlib.match import Match
+from cevlib.helpers import metrics, parsePool, transport
 from cevlib.helpers.dictTool import DictEx
+from cevlib.types import entities
 from cevlib.types.competition import MatchCompetition
 from cevlib.types.iMatch import IMatch
 from cevlib.types.iType import IType, JObject
 from cevlib.types.results import Result
-from cevlib.types.team import Team
+from cevlib.types.team import TeamRef
 from cevlib.types.types import MatchState
 
+if TYPE_CHECKING:
+    from cevlib.match import Match
+
 
 class CalendarMatch(IMatch):
     """simplified match"""
     def __init__(self,
                  url: Optional[str],
                  competition: MatchCompetition,
-                 homeTeam: Team,
-                 awayTeam: Team,
+                 homeTeam: TeamRef,
+                 awayTeam: TeamRef,
                  venue: str,
                  startTime: str,
                  result: Result,
@@ -41,7 +43,7 @@ class CalendarMatch(IMatch):
             startTime += "Z"
         self._startTime = datetime.strptime(startTime, "%Y-%m-%dT%H:%M:%SZ")
         duration = (datetime.now() - self._startTime)
-        self._finished = True if (self._startTime.year == 1900 or duration.days) else finished
+        self._finished = True if (self._startTime.year == 1900 or duration.days > 0) else finished
         self._result = result
         self._state = MatchState.parse(datetime.utcnow() >= self._startTime, self._finished)
 
@@ -50,17 +52,16 @@ class CalendarMatch(IMatch):
         """parses from json object"""
         dex = DictEx(data)
         return CalendarMatch(dex.ensureString("MatchCentreUrl"),
-                             MatchCompetition({ "Competition": dex.ensureString("CompetitionName"),
-                                           "CompetitionLogo": dex.ensureString("CompetitionLogo"),
-                                           "Phase": dex.ensureString("PhaseName") }),
-                             Team.build( dex.ensureString("HomeTeamName"),
-                                         dex.ensureString("HomeTeamLogo"),
-                                         dex.ensureString("HomeClubCode"),
-                                         True ),
-                             Team.build( dex.ensureString("GuestTeamName"),
-                                         dex.ensureString("GuestTeamLogo"),
-                                         dex.ensureString("GuestClubCode"),
-                                         False ),
+                             entities.canonicalCompetition(MatchCompetition({
+                                 "Competition": dex.ensureString("CompetitionName"),
+                                 "CompetitionLogo": dex.ensureString("CompetitionLogo"),
+                                 "Phase": dex.ensureString("PhaseName") })),
+                             TeamRef.canonical( dex.ensureString("HomeTeamName"),
+                                                dex.ensureString("HomeTeamLogo"),
+                                                dex.ensureString("HomeClubCode") ),
+                             TeamRef.canonical( dex.ensureString("GuestTeamName"),
+                                                dex.ensureString("GuestTeamLogo"),
+                                                dex.ensureString("GuestClubCode") ),
                              dex.ensureString("StadiumName"),
                              dex.ensureString("MatchDateTime_UTC"),
                              Result({
@@ -70,19 +71,19 @@ class CalendarMatch(IMatch):
                              dex.ensureBool("Finalized"))
 
     @staticmethod
-    def shortcutMatch(competition: MatchCompetition, team: Team) -> CalendarMatch:
+    def shortcutMatch(competition: MatchCompetition, team: TeamRef) -> CalendarMatch:
         """a match that has only one team. Used in case of direct qualification"""
         return CalendarMatch(None,
                              competition,
                              team,
-                             Team.build("", "", "", False),
+                             TeamRef.canonical("", "", ""),
                              "",
                              datetime.fromtimestamp(0).strftime("%Y-%m-%dT%H:%M:%SZ"),
                              Result({}),
                              True)
 
     @property
-    def teams(self) -> Tuple[Team, Team]:
+    def teams(self) -> Tuple[TeamRef, TeamRef]:
         """(home, away)"""
         return ( self._homeTeam, self._awayTeam )
 
@@ -90,6 +91,7 @@ class CalendarMatch(IMatch):
         """casts this calendar match to a full match"""
         if not self._matchCentreLink:
             return None
+        from cevlib.match import Match # pylint: disable=import-outside-toplevel,redefined-outer-name
         return await Match.byUrl(self._matchCentreLink)
 
     def __repr__(self) -> str:
@@ -116,11 +118,11 @@ class CalendarMatch(IMatch):
         return self._competition
 
     @property
-    def homeTeam(self) -> Team:
+    def homeTeam(self) -> TeamRef:
         return self._homeTeam
 
     @property
-    def awayTeam(self) -> Team:
+    def awayTeam(self) -> TeamRef:
         return self._awayTeam
 
     @property
@@ -157,13 +159,15 @@ class Calendar(IType):
         today = datetime.now()
         timestamp = datetime(year if year else today.year,
                              month if month else today.month, 1).strftime("%Y-%m-%dT%H:%M:%SZ")
+        resp = await transport.get(f"https://www.cev.eu/umbraco/api/CalendarApi/GetCalendar?nodeId=11346&culture=en-US&date={timestamp}") # pylint: disable=line-too-long
+        with metrics.measure("build", "CalendarMatch"):
+            return await parsePool.build(Calendar._parseMonth, resp)
+
+    @staticmethod
+    def _parseMonth(data: JObject) -> List[CalendarMatch]:
         matches: List[Dict[str, Any]] = [ ]
-        async with aiohttp.ClientSession() as client:
-            async with client.get(f"https://www.cev.eu/umbraco/api/CalendarApi/GetCalendar?nodeId=11346&culture=en-US&date={timestamp}") as resp: # pylint: disable=line-too-long
-                jdata = await resp.json(content_type=None)
-                calendar = DictEx(jdata)
-                for date in calendar.ensureList("Dates"):
-                    matches.extend(date.get("Matches") or [ ])
+        for date in DictEx(data).ensureList("Dates"):
+            matches.extend(date.get("Matches") or [ ])
         return [ CalendarMatch.parse(match)
                  for match in matches ]
 
@@ -200,33 +204,39 @@ class Calendar(IType):
         compDict["GroupPool"] = dex.get("groupName")
         compDict["MatchNumber"] = dex.get("matchNumber")
         return CalendarMatch(dex.get("matchCentreLink"),
-                             MatchCompetition(compDict),
-                             Team.build( dex.ensureString("homeTeam"),
-                                         dex.ensureString("homeTeamIcon"),
-                                         dex.ensureString("homeTeamNickname"),
-                                         True ),
-                             Team.build( dex.ensureString("awayTeam"),
-                                         dex.ensureString("awayTeamIcon"),
-                                         dex.ensureString("awayTeamNickname"),
-                                         False ),
+                             entities.canonicalCompetition(MatchCompetition(compDict)),
+                             TeamRef.canonical( dex.ensureString("homeTeam"),
+                                                dex.ensureString("homeTeamIcon"),
+                                                dex.ensureString("homeTeamNickname") ),
+                             TeamRef.canonical( dex.ensureString("awayTeam"),
+                                                dex.ensureString("awayTeamIcon"),
+                                                dex.ensureString("awayTeamNickname") ),
                              dex.ensureString("matchLocation"),
                              dex.ensureString("utcStartDate"),
                              Result(match),
                              dex.ensureString("matchState_String") == "FINISHED")
 
+    @staticmethod
+    def parseLiveScores(jdata: JObject) -> Dict[int, CalendarMatch]:
+        """parses the LiveScores feed (matches by match id)"""
+        return { DictEx(match).ensureInt("matchId"): Calendar._liveScoresToCalendarMatch(match)
+                 for match in Calendar._flattenLiveScores(jdata) }
+
     @staticmethod
     async def _getLiveScoreMatches() -> List[Dict[str, Any]]:
+        jdata = (await transport.get("https://weblivefeed.cev.eu/LiveScores.json")).json()
+        return Calendar._flattenLiveScores(jdata)
+
+    @staticmethod
+    def _flattenLiveScores(data: JObject) -> List[Dict[str, Any]]:
         matches = [ ]
-        async with aiohttp.ClientSession() as client:
-            async with client.get("https://weblivefeed.cev.eu/LiveScores.json") as resp:
-                jdata = DictEx(await resp.json(content_type=None))
-                for competition in jdata.ensure("competitions", list):
-                    dex = DictEx(competition)
-                    for match in dex.ensure("matches", list):
-                        match["competition"] = { "Competition": dex.tryGet("competitionName",
-                                                                              str),
-                                                 "id": dex.tryGet("competitionId", str) }
-                        matches.append(match)
+        jdata = DictEx(data)
+        for competition in jdata.ensure("competitions", list):
+            dex = DictEx(competition)
+            for match in dex.ensure("matches", list):
+                match["competition"] = { "Competition": dex.tryGet("competitionName", str),
+                                         "id": dex.tryGet("competitionId", str) }
+                matches.append(match)
 
         return matches
 
@@ -3,23 +3,28 @@
 from __future__ import annotations
 __copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
 
-from typing import Any, Dict, List, Optional, Tuple
+from array import array
+import asyncio
+import hashlib
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
 import re
-from bs4 import BeautifulSoup # type: ignore
-from bs4.element import Tag # type: ignore
-
-import aiohttp
 
 from cevlib.calendar import CalendarMatch
 
+from cevlib.helpers import htmlParser, metrics, parsePool, transport
 from cevlib.helpers.dictTool import DictEx
+from cevlib.helpers.jsonDelta import Operation, diff
+from cevlib.homepage import Homepage
 
 from cevlib.types.competition import MatchCompetition
 from cevlib.types.iType import IType
 from cevlib.types.results import Result
-from cevlib.types.team import Team
+from cevlib.types.team import TeamRef
 from cevlib.types.types import CompetitionGender
 
+if TYPE_CHECKING:
+    from bs4.element import Tag
+
 
 class Draw(IType):
     """competition draw. consists of two calendarMatches"""
@@ -37,23 +42,27 @@ class Draw(IType):
                 return False
         return True
 
+    def hasTeam(self, team: TeamRef) -> bool:
+        """is the team part of this draw?"""
+        return team in (self._first, self._second)
+
     @property
     def competition(self) -> MatchCompetition:
         """competition"""
         return self._matches[0].competition
 
     @property
-    def firstTeam(self) -> Team:
+    def firstTeam(self) -> TeamRef:
         """first team"""
         return self._first
 
     @property
-    def secondTeam(self) -> Team:
+    def secondTeam(self) -> TeamRef:
         """second team"""
         return self._second
 
     @property
-    def teams(self) -> Tuple[Team, Team]:
+    def teams(self) -> Tuple[TeamRef, TeamRef]:
         """both teams"""
         assert self.valid
         return self._matches[0].teams
@@ -68,6 +77,12 @@ class Draw(IType):
         """matches[index]"""
         return self.matches[index] if index < len(self.matches) else None
 
+    def patch(self, other: Draw) -> None:
+        """takes over the matches of other (a newer version of this draw)"""
+        # pylint: disable=protected-access
+        self._matches[:] = other._matches
+        self._first, self._second = other._first, other._second
+
     @property
     def valid(self) -> bool:
         return bool(self._matches) and self._sameTeams()
@@ -81,15 +96,110 @@ class Draw(IType):
         return [ match.toJson() for match in self._matches ]
 
 
+class StandingsColumn(IType):
+    """a standings column (parsed from the table header once, shared by all pools)"""
+    def __init__(self, group: str, label: str, kind: str) -> None:
+        self._key = f"{group}.{label}"
+        self._group = group
+        self._label = label
+        self._kind = kind
+
+    @property
+    def key(self) -> str:
+        """group.label (e.g. Sets.W), the key of the team's toJson()"""
+        return self._key
+
+    @property
+    def group(self) -> str:
+        """the heading above (e.g. Sets, empty for position and team)"""
+        return self._group
+
+    @property
+    def label(self) -> str:
+        """the column's own heading (e.g. W)"""
+        return self._label
+
+    @property
+    def kind(self) -> str:
+        """int, float or text"""
+        return self._kind
+
+    @property
+    def numeric(self) -> bool:
+        """holds numbers (sortable without parsing)"""
+        return self._kind != "text"
+
+    @property
+    def valid(self) -> bool:
+        return bool(self._label)
+
+    def __repr__(self) -> str:
+        return f"(cevlib.competitions.StandingsColumn) {self._key} ({self._kind})"
+
+    def toJson(self) -> Dict[str, Any]:
+        return {
+            "key": self.key,
+            "group": self.group,
+            "label": self.label,
+            "type": self.kind
+        }
+
+
+StandingsValue = Union[int, float, str]
+StandingsCells = Union["array[int]", "array[float]", List[str]]
+
+_TEAM_LINK = re.compile(r"/team/([0-9]+)-")
+
+
+def _columnKind(cells: List[str]) -> str:
+    """int / float if every cell (of every pool) is one"""
+    try:
+        for cell in cells:
+            int(cell)
+        return "int"
+    except ValueError:
+        pass
+    try:
+        for cell in cells:
+            float(cell.replace(",", "."))
+        return "float"
+    except ValueError:
+        return "text"
+
+def _columnCells(kind: str, cells: List[str]) -> StandingsCells:
+    if kind == "int":
+        return array("q", [ int(cell) for cell in cells ])
+    if kind == "float":
+        return array("d", [ float(cell.replace(",", ".")) for cell in cells ])
+    return cells
+
+
 class StandingsTeam(IType):
-    """standings team"""
-    def __init__(self, team: Dict[str, Any]) -> None:
-        self._team = team
+    """a row of a standings pool"""
+    def __init__(self, pool: StandingsPool, row: int) -> None:
+        self._pool = pool
+        self._row = row
 
     @property
-    def team(self) -> Dict[str, Any]:
-        """the team"""
-        return self._team
+    def id(self) -> int:
+        """team id (0 if the row doesn't link the team)"""
+        return self._pool.teamIds[self._row]
+
+    @property
+    def rank(self) -> int:
+        """row in the table (1: top)"""
+        return self._row + 1
+
+    def get(self, key: str) -> Optional[StandingsValue]:
+        """value of a column (by key, e.g. Sets.W, or label, e.g. Team)"""
+        cells = self._pool.column(key)
+        return cells[self._row] if cells is not None else None
+
+    @property
+    def team(self) -> Dict[str, StandingsValue]:
+        """the row's values by column key"""
+        return { column.key: cells[self._row]
+                 for column, cells in zip(self._pool.columns, self._pool.cells) }
 
     @property
     def valid(self) -> bool:
@@ -99,33 +209,97 @@ class StandingsTeam(IType):
         return f"(cevlib.competitions.StandingsTeam) {self.team}"
 
     def toJson(self) -> Dict[str, Any]:
-        return self._team
+        return self.team
 
 
 class StandingsPool(IType):
-    """standings pool (i.e. group). consists of multiple standingsTeams"""
-    def __init__(self, teams: List[StandingsTeam]) -> None:
-        self._teams = teams
+    """standings pool (i.e. group), stored by column"""
+    def __init__(self,
+                 columns: List[StandingsColumn],
+                 cells: List[StandingsCells],
+                 teamIds: List[int]) -> None:
+        self._columns = columns
+        self._cells = cells
+        self._teamIds = array("q", teamIds)
+        self._rows = { teamId: row for row, teamId in enumerate(teamIds) if teamId }
+
+    @property
+    def columns(self) -> List[StandingsColumn]:
+        """the column schema"""
+        return self._columns
+
+    @property
+    def cells(self) -> List[StandingsCells]:
+        """the values of every column (same order as columns)"""
+        return self._cells
+
+    @property
+    def teamIds(self) -> Sequence[int]:
+        """team id of every row (0 if unknown)"""
+        return self._teamIds
 
     @property
     def teams(self) -> List[StandingsTeam]:
-        """all teams"""
-        return self._teams
+        """all teams (table order)"""
+        return [ StandingsTeam(self, row) for row in range(len(self)) ]
+
+    def column(self, key: str) -> Optional[StandingsCells]:
+        """the values of a column (by key, e.g. Sets.W, or label, e.g. Team)"""
+        for column, cells in zip(self._columns, self._cells):
+            if key in ( column.key, column.label ):
+                return cells
+        return None
+
+    def byTeamId(self, teamId: int) -> Optional[StandingsTeam]:
+        """the row of a team"""
+        row = self._rows.get(teamId)
+        return StandingsTeam(self, row) if row is not None else None
+
+    def sortedBy(self, *keys: str, descending: bool = True) -> List[StandingsTeam]:
+        """teams ordered by columns (e.g. points, then set ratio), ties keep the table order"""
+        columns = [ self.column(key) for key in keys ]
+        if None in columns:
+            raise KeyError(f"unknown column in {keys}")
+        rows = sorted(range(len(self)),
+                      key = lambda row: tuple(cells[row] for cells in columns), # type: ignore
+                      reverse = descending)
+        return [ StandingsTeam(self, row) for row in rows ]
+
+    def __len__(self) -> int:
+        return len(self._teamIds)
+
+    def patch(self, other: StandingsPool) -> None:
+        """takes over the table of other (a newer version of this pool)"""
+        # pylint: disable=protected-access
+        self._columns = other._columns
+        self._cells = other._cells
+        self._teamIds = other._teamIds
+        self._rows = other._rows
 
     @property
     def valid(self) -> bool:
         return True
 
     def __repr__(self) -> str:
-        return f"(cevlib.competitions.StandingsPool) {len(self.teams)} teams"
+        return f"(cevlib.competitions.StandingsPool) {len(self)} teams"
 
     def toJson(self) -> List[Dict[str, Any]]:
         return [ team.toJson() for team in self.teams ]
 
+    def toColumnsJson(self) -> Dict[str, Any]:
+        """compact form: the schema once, values by column"""
+        return {
+            "columns": [ column.toJson() for column in self._columns ],
+            "teamIds": list(self._teamIds),
+            "values": [ list(cells) for cells in self._cells ]
+        }
+
+
 class Standings(IType):
     """standings (e.g. score tables). consists of multiple standingsPools"""
     def __init__(self, table: Optional[Tag]) -> None:
         self._pools: List[StandingsPool] = [ ]
+        self._columns: List[StandingsColumn] = [ ]
         if not table:
             return
         head = table.find("thead")
@@ -135,27 +309,46 @@ class Standings(IType):
         rows = head.find_all("tr")
         if len(rows) < 2:
             return
-        headings1 = [ th.get_text(strip = True) for th in rows[0].find_all("th") ]
-        headings1 = [ heading for heading in headings1 if heading ]
-        headings1.insert(0, "")
-        self._headings = [ ]
-        headings1It = 0
+        groups = [ th.get_text(strip = True) for th in rows[0].find_all("th") ]
+        groups = [ group for group in groups if group ]
+        groups.insert(0, "")
+        headings: List[Tuple[str, str]] = [ ]
+        group = 0
         for th in rows[1].find_all("th"):
-            assert isinstance(th, Tag)
-            self._headings.append(f"{headings1[headings1It]}.{th.get_text(strip = True)}")
+            assert htmlParser.isTag(th)
+            headings.append((groups[min(group, len(groups) - 1)], th.get_text(strip = True)))
             if th.get("class") == ["u-pr-8"]:
-                headings1It += 1
-
-        if len(self._headings) == 0:
+                group += 1
+        if len(headings) == 0:
             return
+
+        # one pass over every pool's rows, then every column is typed once (over all pools)
+        pools: List[Tuple[List[List[str]], List[int]]] = [ ]
         for body in bodies:
-            teams: List[StandingsTeam] = [ ]
+            cells: List[List[str]] = [ [ ] for _ in headings ]
+            teamIds: List[int] = [ ]
             for row in body.find_all("tr"):
-                standing = { }
-                for i, text in enumerate(row.find_all("td")):
-                    standing[self._headings[i]] = text.get_text(strip = True)
-                teams.append(StandingsTeam(standing))
-            self._pools.append(StandingsPool(teams))
+                tds = row.find_all("td")
+                for i, column in enumerate(cells):
+                    column.append(tds[i].get_text(strip = True) if i < len(tds) else "")
+                link = row.find("a", href = _TEAM_LINK)
+                teamIds.append(int(_TEAM_LINK.search(link["href"]).group(1)) # type: ignore
+                               if link else 0)
+            pools.append((cells, teamIds))
+        self._columns = [ StandingsColumn(group_, label,
+                                          _columnKind([ cell for cells, _ in pools
+                                                        for cell in cells[i] ]))
+                          for i, (group_, label) in enumerate(headings) ]
+        self._pools = [ StandingsPool(self._columns,
+                                      [ _columnCells(column.kind, cells[i])
+                                        for i, column in enumerate(self._columns) ],
+                                      teamIds)
+                        for cells, teamIds in pools ]
+
+    @property
+    def columns(self) -> List[StandingsColumn]:
+        """the column schema (shared by all pools)"""
+        return self._columns
 
     @property
     def pools(self) -> List[StandingsPool]:
@@ -190,15 +383,15 @@ class Pool(IType):
         self._standings = standings
 
     def moveOrCreateDraw(self,
-                         anyDrawTeam: Team,
+                         anyDrawTeam: TeamRef,
                          newIndex: int,
                          competition: Optional[MatchCompetition]) -> None:
         """arranges the draw to match the right node. if the draw is not found, it is created"""
         if anyDrawTeam.name == "Bye":
             return
         oldIndex = -1
-        for i, _ in enumerate(self._draws):
-            if anyDrawTeam in self._draws[i].teams:
+        for i, draw in enumerate(self._draws):
+            if draw.hasTeam(anyDrawTeam):
                 oldIndex = i
                 break
 
@@ -229,6 +422,24 @@ class Pool(IType):
         """draws[index]"""
         return self.draws[index] if index < len(self.draws) else None
 
+    def patch(self, other: Pool) -> None:
+        """takes over the draws and standings of other, draws of the same teams are kept"""
+        previous = list(self._draws)
+        draws: List[Draw] = [ ]
+        for draw in other.draws:
+            for i, old in enumerate(previous):
+                if old.hasTeam(draw.firstTeam) and old.hasTeam(draw.secondTeam):
+                    old.patch(draw)
+                    draw = previous.pop(i)
+                    break
+            draws.append(draw)
+        self._draws[:] = draws
+        if self._standings is not None and other.standingsPool is not None:
+            self._standings.patch(other.standingsPool)
+        else:
+            self._standings = other.standingsPool
+        self._name = other.name
+
     @property
     def name(self) -> str:
         """pool name"""
@@ -269,6 +480,19 @@ class Round(IType):
         """pools[index]"""
         return self.pools[index] if index < len(self.pools) else None
 
+    def patch(self, other: Round) -> None:
+        """takes over the pools of other, pools of the same name are patched"""
+        previous = { pool.name: pool for pool in self._pools }
+        pools: List[Pool] = [ ]
+        for pool in other.pools:
+            old = previous.pop(pool.name, None)
+            if old is not None:
+                old.patch(pool)
+                pool = old
+            pools.append(pool)
+        self._pools[:] = pools
+        self._name = other.name
+
     @staticmethod
     def parsePool(pool: Dict[str, Any],
                   competition: CompetitionLink,
@@ -292,15 +516,13 @@ class Round(IType):
                     season = str(competition.age) if competition.age else None,
                     phase = pdex.ensure("Name", str),
                     matchNumber = mdex.ensure("MatchName", str)),
-                Team.build(mdex.ensure("HomeTeam", DictEx).ensure("Name", str),
+                TeamRef.canonical(mdex.ensure("HomeTeam", DictEx).ensure("Name", str),
                     mdex.ensure("HomeTeam", DictEx).ensure("Logo", DictEx).ensure("Name", str),
                     "N/A",
-                    True,
                     homeId),
-                Team.build(mdex.ensure("AwayTeam", DictEx).ensure("Name", str),
+                TeamRef.canonical(mdex.ensure("AwayTeam", DictEx).ensure("Name", str),
                     mdex.ensure("AwayTeam", DictEx).ensure("Logo", DictEx).ensure("Name", str),
                     "N/A",
-                    False,
                     awayId),
                 mdex.ensureString("Location"),
                 mdex.ensureString("MatchDateTime"),
@@ -330,10 +552,27 @@ class Round(IType):
         }
 
 
+RoundSource = Tuple[str, bytes] # score endpoint, digest of its last payload
+
+
+def _digest(body: bytes) -> bytes:
+    return hashlib.sha1(body).digest()
+
+
 class Competition(IType):
     """a single competition. consists of multiple rounds"""
-    def __init__(self, rounds: List[Round]) -> None:
+    # filled by the warm start cache (see cevlib.warmStart)
+    _competitionCache: Dict[str, Competition] = { }
+
+    def __init__(self,
+                 rounds: List[Round],
+                 url: Optional[str] = None,
+                 competition: Optional[CompetitionLink] = None,
+                 sources: Optional[List[RoundSource]] = None) -> None:
         self._rounds = rounds
+        self._url = url
+        self._competition = competition
+        self._sources = sources or [ ]
         self._rearrangeDraws()
 
     def _rearrangeDraws(self) -> None:
@@ -363,39 +602,115 @@ class Competition(IType):
                       for i, pool in enumerate(pools) ])
 
     @staticmethod
-    async def fromUrl(url: str) -> Competition:
-        """parse a competition from a url"""
-        html = ""
-        competition = (await Competitions.getAll()).getByLink(url)
-        assert competition
-        async with aiohttp.ClientSession() as client:
-            async with client.get(url) as resp:
-                html = await resp.text()
-        rounds = [ ]
-        soup = BeautifulSoup(html, "html.parser")
+    def _parsePage(html: str) -> List[Tuple[str, str, Standings]]:
+        """(name, score endpoint, standings) of every round"""
+        with metrics.measure("htmlParse", "Competition", len(html)):
+            soup = htmlParser.parse(html)
 
         roundNameLookup = [ comp.get_text(strip = True)
                             for comp in soup.find_all("li", class_="tabs-title") ]
 
+        rounds = [ ]
         #data-score-endpoint
         for i, comp in enumerate(soup.find_all("div", class_="competition-components-container")):
-            if not isinstance(comp, Tag):
+            if not htmlParser.isTag(comp):
                 continue
             linkDiv = comp.find("div", attrs = { "data-score-endpoint": True })
-            if not isinstance(linkDiv, Tag):
+            if not htmlParser.isTag(linkDiv):
                 continue # has no useful content
             tableDiv = comp.find("div", class_="pool-standings-table")
-            standings = Standings(tableDiv)
-            link = "https:" + linkDiv["data-score-endpoint"]
-            async with aiohttp.ClientSession() as client:
-                async with client.get(link) as resp:
-                    jdata = await resp.json(content_type=None)
-                    name = roundNameLookup[i] if i <= len(roundNameLookup) else "N/A"
-                    rounds.append(Competition._parseRound(name,
-                                                          jdata.get("Pools"),
-                                                          competition,
-                                                          standings))
-        return Competition(rounds)
+            name = roundNameLookup[i] if i < len(roundNameLookup) else "N/A"
+            rounds.append((name, "https:" + linkDiv["data-score-endpoint"], Standings(tableDiv)))
+        return rounds
+
+    @staticmethod
+    def _buildRound(jdata: Dict[str, Any],
+                    name: str,
+                    competition: CompetitionLink,
+                    standings: Standings) -> Round:
+        return Competition._parseRound(name, jdata.get("Pools") or [ ], competition, standings)
+
+    @staticmethod
+    async def fromUrl(url: str) -> Competition:
+        """parse a competition from a url"""
+        cached = Competition._competitionCache.get(url)
+        metrics.cacheLookup("competition", cached is not None)
+        if cached is not None:
+            return cached
+        return await Competition._fetch(url)
+
+    @staticmethod
+    async def _fetch(url: str) -> Competition:
+        competition = (await Competitions.getAll()).getByLink(url)
+        assert competition
+        html = (await transport.get(url)).text()
+        rounds = [ ]
+        sources = [ ]
+        for name, link, standings in await parsePool.parse(Competition._parsePage, html):
+            resp = await transport.get(link)
+            with metrics.measure("build", "Round"):
+                rounds.append(await parsePool.build(Competition._buildRound,
+                                                    resp,
+                                                    name,
+                                                    competition,
+                                                    standings))
+            sources.append((link, _digest(resp.body)))
+        return Competition(rounds, url, competition, sources)
+
+    async def refresh(self) -> Dict[str, List[Operation]]:
+        """
+        downloads the score endpoint of every round again and rebuilds the rounds whose
+        payload changed (their pools, draws and standings are patched in place).
+        returns the delta (see cevlib.helpers.jsonDelta) of every round that changed, by name
+        """
+        if self._url is None or self._competition is None:
+            return { } # not fetched by cevlib (e.g. built by hand)
+        responses = await asyncio.gather(*(transport.get(link) for link, _ in self._sources))
+        changed = { index: response
+                    for index, (response, (_, digest)) in enumerate(zip(responses, self._sources))
+                    if response.status == 200 and _digest(response.body) != digest }
+        if not changed:
+            return { }
+        # the standings are part of the page
+        html = (await transport.get(self._url)).text()
+        page = await parsePool.parse(Competition._parsePage, html)
+        if [ link for _, link, _ in page ] != [ link for link, _ in self._sources ]:
+            # rounds were added (or removed): everything is rebuilt
+            fresh = await Competition._fetch(self._url)
+            return self._patch(dict(enumerate(fresh.rounds)), fresh._sources) # pylint: disable=protected-access
+        rounds = { }
+        sources = list(self._sources)
+        for index, response in changed.items():
+            name, link, standings = page[index]
+            with metrics.measure("build", "Round"):
+                rounds[index] = await parsePool.build(Competition._buildRound,
+                                                      response,
+                                                      name,
+                                                      self._competition,
+                                                      standings)
+            sources[index] = (link, _digest(response.body))
+        return self._patch(rounds, sources)
+
+    def _patch(self, rounds: Dict[int, Round], sources: List[RoundSource]) -> Dict[str, List[Operation]]: # pylint: disable=line-too-long
+        # the draws of every earlier round may be rearranged by a rebuilt one
+        # (_rearrangeDraws cascades down to the first round), so all rounds are compared
+        before = [ round_.toJson() for round_ in self._rounds ]
+        removed = { round_.name: old for round_, old in zip(self._rounds[len(sources):],
+                                                             before[len(sources):]) }
+        for index, round_ in sorted(rounds.items()):
+            if index < len(self._rounds):
+                self._rounds[index].patch(round_)
+            else:
+                self._rounds.append(round_)
+        del self._rounds[len(sources):]
+        self._sources = sources
+        self._rearrangeDraws()
+        changes = { name: diff(old, None) for name, old in removed.items() }
+        for index, round_ in enumerate(self._rounds):
+            delta = diff(before[index] if index < len(before) else None, round_.toJson())
+            if delta:
+                changes[round_.name] = delta
+        return changes
 
     @property
     def rounds(self) -> List[Round]:
@@ -485,13 +800,19 @@ class Competitions(IType):
     _competitionsCache: List[CompetitionLink] = [ ]
 
     def __init__(self, html: str) -> None:
-        self._competitions: List[CompetitionLink] = [ ]
+        metrics.cacheLookup("competitions", len(Competitions._competitionsCache) > 0)
         if len(Competitions._competitionsCache) > 0:
             self._competitions = Competitions._competitionsCache
             return
-        soup = BeautifulSoup(html, "html.parser")
+        self._competitions = Competitions._parseLinks(html)
+
+    @staticmethod
+    def _parseLinks(html: str) -> List[CompetitionLink]:
+        competitions: List[CompetitionLink] = [ ]
+        with metrics.measure("htmlParse", "Competitions", len(html)):
+            soup = htmlParser.parse(html)
         for menuItem in soup.find_all("li", class_="c-nav__list__item"):
-            if not isinstance(menuItem, Tag):
+            if not htmlParser.isTag(menuItem):
                 continue
             menuTitleEl = menuItem.find("a", class_="menuItem")
             if not menuTitleEl:
@@ -499,10 +820,10 @@ class Competitions(IType):
             menuTitle = menuTitleEl.get_text(strip = True)
 
             for slab in menuItem.find_all("div", class_="menuSlab"):
-                if not isinstance(slab, Tag):
+                if not htmlParser.isTag(slab):
                     continue
                 for row in slab.find_all("div", class_="menuSlab__row"):
-                    if not isinstance(row, Tag):
+                    if not htmlParser.isTag(row):
                         continue
 
                     for rowItem in row.find_all("div"):
@@ -513,7 +834,7 @@ class Competitions(IType):
                         title = titleEl.get_text()
 
                         for item in rowItem.find_all("li"):
-                            if not isinstance(item, Tag):
+                            if not htmlParser.isTag(item):
                                 continue
                             atag = item.find("a")
                             if not atag:
@@ -534,17 +855,21 @@ class Competitions(IType):
                                     canAppend = False
                                     continue
                             if canAppend:
-                                self._competitions.append(CompetitionLink(menuTitle,
-                                                                          title,
-                                                                          itemTitle,
-                                                                          href))
+                                competitions.append(CompetitionLink(menuTitle,
+                                                                    title,
+                                                                    itemTitle,
+                                                                    href))
+        return competitions
 
     @staticmethod
     async def getAll() -> Competitions:
-        """get all competitions"""
-        async with aiohttp.ClientSession() as client:
-            async with client.get("https://www.cev.eu/") as resp:
-                return Competitions(await resp.text())
+        """
+        get all competitions (from the shared homepage snapshot, see cevlib.homepage).
+        the result is shared by all callers, don't modify it
+        """
+        if len(Competitions._competitionsCache) > 0:
+            return Competitions("") # warm start, the homepage isn't needed
+        return await (await Homepage.get()).derive(Competitions)
 
     @property
     def valid(self) -> bool:
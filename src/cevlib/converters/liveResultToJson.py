@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""cevlib"""
+__copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
+
+import json
+from typing import Any
+
+from cevlib.types.iType import JObject
+
+
+class LiveResultToJson:
+    """live result endpoint (GetLiveResultScoreByMatchId) to live scores endpoint data"""
+    @staticmethod
+    def convert(data: Any) -> JObject:
+        """convert (empty if data isn't the result of a match)"""
+        if isinstance(data, str): # some umbraco endpoints return their json as a string
+            data = json.loads(data)
+        if not isinstance(data, dict):
+            return { }
+        # same fields as a LiveScores match, the umbraco api capitalises them
+        match = LiveResultToJson._camelCase(data)
+        if not isinstance(match.get("homeSetsWon"), int) or \
+           not isinstance(match.get("awaySetsWon"), int):
+            return { }
+        return match # type: ignore
+
+    @staticmethod
+    def _camelCase(value: Any) -> Any:
+        if isinstance(value, dict):
+            return { key[:1].lower() + key[1:]: LiveResultToJson._camelCase(item)
+                     for key, item in value.items() }
+        if isinstance(value, list):
+            return [ LiveResultToJson._camelCase(item) for item in value ]
+        return value
@@ -4,3 +4,6 @@ __copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
 
 class NotInitialisedException(Exception):
     """module not initialised"""
+
+class NotRecordedException(Exception):
+    """response was not recorded (replay)"""
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""cevlib"""
+from __future__ import annotations
+__copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
+
+# streaming, columnar export (one file per table: matches, plays, playerStats, standings).
+#
+#   with Exporter("season", "parquet") as exporter:
+#       for url in urls:
+#           exporter.addMatch(await (await Match.byUrl(url)).cache())
+#
+# rows are buffered per table and written as one batch every batchSize rows, so memory
+# stays bounded however many matches are exported. parquet and arrow (ipc) need pyarrow,
+# csv and ndjson are always available ("auto": parquet if pyarrow is installed, else csv).
+
+from abc import ABC, abstractmethod
+import csv
+import os
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+from cevlib.helpers.jsonTool import dumps
+from cevlib.types.results import Result
+
+if TYPE_CHECKING:
+    from cevlib.calendar import CalendarMatch
+    from cevlib.competitions import Competition, Standings, StandingsPool
+    from cevlib.match import MatchCache
+    from cevlib.types.playByPlay import PlayByPlay
+    from cevlib.types.team import Team
+
+TRow = Tuple[Any, ...]
+TSchema = Tuple[Tuple[str, type], ...] # column name, python type (str, int or bool)
+
+SCHEMAS: Dict[str, TSchema] = {
+    "matches": (("matchCentreLink", str), ("competition", str), ("phase", str), ("season", str),
+                ("startTime", str), ("state", str), ("venue", str),
+                ("homeTeam", str), ("homeTeamId", int), ("awayTeam", str), ("awayTeamId", int),
+                ("homeScore", int), ("awayScore", int), ("sets", str)),
+    "plays": (("matchCentreLink", str), ("setNumber", int), ("index", int), ("type", str),
+              ("playerName", str), ("playerNumber", int), ("isHome", bool),
+              ("homeScore", int), ("awayScore", int)),
+    "playerStats": (("matchCentreLink", str), ("team", str), ("playerName", str),
+                    ("playerNumber", int), ("points", int), ("serves", int), ("spikes", int),
+                    ("blocks", int), ("receptions", int), ("spikePercentage", int),
+                    ("receptionPercentage", int)),
+    # standings columns differ by competition, hence one row per cell
+    "standings": (("source", str), ("pool", str), ("rank", int), ("column", str),
+                  ("value", str)),
+}
+
+FORMATS = ( "parquet", "arrow", "csv", "ndjson" )
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow # type: ignore # pylint: disable=import-outside-toplevel
+        return pyarrow
+    except ImportError:
+        return None
+
+
+class _TableWriter(ABC):
+    """writes the batches of one table to its file"""
+    def __init__(self, path: str, schema: TSchema) -> None:
+        self.path = path
+        self._schema = schema
+
+    @property
+    def columns(self) -> List[str]:
+        """column names"""
+        return [ name for name, _ in self._schema ]
+
+    @abstractmethod
+    def write(self, rows: List[TRow]) -> None:
+        """writes a batch"""
+
+    @abstractmethod
+    def close(self) -> None:
+        """finishes the file"""
+
+
+class _CsvWriter(_TableWriter):
+    def __init__(self, path: str, schema: TSchema) -> None:
+        super().__init__(path, schema)
+        self._file = open(path, "w", encoding = "utf-8", newline = "") # pylint: disable=consider-using-with
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.columns)
+
+    def write(self, rows: List[TRow]) -> None:
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _NdjsonWriter(_TableWriter):
+    def __init__(self, path: str, schema: TSchema) -> None:
+        super().__init__(path, schema)
+        self._file = open(path, "wb") # pylint: disable=consider-using-with
+
+    def write(self, rows: List[TRow]) -> None:
+        columns = self.columns
+        self._file.write(b"".join(dumps(dict(zip(columns, row))) + b"\n" for row in rows))
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ArrowWriter(_TableWriter):
+    def __init__(self, path: str, schema: TSchema, parquet: bool) -> None:
+        super().__init__(path, schema)
+        pa = _pyarrow()
+        types = { str: pa.string(), int: pa.int64(), bool: pa.bool_() }
+        self._arrowSchema = pa.schema([ (name, types[type_]) for name, type_ in schema ])
+        if parquet:
+            import pyarrow.parquet # type: ignore # pylint: disable=import-outside-toplevel,import-error
+            self._writer = pyarrow.parquet.ParquetWriter(path, self._arrowSchema)
+        else:
+            self._writer = pa.ipc.new_file(path, self._arrowSchema)
+        self._pa = pa
+
+    def write(self, rows: List[TRow]) -> None:
+        columns = [ list(column) for column in zip(*rows) ]
+        batch = self._pa.RecordBatch.from_arrays([ self._pa.array(column, type = field.type)
+                                                   for column, field
+                                                   in zip(columns, self._arrowSchema) ],
+                                                 schema = self._arrowSchema)
+        if hasattr(self._writer, "write_batch"):
+            self._writer.write_batch(batch)
+        else:
+            self._writer.write_table(self._pa.Table.from_batches([ batch ]))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def _sets(result: Result) -> str:
+    return ",".join(f"{set_.homeScore}-{set_.awayScore}" for set_ in result.sets)
+
+
+class Exporter:
+    """writes matches, plays, player stats and standings to directory (see FORMATS)"""
+    def __init__(self, directory: str, fileFormat: str = "auto", batchSize: int = 10000) -> None:
+        if fileFormat == "auto":
+            fileFormat = "parquet" if _pyarrow() is not None else "csv"
+        if fileFormat not in FORMATS:
+            raise ValueError(f"unknown format '{fileFormat}' (one of {', '.join(FORMATS)})")
+        if fileFormat in ( "parquet", "arrow" ) and _pyarrow() is None:
+            raise ImportError(f"the {fileFormat} format needs pyarrow (pip install pyarrow)")
+        os.makedirs(directory, exist_ok = True)
+        self._directory = directory
+        self._format = fileFormat
+        self._batchSize = batchSize
+        self._buffers: Dict[str, List[TRow]] = { table: [ ] for table in SCHEMAS }
+        self._writers: Dict[str, _TableWriter] = { }
+        self._rows: Dict[str, int] = { table: 0 for table in SCHEMAS }
+
+    @property
+    def format(self) -> str:
+        """the format files are written in"""
+        return self._format
+
+    @property
+    def rows(self) -> Dict[str, int]:
+        """rows added per table"""
+        return dict(self._rows)
+
+    def path(self, table: str) -> str:
+        """file of a table"""
+        return os.path.join(self._directory, f"{table}.{self._format}")
+
+    def _writer(self, table: str) -> _TableWriter:
+        writer = self._writers.get(table)
+        if writer is None:
+            path, schema = self.path(table), SCHEMAS[table]
+            if self._format == "csv":
+                writer = _CsvWriter(path, schema)
+            elif self._format == "ndjson":
+                writer = _NdjsonWriter(path, schema)
+            else:
+                writer = _ArrowWriter(path, schema, self._format == "parquet")
+            self._writers[table] = writer
+        return writer
+
+    def _append(self, table: str, rows: Sequence[TRow]) -> None:
+        buffer = self._buffers[table]
+        buffer.extend(rows)
+        self._rows[table] += len(rows)
+        if len(buffer) >= self._batchSize:
+            self._flushTable(table)
+
+    def _flushTable(self, table: str) -> None:
+        buffer = self._buffers[table]
+        if buffer:
+            self._writer(table).write(buffer)
+            self._buffers[table] = [ ]
+
+    def flush(self) -> None:
+        """writes all buffered rows"""
+        for table in SCHEMAS:
+            self._flushTable(table)
+
+    def addMatch(self, match: Union[CalendarMatch, MatchCache]) -> None:
+        """a match row (a MatchCache adds its plays and player stats as well)"""
+        from cevlib.match import MatchCache # pylint: disable=import-outside-toplevel,redefined-outer-name
+        link = match.matchCentreLink or ""
+        competition = match.competition
+        self._append("matches", [ (link,
+                                   competition.name if competition else "",
+                                   competition.phase if competition else "",
+                                   competition.season if competition else "",
+                                   match.startTime.isoformat(sep = " "),
+                                   match.state.value,
+                                   match.venue,
+                                   match.homeTeam.name or "",
+                                   match.homeTeam.id,
+                                   match.awayTeam.name or "",
+                                   match.awayTeam.id,
+                                   match.result.homeScore,
+                                   match.result.awayScore,
+                                   _sets(match.result)) ])
+        if isinstance(match, MatchCache):
+            if match.playByPlay:
+                self.addPlayByPlay(link, match.playByPlay)
+            self.addPlayerStats(link, match.homeTeam)
+            self.addPlayerStats(link, match.awayTeam)
+
+    def addPlayByPlay(self, matchCentreLink: str, playByPlay: PlayByPlay) -> None:
+        """a row per play"""
+        self._append("plays", [ (matchCentreLink, set_.setNumber, index, play.type.value,
+                                 play.playerName, play.playerNumber, play.isHome,
+                                 play.currentScore.homeScore, play.currentScore.awayScore)
+                                for set_ in playByPlay.sets
+                                for index, play in enumerate(set_.plays) ])
+
+    def addPlayerStats(self, matchCentreLink: str, team: Team) -> None:
+        """a row per player (with stats) of a team"""
+        self._append("playerStats", [ (matchCentreLink, team.name or "", player.name,
+                                       player.number, player.stats.points, player.stats.serves,
+                                       player.stats.spikes, player.stats.blocks,
+                                       player.stats.receptions, player.stats.spikePercentage,
+                                       player.stats.receptionPercentage)
+                                      for player in team.players if player.stats is not None ])
+
+    def _addStandingsPool(self, source: str, poolName: str, pool: StandingsPool) -> None:
+        self._append("standings", [ (source, poolName, rank + 1, column, str(value))
+                                    for rank, team in enumerate(pool.teams)
+                                    for column, value in team.team.items() ])
+
+    def addStandings(self, source: str, standings: Union[Standings, StandingsPool]) -> None:
+        """a row per standings cell (source: e.g. the competition, pools by index)"""
+        from cevlib.competitions import Standings # pylint: disable=import-outside-toplevel,redefined-outer-name
+        pools = standings.pools if isinstance(standings, Standings) else [ standings ]
+        for index, pool in enumerate(pools):
+            self._addStandingsPool(source, str(index), pool)
+
+    def addCompetition(self, competition: Competition, source: str = "") -> None:
+        """every match and standings table of a competition (standings source: source + round)"""
+        for round_ in competition.rounds:
+            for pool in round_.pools:
+                for draw in pool.draws:
+                    for match in draw.matches:
+                        if match.matchCentreLink:
+                            self.addMatch(match)
+                if pool.standingsPool:
+                    self._addStandingsPool(f"{source}{round_.name}", pool.name, pool.standingsPool)
+
+    def close(self) -> None:
+        """writes the remaining rows and finishes every file"""
+        self.flush()
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+
+    def __enter__(self) -> Exporter:
+        return self
+
+    def __exit__(self,
+                 excType: Optional[Type[BaseException]],
+                 exc: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"(cevlib.export.Exporter) {self._directory} ({self._format}) {self._rows}"
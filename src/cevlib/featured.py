@@ -3,30 +3,38 @@
 from __future__ import annotations
 __copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
 
+import asyncio
+from typing import List, Optional, Tuple
 
-from typing import List
-import re
-
-import aiohttp
+from cevlib.competitions import Competitions
+from cevlib.helpers.linkScanner import scanHomepage
+from cevlib.homepage import Homepage
 
 from cevlib.types.iType import IType, JObject
 
 
 class Featured(IType):
     """featured news, images, ..."""
-    def __init__(self) -> None:
-        self._gallery: List[str] = [ ]
-        self._videos: List[str] = [ ]
+    def __init__(self,
+                 gallery: Optional[List[str]] = None,
+                 videos: Optional[List[str]] = None) -> None:
+        self._gallery: List[str] = gallery or [ ]
+        self._videos: List[str] = videos or [ ]
+
+    @staticmethod
+    def fromHtml(html: str) -> Featured:
+        """parse from the homepage"""
+        links = scanHomepage(html)
+        return Featured([ f"https://www.cev.eu{link}" for link in links.media ],
+                        [ f"https://{link.replace('/embed/', '/v/').split('?')[0]}"
+                          for link in links.videos ])
 
     async def init(self) -> None:
-        """init"""
-        async with aiohttp.ClientSession() as client:
-            async with client.get("https://www.cev.eu/") as resp:
-                html = await resp.text()
-        self._gallery = [ f"https://www.cev.eu{match[0]}"
-                          for match in re.finditer(r"(\/media\/[\w .,@;?^=%&:\/~+#-]*[\w@?^=%&\/~+#-]).(jpg|JPG)", html) ] # pylint: disable=line-too-long
-        self._videos = [ f"https://{match[0].replace('/embed/', '/v/').split('?')[0]}"
-                         for match in re.finditer(r"([\w_-]+(?:(?:\.[\w_-]+)+))([\w.,@;?^=%&:\/~+#-]*\/embed\/[\w .,@;?^=%&:\/~+#-]*[\w@?^=%&\/~+#-])", html) ] # pylint: disable=line-too-long
+        """init (from the shared homepage snapshot, see cevlib.homepage)"""
+        featured = await (await Homepage.get()).derive(Featured.fromHtml)
+        # copies, the derived Featured is shared
+        self._gallery = list(featured.gallery)
+        self._videos = list(featured.videos)
 
     @property
     def gallery(self) -> List[str]:
@@ -47,3 +55,14 @@ class Featured(IType):
     @property
     def valid(self) -> bool:
         return True
+
+
+async def landingPage() -> Tuple[Featured, Competitions]:
+    """
+    featured content and competitions (of the same homepage snapshot).
+    both are shared by all callers until the snapshot expires, don't modify them
+    """
+    homepage = await Homepage.get()
+    featured, competitions = await asyncio.gather(homepage.derive(Featured.fromHtml),
+                                                  homepage.derive(Competitions))
+    return featured, competitions
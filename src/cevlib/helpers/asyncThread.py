@@ -2,10 +2,10 @@
 """cevlib"""
 __copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
 
-from typing import Any, Callable, Optional, TypeVar, cast, Iterable
+from typing import Any, Callable, Optional, TypeVar, Iterable
+from contextvars import copy_context
 from threading import Thread
 import asyncio
-from queue import Queue
 
 T = TypeVar("T")
 
@@ -24,14 +24,9 @@ async def asyncRunInThreadWithReturn(target: Callable[[Any], T],
     runs the callable in a thread while providing an async interface for it
     (allows return value)
     """
-    queue: Queue[Any] = Queue()
-
-    def _implement() -> None:
-        ret = target(*args) if args else target() # type: ignore
-        queue.put_nowait(ret)
-
-    thread = Thread(target = _implement)
-    thread.start()
-    while thread.is_alive():
-        await asyncio.sleep(1)
-    return cast(T, queue.get_nowait())
+    # resolves as soon as the thread is done (instead of polling it every second).
+    # the context is copied so the thread reports to the caller's metrics trace
+    return await asyncio.get_running_loop().run_in_executor(None,
+                                                            copy_context().run, # type: ignore
+                                                            target,
+                                                            *args)
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""cevlib"""
+__copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
+
+# BeautifulSoup is only imported once the first document is parsed,
+# importing cevlib (e.g. only for the calendar) doesn't pay for it.
+
+from typing import Any
+
+
+def parse(html: str) -> Any:
+    """the parsed document (BeautifulSoup, html.parser)"""
+    from bs4 import BeautifulSoup # pylint: disable=import-outside-toplevel
+    return BeautifulSoup(html, "html.parser")
+
+def isTag(value: Any) -> bool:
+    """whether value is an element (a bs4 Tag)"""
+    from bs4.element import Tag # pylint: disable=import-outside-toplevel
+    return isinstance(value, Tag)
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""cevlib"""
+__copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
+
+# structural deltas between two json trees.
+# a delta is a list of json patch operations (rfc 6902, add / remove / replace only),
+# so consumers may apply it with any json patch implementation as well.
+
+from copy import deepcopy
+from typing import Any, Dict, List
+
+Operation = Dict[str, Any]
+
+
+def _escape(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _diff(old: Any, new: Any, path: str, operations: List[Operation]) -> None:
+    # old == new isn't enough: it's True for 1 and True (or 1.0) nested anywhere below
+    if old is new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, value in new.items():
+            if key in old:
+                _diff(old[key], value, f"{path}/{_escape(key)}", operations)
+            else:
+                operations.append({ "op": "add", "path": f"{path}/{_escape(key)}", "value": value })
+        for key in old:
+            if key not in new:
+                operations.append({ "op": "remove", "path": f"{path}/{_escape(key)}" })
+        return
+    if isinstance(old, list) and isinstance(new, list):
+        common = min(len(old), len(new))
+        for index in range(common):
+            _diff(old[index], new[index], f"{path}/{index}", operations)
+        # play by play and galleries usually only grow
+        for value in new[common:]:
+            operations.append({ "op": "add", "path": f"{path}/-", "value": value })
+        for index in range(len(old) - 1, common - 1, -1):
+            operations.append({ "op": "remove", "path": f"{path}/{index}" })
+        return
+    # True == 1 == 1.0, but they are serialised differently
+    if type(old) is not type(new) or old != new:
+        operations.append({ "op": "replace", "path": path, "value": new })
+
+
+def diff(old: Any, new: Any) -> List[Operation]:
+    """the operations that turn old into new (empty if both are equal)"""
+    operations: List[Operation] = [ ]
+    _diff(old, new, "", operations)
+    return operations
+
+
+def _split(path: str) -> List[str]:
+    if not path:
+        return [ ]
+    if not path.startswith("/"):
+        raise ValueError(f"invalid json pointer '{path}'")
+    return [ _unescape(token) for token in path[1:].split("/") ]
+
+def patch(tree: Any, delta: List[Operation]) -> Any:
+    """applies a delta (see diff) to a copy of tree"""
+    tree = deepcopy(tree)
+    for operation in delta:
+        tokens = _split(operation["path"])
+        if not tokens:
+            tree = deepcopy(operation.get("value"))
+            continue
+        parent = tree
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+        op = operation["op"]
+        if isinstance(parent, list):
+            if op == "add":
+                value = deepcopy(operation["value"])
+                if last == "-":
+                    parent.append(value)
+                else:
+                    parent.insert(int(last), value)
+            elif op == "remove":
+                del parent[int(last)]
+            else:
+                parent[int(last)] = deepcopy(operation["value"])
+        elif op == "remove":
+            del parent[last]
+        else:
+            parent[last] = deepcopy(operation["value"])
+    return tree
+
+
+def sections(delta: List[Operation]) -> List[str]:
+    """the top level keys a delta touches (in order of appearance)"""
+    keys: List[str] = [ ]
+    for operation in delta:
+        tokens = _split(operation["path"])
+        if tokens and tokens[0] not in keys:
+            keys.append(tokens[0])
+    return keys
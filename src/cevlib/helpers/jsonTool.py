@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""cevlib"""
+__copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
+
+import json
+from typing import Any, Iterable, Tuple
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError: # pragma: no cover
+    _HAS_ORJSON = False
+
+
+def dumps(data: Any) -> bytes:
+    """serialises a json tree to compact utf-8 bytes (orjson if available)"""
+    if _HAS_ORJSON:
+        return orjson.dumps(data) # pylint: disable=no-member
+    return json.dumps(data, ensure_ascii = False, separators = (",", ":")).encode("utf-8")
+
+def dumpsObject(fields: Iterable[Tuple[str, bytes]]) -> bytes:
+    """joins already serialised values to a json object"""
+    return b"{" + b",".join(dumps(key) + b":" + value for key, value in fields) + b"}"
+
+def dumpsArray(values: Iterable[bytes]) -> bytes:
+    """joins already serialised values to a json array"""
+    return b"[" + b",".join(values) + b"]"
+
+def dumpsOptional(value: Any) -> bytes:
+    """serialises an optional IType (None -> null)"""
+    if not value:
+        return b"null"
+    return value.toJsonBytes() # type: ignore
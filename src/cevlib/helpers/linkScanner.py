@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""cevlib"""
+from __future__ import annotations
+__copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
+
+import re
+from typing import Iterator, List, NamedTuple, Pattern, Tuple
+
+# every link pattern only consists of "url characters" (plus spaces after the anchor),
+# so a match never leaves the run of url characters around its anchor (e.g. "umbraco").
+# instead of letting the (backtracking) patterns try every offset of a page,
+# the anchors are located with str.find and the patterns only run on those runs.
+
+_URL = r"\w.,@;?^=%&:\/~+#-"
+_URL_RUN = re.compile(f"[{_URL}]*")
+_URL_SPACE_RUN = re.compile(f"[ {_URL}]*")
+
+UMBRACO = re.compile(r"([\w_-]+(?:(?:\.[\w_-]+)+))([\w.,@;?^=%&:\/~+#-]*umbraco[\w.,@;?^=%&:\/~+#-]*[\w@?^=%&\/~+#-])") # pylint: disable=line-too-long
+PHOTO = re.compile(r"([\w_-]+(?:(?:\.[\w_-]+)+))([\w.,@;?^=%&:\/~+#-]*Upload\/Photo\/[\w .,@;?^=%&:\/~+#-]*[\w@?^=%&\/~+#-]).(jpg|JPG)") # pylint: disable=line-too-long
+EMBED = re.compile(r"([\w_-]+(?:(?:\.[\w_-]+)+))([\w.,@;?^=%&:\/~+#-]*\/embed\/[\w .,@;?^=%&:\/~+#-]*[\w@?^=%&\/~+#-])") # pylint: disable=line-too-long
+MEDIA = re.compile(r"(\/media\/[\w .,@;?^=%&:\/~+#-]*[\w@?^=%&\/~+#-]).(jpg|JPG)")
+
+
+class _Scanner(NamedTuple):
+    anchor: str
+    pattern: Pattern[str]
+    run: Pattern[str]
+    suffix: int # characters a match may extend past the run (".jpg")
+
+
+_UMBRACO = _Scanner("umbraco", UMBRACO, _URL_RUN, 0)
+_PHOTO = _Scanner("Upload/Photo/", PHOTO, _URL_SPACE_RUN, 4)
+_EMBED = _Scanner("/embed/", EMBED, _URL_SPACE_RUN, 0)
+_MEDIA = _Scanner("/media/", MEDIA, _URL_SPACE_RUN, 4)
+
+
+class MatchCentreLinks(NamedTuple):
+    """all links of a match centre page"""
+    umbraco: List[str]
+    gallery: List[str]
+    videos: List[str]
+
+
+class HomepageLinks(NamedTuple):
+    """all links of the homepage"""
+    media: List[str]
+    videos: List[str]
+
+
+class _Page:
+    def __init__(self, html: str) -> None:
+        self._html = html
+        self._reversed = ""
+
+    def _runStart(self, position: int, run: Pattern[str]) -> int:
+        # runs are expanded to the left by matching the reversed page
+        if not self._reversed:
+            self._reversed = self._html[::-1]
+        offset = len(self._html) - position
+        return position - (run.match(self._reversed, offset).end() - offset) # type: ignore
+
+    def _windows(self, scanner: _Scanner) -> Iterator[Tuple[int, int]]:
+        html = self._html
+        start = runEnd = end = -1
+        position = html.find(scanner.anchor)
+        while position >= 0:
+            runStart = self._runStart(position, scanner.run)
+            if runStart >= end:
+                if end >= 0:
+                    yield start, end
+                start = runStart
+            # overlapping windows (a suffix reaching into the next run) are merged
+            runEnd = scanner.run.match(html, position).end() # type: ignore
+            end = runEnd + scanner.suffix
+            position = html.find(scanner.anchor, runEnd)
+        if end >= 0:
+            yield start, end
+
+    def findAll(self, scanner: _Scanner) -> List[str]:
+        """same as [ m[0] for m in scanner.pattern.finditer(html) ]"""
+        return [ match[0]
+                 for start, end in self._windows(scanner)
+                 for match in scanner.pattern.finditer(self._html, start, end) ]
+
+
+def scanMatchCentre(html: str) -> MatchCentreLinks:
+    """extracts umbraco endpoints, photos and embedded videos of a match centre page"""
+    page = _Page(html)
+    return MatchCentreLinks(page.findAll(_UMBRACO), page.findAll(_PHOTO), page.findAll(_EMBED))
+
+
+def scanHomepage(html: str) -> HomepageLinks:
+    """extracts media (photos) and embedded videos of the homepage"""
+    page = _Page(html)
+    return HomepageLinks(page.findAll(_MEDIA), page.findAll(_EMBED))
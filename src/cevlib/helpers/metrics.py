@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""cevlib"""
+from __future__ import annotations
+__copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+import re
+from threading import Lock
+from time import perf_counter
+from types import TracebackType
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Type
+from urllib.parse import urlsplit
+
+# instrumentation of the hot paths (requests, json decoding, html parsing, model building).
+# nothing is measured unless a hook is registered: every instrumented spot first checks
+# enabled() (one list check) and then takes its uninstrumented path.
+
+
+class Event(NamedTuple):
+    """a measured operation"""
+    kind: str # request, jsonDecode, htmlParse, build, cache or trace
+    name: str # endpoint, model or cache name
+    duration: float # seconds
+    size: int = 0 # bytes
+    hit: Optional[bool] = None # cache events only
+    children: Tuple[Event, ...] = ( ) # trace events only
+
+    def toJson(self) -> Dict[str, Any]:
+        """event (and children) as json tree"""
+        return {
+            "kind": self.kind,
+            "name": self.name,
+            "duration": self.duration,
+            "size": self.size,
+            "hit": self.hit,
+            "children": [ child.toJson() for child in self.children ]
+        }
+
+
+Hook = Callable[[Event], None]
+
+_hooks: List[Hook] = [ ]
+_trace: ContextVar[Optional[List[Event]]] = ContextVar("cevlib.metrics.trace", default = None)
+
+
+def addHook(hook: Hook) -> None:
+    """calls hook for every event from now on"""
+    _hooks.append(hook)
+
+def removeHook(hook: Hook) -> None:
+    """stops calling hook"""
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+def enabled() -> bool:
+    """whether any hook is registered"""
+    return bool(_hooks)
+
+def emit(event: Event) -> None:
+    """passes an event to the current trace and all hooks"""
+    events = _trace.get()
+    if events is not None:
+        events.append(event)
+    for hook in list(_hooks):
+        hook(event)
+
+def cacheLookup(name: str, hit: bool) -> None:
+    """records a cache hit (or miss)"""
+    if _hooks:
+        emit(Event("cache", name, 0.0, hit = hit))
+
+
+class _Measurement:
+    __slots__ = ("_kind", "_name", "_size", "_start")
+
+    def __init__(self, kind: str, name: str, size: int) -> None:
+        self._kind = kind
+        self._name = name
+        self._size = size
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = perf_counter()
+
+    def __exit__(self,
+                 excType: Optional[Type[BaseException]],
+                 exc: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        emit(Event(self._kind, self._name, perf_counter() - self._start, self._size))
+
+
+class _Disabled:
+    __slots__ = ( )
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self,
+                 excType: Optional[Type[BaseException]],
+                 exc: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        pass
+
+
+_DISABLED = _Disabled()
+
+
+def measure(kind: str, name: str, size: int = 0) -> _Measurement | _Disabled:
+    """times a with block (e.g. with measure("htmlParse", "Info", len(html)): ...)"""
+    if not _hooks:
+        return _DISABLED
+    return _Measurement(kind, name, size)
+
+
+@contextmanager
+def trace(name: str) -> Iterator[List[Event]]:
+    """
+    collects all events of a with block (including tasks started in it) and
+    emits them as one "trace" event once the block is left
+    """
+    if not _hooks:
+        yield [ ]
+        return
+    events: List[Event] = [ ]
+    token = _trace.set(events)
+    start = perf_counter()
+    try:
+        yield events
+    finally:
+        _trace.reset(token)
+        emit(Event("trace",
+                   name,
+                   perf_counter() - start,
+                   sum(event.size for event in events if event.kind == "request"),
+                   children = tuple(events)))
+
+
+def endpointName(url: str) -> str:
+    """a short (low cardinality) name for a requested url"""
+    parts = urlsplit(url)
+    if "/umbraco/api/" in parts.path.lower():
+        return parts.path.rstrip("/").rsplit("/", 1)[-1]
+    if parts.path.endswith(".json"):
+        return parts.path.rsplit("/", 1)[-1][:-len(".json")]
+    if parts.path in ("", "/"):
+        return "homepage"
+    if "/match-centres/" in parts.path:
+        return "matchCentre"
+    if parts.path.lower().endswith((".jpg", ".jpeg", ".png", ".gif", ".webp")):
+        return "media"
+    return "page"
+
+
+def _snakeCase(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+class PrometheusCollector:
+    """
+    hook that aggregates events to prometheus style counters and summaries
+    (use addHook(collector), expose() returns the text exposition format)
+    """
+    def __init__(self, prefix: str = "cevlib") -> None:
+        self._prefix = prefix
+        self._lock = Lock()
+        self._counters: Dict[Tuple[str, str, str], float] = { }
+
+    def _add(self, metric: str, label: str, value: str, amount: float) -> None:
+        key = (metric, label, value)
+        self._counters[key] = self._counters.get(key, 0.0) + amount
+
+    def __call__(self, event: Event) -> None:
+        with self._lock:
+            if event.kind == "cache":
+                self._add("cache_hits_total" if event.hit else "cache_misses_total",
+                          "cache", event.name, 1)
+                return
+            label = "endpoint" if event.kind in ("request", "jsonDecode") else "name"
+            kind = _snakeCase(event.kind)
+            self._add(f"{kind}_seconds_sum", label, event.name, event.duration)
+            self._add(f"{kind}_seconds_count", label, event.name, 1)
+            if event.size:
+                self._add(f"{kind}_bytes_total", label, event.name, event.size)
+
+    def value(self, metric: str, name: Optional[str] = None) -> float:
+        """current value of a metric (e.g. value("request_seconds_count", "LiveScores"))"""
+        with self._lock:
+            return sum(amount for (key, _, value), amount in self._counters.items()
+                       if key == metric and name in (None, value))
+
+    def expose(self) -> str:
+        """all metrics in the prometheus text exposition format"""
+        with self._lock:
+            lines = [ f"{self._prefix}_{metric}{{{label}=\"{value}\"}} {amount:g}"
+                      for (metric, label, value), amount in sorted(self._counters.items()) ]
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """drops all values"""
+        with self._lock:
+            self._counters.clear()
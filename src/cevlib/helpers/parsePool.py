@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""cevlib"""
+from __future__ import annotations
+__copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
+
+# opt-in process pool for parsing (e.g. season backfills).
+# payloads are still downloaded on the event loop, only the raw html/json is shipped to
+# the workers, which return the finished (pickled) models.
+# worker processes have no metrics hooks, the parent reports a "processParse" event instead.
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+
+from cevlib.helpers import metrics
+from cevlib.helpers.asyncThread import asyncRunInThreadWithReturn
+from cevlib.helpers.transport import Response
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+T = TypeVar("T")
+
+_pool: Optional[ProcessPoolExecutor] = None # pylint: disable=invalid-name
+
+
+def enable(workers: Optional[int] = None) -> None:
+    """parses in worker processes from now on (workers defaults to the cpu count)"""
+    global _pool # pylint: disable=global-statement
+    from concurrent.futures import ProcessPoolExecutor # pylint: disable=import-outside-toplevel,redefined-outer-name
+    disable()
+    _pool = ProcessPoolExecutor(workers)
+
+def disable() -> None:
+    """parses in this process again (shuts the workers down)"""
+    global _pool # pylint: disable=global-statement
+    if _pool is not None:
+        _pool.shutdown(wait = False, cancel_futures = True)
+    _pool = None
+
+def enabled() -> bool:
+    """whether worker processes are used"""
+    return _pool is not None
+
+
+def _name(target: Callable[..., Any]) -> str:
+    return getattr(target, "__name__", "parse")
+
+async def parse(target: Callable[..., T], *args: Any) -> T:
+    """
+    runs a cpu bound parser (e.g. MatchReport(html)) off the event loop:
+    in a worker process if enabled, otherwise in a thread
+    """
+    if _pool is None:
+        return await asyncRunInThreadWithReturn(target, *args)
+    with metrics.measure("processParse", _name(target)):
+        return await asyncio.get_running_loop().run_in_executor(_pool, target, *args)
+
+
+def _decodeAndBuild(target: Callable[..., T],
+                    url: str,
+                    body: bytes,
+                    encoding: str,
+                    *args: Any) -> T:
+    return target(Response(url, 200, body, encoding).json(), *args)
+
+async def build(target: Callable[..., T], response: Response, *args: Any) -> T:
+    """
+    builds a model from a json response (target(json, *args)):
+    in a worker process if enabled (decoding included), otherwise right away
+    """
+    if _pool is None:
+        return target(response.json(), *args)
+    with metrics.measure("processParse", _name(target), len(response.body)):
+        return await asyncio.get_running_loop().run_in_executor(_pool,
+                                                                _decodeAndBuild,
+                                                                target,
+                                                                response.url,
+                                                                response.body,
+                                                                response.encoding,
+                                                                *args)
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""cevlib"""
+from __future__ import annotations
+__copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
+
+import asyncio
+from datetime import datetime
+import heapq
+from itertools import count
+from typing import Awaitable, Callable, List, NamedTuple, Optional, Set, Tuple
+
+from cevlib.types.types import MatchState
+
+
+class PollResult(NamedTuple):
+    """what a poll found out about its match"""
+    state: MatchState
+    startTime: datetime # utc
+    inPlay: bool # a set is being played (False during breaks between sets)
+    changed: bool # the score changed since the previous poll
+
+
+TPoll = Callable[[], Awaitable[PollResult]]
+
+
+class PollPolicy:
+    """
+    polling intervals (seconds) by match state.
+    upcoming matches are polled rarely until nearStart seconds before their start,
+    live matches every live seconds (backing off up to liveBreak between sets),
+    finished matches are polled once more to confirm the final result
+    """
+    def __init__(self,
+                 live: float = 10,
+                 liveBreak: float = 60,
+                 upcoming: float = 900,
+                 nearStart: float = 600,
+                 backoff: float = 2) -> None:
+        self.live = live
+        self.liveBreak = liveBreak
+        self.upcoming = upcoming
+        self.nearStart = nearStart
+        self.backoff = backoff
+
+    def nextInterval(self,
+                     result: PollResult,
+                     previousInterval: float,
+                     confirmed: bool) -> Optional[float]:
+        """seconds until the next poll (None: don't poll anymore)"""
+        if result.state == MatchState.Finished:
+            return None if confirmed and not result.changed else self.live
+        if result.state == MatchState.Upcoming:
+            untilStart = (result.startTime - datetime.utcnow()).total_seconds()
+            if untilStart <= self.nearStart:
+                return self.live
+            # wakes up right when the match is near its start
+            return min(self.upcoming, untilStart - self.nearStart)
+        if result.inPlay or result.changed:
+            return self.live
+        return min(max(previousInterval, self.live) * self.backoff, self.liveBreak)
+
+
+# live matches are polled before upcoming ones when the budget is exhausted
+_PRIORITY = { MatchState.Live: 0, MatchState.Unknown: 1, MatchState.Finished: 1,
+              MatchState.Upcoming: 2 }
+
+
+class PollJob:
+    """a registered poll (see PollScheduler.add)"""
+    def __init__(self, poll: TPoll, policy: PollPolicy) -> None:
+        self.poll = poll
+        self.policy = policy
+        self.interval = 0.0
+        self.state = MatchState.Unknown
+        self.confirmed = False # finished and polled once more
+        self.active = True
+
+    @property
+    def priority(self) -> int:
+        """lower first"""
+        return _PRIORITY[self.state]
+
+
+class PollScheduler:
+    """
+    runs all polls from a single loop, each one at the interval its policy
+    derives from the last result. budget limits the polls per minute of all jobs
+    (it counts polls, not requests: a poll may request more than one endpoint)
+    """
+    def __init__(self, budget: Optional[float] = None) -> None:
+        self._budget = budget
+        self._nextSlot = 0.0
+        self._queue: List[Tuple[float, int, PollJob]] = [ ]
+        self._sequence = count()
+        self._wakeUp: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._polling: Set[asyncio.Task[None]] = set()
+
+    @property
+    def budget(self) -> Optional[float]:
+        """maximum polls per minute, polls are spaced 60 / budget seconds apart (None: unlimited)"""
+        return self._budget
+
+    @budget.setter
+    def budget(self, value: Optional[float]) -> None:
+        self._budget = value
+
+    @property
+    def jobs(self) -> List[PollJob]:
+        """all waiting jobs (the ones being polled right now aren't included)"""
+        return [ job for _, _, job in self._queue if job.active ]
+
+    def add(self, poll: TPoll, policy: Optional[PollPolicy] = None) -> PollJob:
+        """polls from now on (right away, then by policy)"""
+        job = PollJob(poll, policy or PollPolicy())
+        self._push(asyncio.get_running_loop().time(), job)
+        return job
+
+    def remove(self, job: PollJob) -> None:
+        """stops polling"""
+        job.active = False
+        self._queue = [ entry for entry in self._queue if entry[2] is not job ]
+        heapq.heapify(self._queue)
+
+    def _push(self, due: float, job: PollJob) -> None:
+        heapq.heappush(self._queue, (due, next(self._sequence), job))
+        if self._wakeUp:
+            self._wakeUp.set()
+        if self._task is None or self._task.done():
+            # the loop ends once no job is left and is restarted by the next one
+            self._task = asyncio.create_task(self._run())
+
+    def _takeSlot(self, now: float) -> float:
+        """0 if a poll may start now, otherwise the seconds until one may"""
+        # polls are spread evenly (60 / budget seconds apart), so no minute exceeds the budget
+        if not self._budget:
+            return 0
+        if now < self._nextSlot:
+            return self._nextSlot - now
+        self._nextSlot = now + 60 / self._budget
+        return 0
+
+    def _popDue(self, now: float) -> Optional[PollJob]:
+        due = [ ]
+        while self._queue and self._queue[0][0] <= now:
+            due.append(heapq.heappop(self._queue))
+        if not due:
+            return None
+        entry = min(due, key = lambda entry: (entry[2].priority, entry[0], entry[1]))
+        due.remove(entry)
+        for other in due:
+            heapq.heappush(self._queue, other)
+        return entry[2]
+
+    async def _sleep(self, seconds: float) -> None:
+        # new (sooner) jobs wake the loop up
+        self._wakeUp = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._wakeUp.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._wakeUp = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._queue:
+            now = loop.time()
+            if self._queue[0][0] > now:
+                await self._sleep(self._queue[0][0] - now)
+                continue
+            wait = self._takeSlot(now)
+            if wait:
+                await self._sleep(wait)
+                continue
+            job = self._popDue(now)
+            if job is None:
+                continue
+            # polls run concurrently, a slow one doesn't delay the others
+            task = asyncio.create_task(self._poll(job))
+            self._polling.add(task)
+            task.add_done_callback(self._polling.discard)
+
+    async def _poll(self, job: PollJob) -> None:
+        interval: Optional[float] = job.interval or job.policy.live
+        try:
+            result = await job.poll()
+            job.state = result.state
+            interval = job.policy.nextInterval(result, job.interval, job.confirmed)
+            job.confirmed = result.state == MatchState.Finished
+        except: # pylint: disable=bare-except
+            pass
+        if not job.active:
+            return
+        if interval is None:
+            job.active = False
+            return
+        job.interval = interval
+        self._push(asyncio.get_running_loop().time() + interval, job)
+
+
+_scheduler = PollScheduler()
+
+
+def getScheduler() -> PollScheduler:
+    """the scheduler all score observers use"""
+    return _scheduler
+
+def setPollBudget(pollsPerMinute: Optional[float]) -> None:
+    """limits the polls per minute of all score observers (None: unlimited)"""
+    _scheduler.budget = pollsPerMinute
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""cevlib"""
+from __future__ import annotations
+__copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
+
+from abc import ABC, abstractmethod
+import hashlib
+import json
+import os
+from time import perf_counter
+from typing import Any, Dict, Optional
+
+
+from cevlib.exceptions import NotRecordedException
+from cevlib.helpers import metrics
+
+
+class Response:
+    """a downloaded response"""
+    def __init__(self,
+                 url: str,
+                 status: int,
+                 body: bytes,
+                 encoding: str = "utf-8",
+                 headers: Optional[Dict[str, str]] = None) -> None:
+        self._url = url
+        self._status = status
+        self._body = body
+        self._encoding = encoding
+        self._headers = { name.lower(): value for name, value in (headers or { }).items() }
+
+    @property
+    def url(self) -> str:
+        """requested url"""
+        return self._url
+
+    @property
+    def status(self) -> int:
+        """http status"""
+        return self._status
+
+    @property
+    def body(self) -> bytes:
+        """raw body"""
+        return self._body
+
+    @property
+    def encoding(self) -> str:
+        """body encoding"""
+        return self._encoding
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """response headers by lower case name (empty if not kept, e.g. by a replay)"""
+        return self._headers
+
+    def text(self) -> str:
+        """decoded body"""
+        return self._body.decode(self._encoding, errors = "replace")
+
+    def json(self) -> Any:
+        """parsed body, regardless of the content type (None if empty)"""
+        text = self.text().strip()
+        if not text:
+            return None
+        if not metrics.enabled():
+            return json.loads(text)
+        with metrics.measure("jsonDecode", metrics.endpointName(self._url), len(self._body)):
+            return json.loads(text)
+
+    def __repr__(self) -> str:
+        return f"(cevlib.helpers.transport.Response) {self._status} {self._url} ({len(self._body)} bytes)" # pylint: disable=line-too-long
+
+
+class Transport(ABC):
+    """fetches urls (used by every request cevlib makes)"""
+    @abstractmethod
+    async def get(self, url: str) -> Response:
+        """GET url"""
+
+    async def getRange(self, url: str, start: int, end: int) -> Response:
+        """GET bytes start to end (inclusive) of url (by default cut from the whole body)"""
+        response = await self.get(url)
+        if response.status != 200:
+            return response
+        body = response.body
+        return Response(url, 206, body[start:end + 1], response.encoding,
+                        { "content-range": f"bytes {start}-{min(end, len(body) - 1)}/{len(body)}" }) # pylint: disable=line-too-long
+
+
+class HttpTransport(Transport):
+    """live transport (cev.eu), aiohttp is imported by the first request"""
+    async def get(self, url: str) -> Response:
+        return await self._request(url, { })
+
+    async def getRange(self, url: str, start: int, end: int) -> Response:
+        return await self._request(url, { "Range": f"bytes={start}-{end}" })
+
+    @staticmethod
+    async def _request(url: str, headers: Dict[str, str]) -> Response:
+        import aiohttp # pylint: disable=import-outside-toplevel
+        async with aiohttp.ClientSession() as client:
+            async with client.get(url, headers = headers) as resp:
+                body = await resp.read()
+                return Response(url, resp.status, body, resp.get_encoding(), dict(resp.headers))
+
+
+def _fileName(url: str) -> str:
+    return hashlib.sha1(url.encode("utf-8")).hexdigest() + ".body"
+
+
+class RecordingTransport(Transport):
+    """forwards requests to another transport and stores every response in a directory"""
+    def __init__(self, directory: str, upstream: Optional[Transport] = None) -> None:
+        self._directory = directory
+        self._upstream = upstream or HttpTransport()
+        self._index: Dict[str, Dict[str, Any]] = { }
+        os.makedirs(directory, exist_ok = True)
+        indexPath = os.path.join(directory, "index.json")
+        if os.path.exists(indexPath):
+            with open(indexPath, "r", encoding = "utf-8") as file:
+                self._index = json.load(file)
+
+    async def get(self, url: str) -> Response:
+        response = await self._upstream.get(url)
+        fileName = _fileName(url)
+        with open(os.path.join(self._directory, fileName), "wb") as file:
+            file.write(response.body)
+        self._index[url] = { "file": fileName,
+                             "status": response.status,
+                             "encoding": response.encoding }
+        with open(os.path.join(self._directory, "index.json"), "w", encoding = "utf-8") as file:
+            json.dump(self._index, file, indent = 4, sort_keys = True)
+        return response
+
+
+class ReplayTransport(Transport):
+    """serves the responses a RecordingTransport stored (no network)"""
+    def __init__(self, directory: str) -> None:
+        self._directory = directory
+        with open(os.path.join(directory, "index.json"), "r", encoding = "utf-8") as file:
+            self._index: Dict[str, Dict[str, Any]] = json.load(file)
+
+    async def get(self, url: str) -> Response:
+        entry = self._index.get(url)
+        if entry is None:
+            raise NotRecordedException(url)
+        with open(os.path.join(self._directory, entry["file"]), "rb") as file:
+            return Response(url, entry["status"], file.read(), entry["encoding"])
+
+
+_transport: Transport = HttpTransport()
+
+
+def getTransport() -> Transport:
+    """the transport in use"""
+    return _transport
+
+def setTransport(transport: Transport) -> Transport:
+    """replaces the transport (e.g. to record or replay), returns the previous one"""
+    global _transport # pylint: disable=global-statement
+    previous = _transport
+    _transport = transport
+    return previous
+
+async def get(url: str) -> Response:
+    """GET url (through the transport in use)"""
+    if not metrics.enabled():
+        return await _transport.get(url)
+    start = perf_counter()
+    response = await _transport.get(url)
+    metrics.emit(metrics.Event("request",
+                               metrics.endpointName(url),
+                               perf_counter() - start,
+                               len(response.body)))
+    return response
+
+async def getRange(url: str, start: int, end: int) -> Response:
+    """GET bytes start to end (inclusive) of url (through the transport in use)"""
+    if not metrics.enabled():
+        return await _transport.getRange(url, start, end)
+    begin = perf_counter()
+    response = await _transport.getRange(url, start, end)
+    metrics.emit(metrics.Event("request",
+                               metrics.endpointName(url),
+                               perf_counter() - begin,
+                               len(response.body)))
+    return response
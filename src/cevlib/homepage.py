@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""cevlib"""
+from __future__ import annotations
+__copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
+
+# the homepage is the source of Featured (gallery, videos) and Competitions (the menu).
+# it's downloaded once per TTL and shared by both, whatever is parsed from it is parsed
+# once per snapshot.
+#
+#   homepage = await Homepage.get()
+#   links = await homepage.derive(Competitions._parseLinks)
+#
+# (cevlib.featured.landingPage() returns Featured and Competitions of one snapshot)
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from cevlib.helpers import metrics, parsePool, transport
+
+T = TypeVar("T")
+
+URL = "https://www.cev.eu/"
+TTL = 300.0 # seconds a snapshot is used for
+
+
+class Homepage:
+    """a snapshot of the homepage (get the current one with .get())"""
+    _current: Optional[Homepage] = None
+    _loading: Optional[asyncio.Future[Homepage]] = None
+
+    def __init__(self, html: str, fetched: float) -> None:
+        self._html = html
+        self._fetched = fetched
+        self._derived: Dict[Callable[[str], Any], asyncio.Future[Any]] = { }
+
+    @staticmethod
+    async def get(maxAge: Optional[float] = None) -> Homepage:
+        """
+        the current snapshot, downloaded again once it's older than maxAge seconds
+        (default: TTL). concurrent calls share one download. the snapshot and whatever
+        is derived from it are shared by all callers, treat them as read-only
+        """
+        maxAge = TTL if maxAge is None else maxAge
+        current = Homepage._current
+        hit = current is not None and current.age < maxAge
+        metrics.cacheLookup("homepage", hit)
+        if current is not None and hit:
+            return current
+        loading = Homepage._loading
+        if loading is None or loading.done() or loading.get_loop() is not asyncio.get_running_loop(): # pylint: disable=line-too-long
+            loading = Homepage._loading = asyncio.ensure_future(Homepage._load())
+        return await asyncio.shield(loading)
+
+    @staticmethod
+    async def _load() -> Homepage:
+        fetched = time.monotonic()
+        response = await transport.get(URL)
+        homepage = Homepage(response.text(), fetched)
+        if response.status == 200: # errors are handed out once, not kept for the TTL
+            Homepage._current = homepage
+        return homepage
+
+    @staticmethod
+    def clear() -> None:
+        """forgets the current snapshot"""
+        Homepage._current = None
+        Homepage._loading = None
+
+    async def derive(self, target: Callable[[str], T]) -> T:
+        """target(html) (see parsePool.parse), once per snapshot (concurrent calls share it)"""
+        derived = self._derived.get(target)
+        if derived is not None and derived.done() and not derived.cancelled() \
+           and derived.exception() is None:
+            return derived.result() # type: ignore
+        if derived is None or derived.done() or derived.get_loop() is not asyncio.get_running_loop(): # pylint: disable=line-too-long
+            derived = self._derived[target] = asyncio.ensure_future(parsePool.parse(target, self._html)) # pylint: disable=line-too-long
+        return await asyncio.shield(derived)
+
+    @property
+    def html(self) -> str:
+        """the page"""
+        return self._html
+
+    @property
+    def age(self) -> float:
+        """seconds since the download"""
+        return time.monotonic() - self._fetched
+
+    def __repr__(self) -> str:
+        return f"(cevlib.homepage.Homepage) {len(self._html)} characters, {self.age:.0f}s old"
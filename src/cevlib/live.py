@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""cevlib"""
+from __future__ import annotations
+__copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from cevlib.calendar import Calendar, CalendarMatch
+from cevlib.helpers import transport
+from cevlib.types.iType import IType
+from cevlib.types.results import Result
+from cevlib.types.types import LiveEventType, MatchState
+
+
+class LiveEvent(IType):
+    """a change of a live match (between two LiveScores snapshots)"""
+    def __init__(self,
+                 type_: LiveEventType,
+                 matchId: int,
+                 match: CalendarMatch,
+                 previousResult: Optional[Result]) -> None:
+        self._type = type_
+        self._matchId = matchId
+        self._match = match
+        self._previousResult = previousResult
+
+    @property
+    def type(self) -> LiveEventType:
+        """what changed"""
+        return self._type
+
+    @property
+    def matchId(self) -> int:
+        """match id (LiveScores)"""
+        return self._matchId
+
+    @property
+    def match(self) -> CalendarMatch:
+        """the match (after the change)"""
+        return self._match
+
+    @property
+    def result(self) -> Result:
+        """result after the change"""
+        return self._match.result
+
+    @property
+    def previousResult(self) -> Optional[Result]:
+        """result before the change"""
+        return self._previousResult
+
+    @property
+    def valid(self) -> bool:
+        return bool(self._matchId)
+
+    def __repr__(self) -> str:
+        return f"(cevlib.live.LiveEvent) {self._type.value} {self._matchId} {self._match.homeTeam.name} - {self._match.awayTeam.name} {self.result}" # pylint: disable=line-too-long
+
+    def toJson(self) -> Dict[str, Any]:
+        return {
+            "type": self._type.value,
+            "matchId": self._matchId,
+            "match": self._match.toJson(),
+            "previousResult": self._previousResult.toJson() if self._previousResult else None
+        }
+
+
+def _setCount(result: Result) -> int:
+    latestSet = result.latestSet
+    return latestSet.setNumber if latestSet else 0
+
+def diff(previous: Dict[int, CalendarMatch],
+         current: Dict[int, CalendarMatch]) -> List[LiveEvent]:
+    """all changes between two snapshots (see Calendar.parseLiveScores)"""
+    events: List[LiveEvent] = [ ]
+    for matchId, match in current.items():
+        before = previous.get(matchId)
+        if before is None:
+            if match.state == MatchState.Live:
+                events.append(LiveEvent(LiveEventType.MatchStarted, matchId, match, None))
+            continue
+        if before.state == MatchState.Upcoming and match.state != MatchState.Upcoming:
+            events.append(LiveEvent(LiveEventType.MatchStarted, matchId, match, before.result))
+        if before.result != match.result:
+            newSet = _setCount(match.result) > _setCount(before.result)
+            if newSet and match.state == MatchState.Live:
+                events.append(LiveEvent(LiveEventType.SetStarted, matchId, match, before.result))
+            events.append(LiveEvent(LiveEventType.ScoreChanged, matchId, match, before.result))
+        if before.state != MatchState.Finished and match.state == MatchState.Finished:
+            events.append(LiveEvent(LiveEventType.MatchFinished, matchId, match, before.result))
+    return events
+
+
+class LiveScoresFeed:
+    """
+    one LiveScores refresh loop shared by all streams.
+    runs while at least one stream is open
+    """
+    def __init__(self, interval: float = 20) -> None:
+        self._interval = interval
+        self._queues: List[asyncio.Queue[LiveEvent]] = [ ]
+        self._task: Optional[asyncio.Task[None]] = None
+        self._body: Optional[bytes] = None
+        self._snapshot: Optional[Dict[int, CalendarMatch]] = None
+        self._held = False
+
+    @property
+    def interval(self) -> float:
+        """seconds between two refreshes"""
+        return self._interval
+
+    @interval.setter
+    def interval(self, value: float) -> None:
+        self._interval = value
+
+    @property
+    def snapshot(self) -> Dict[int, CalendarMatch]:
+        """the latest snapshot (matches by match id)"""
+        return self._snapshot or { }
+
+    def _ensureRunning(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def _stopIfUnused(self) -> None:
+        if not self._queues and not self._held and self._task is not None:
+            self._task.cancel()
+            self._task = None
+            # the snapshot is outdated by the time the loop is started again,
+            # the first one after a restart is the new baseline
+            self._body = None
+            self._snapshot = None
+
+    def start(self) -> None:
+        """keeps the loop running, even without streams (until stop())"""
+        self._held = True
+        self._ensureRunning()
+
+    def stop(self) -> None:
+        """releases start() (the loop keeps running while streams are open)"""
+        self._held = False
+        self._stopIfUnused()
+
+    def subscribe(self) -> asyncio.Queue[LiveEvent]:
+        """a queue that receives every event from now on (starts the loop if needed)"""
+        queue: asyncio.Queue[LiveEvent] = asyncio.Queue()
+        self._queues.append(queue)
+        self._ensureRunning()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[LiveEvent]) -> None:
+        """stops delivering to queue (stops the loop after the last one)"""
+        if queue in self._queues:
+            self._queues.remove(queue)
+        self._stopIfUnused()
+
+    async def refresh(self) -> List[LiveEvent]:
+        """downloads the feed once and publishes all changes"""
+        resp = await transport.get("https://weblivefeed.cev.eu/LiveScores.json")
+        if resp.status != 200 or resp.body == self._body:
+            return [ ] # unchanged feeds aren't parsed again
+        self._body = resp.body
+        current = Calendar.parseLiveScores(resp.json())
+        # the first snapshot is the baseline
+        events = diff(self._snapshot, current) if self._snapshot is not None else [ ]
+        self._snapshot = current
+        for event in events:
+            for queue in self._queues:
+                queue.put_nowait(event)
+        return events
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except: # pylint: disable=bare-except
+                pass
+            await asyncio.sleep(self._interval)
+
+
+_feed = LiveScoresFeed()
+
+
+def feed() -> LiveScoresFeed:
+    """the shared LiveScores loop"""
+    return _feed
+
+def setRefreshInterval(intervalS: float) -> None:
+    """the interval the shared LiveScores loop uses"""
+    _feed.interval = intervalS
+
+async def stream() -> AsyncIterator[LiveEvent]:
+    """
+    yields every change of every match on cev.eu (score changed, set started,
+    match started/finished). all streams share one LiveScores download per interval
+    """
+    queue = _feed.subscribe()
+    try:
+        while True:
+            yield await queue.get()
+    finally:
+        _feed.unsubscribe(queue)
@@ -9,16 +9,17 @@ __copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
 
 import asyncio
 from datetime import datetime, timedelta
-import re
 import json
-from typing import Any, Coroutine, Dict, List, Optional, Callable
-import aiohttp
-
-from cevlib.exceptions import NotInitialisedException
+import re
+from typing import Any, Coroutine, Dict, List, Optional, Callable, Tuple
 
-from cevlib.helpers.asyncThread import asyncRunInThreadWithReturn
+from cevlib.helpers import jsonDelta, metrics, parsePool, transport
 from cevlib.helpers.dictTool import DictEx, ListEx
+from cevlib.helpers.jsonTool import dumps, dumpsObject, dumpsOptional
+from cevlib.helpers.linkScanner import MatchCentreLinks, scanMatchCentre
+from cevlib.helpers.scheduler import PollJob, PollPolicy, PollResult, getScheduler
 
+from cevlib.converters.liveResultToJson import LiveResultToJson
 from cevlib.converters.scoreHeroToJson import ScoreHeroToJson
 
 from cevlib.types.competition import MatchCompetition
@@ -28,13 +29,38 @@ from cevlib.types.info import Info
 from cevlib.types.playByPlay import PlayByPlay
 from cevlib.types.report import MatchReport
 from cevlib.types.results import Result
-from cevlib.types.stats import TeamStatistics, TopPlayer, TopPlayers
+from cevlib.types.stats import PlayerStatisticIndex, TeamStatistics, TopPlayer, TopPlayers
 from cevlib.types.team import Team
 from cevlib.types.types import MatchState
 
 
 TScoreObserver = Callable[[Any, Any], Coroutine[Any, Any, Any]]
 
+# the umbraco endpoints of a match centre (see Match.byId), in the order the page lists them.
+# {host}, {nodeId}, {matchId}, {homeId} and {awayId} are filled in, endpoints that need
+# the team ids are left out until they are known. the top statistics aren't part of it:
+# how many there are (and their keys) depends on the match, they are scanned from the page.
+# once the page is downloaded, its endpoints replace these
+_API = "{host}/umbraco/api"
+_NODE = "nodeId={nodeId}&culture=en-US"
+_ENDPOINTS = [
+    f"{_API}/matchcentreapi/getlivescorehero?{_NODE}",
+    f"{_API}/MatchCentreApi/GetPlayByPlayComponent?tabKey=1&{_NODE}",
+    f"{_API}/MatchCentreApi/GetMatchPoll?matchPollUid={{matchId}}_{{homeId}}_{{awayId}}-0",
+    f"{_API}/TeamComponentsApi/GetStartingTeamComponent?tabKey=3&teamId={{homeId}}&{_NODE}",
+    f"{_API}/TeamComponentsApi/GetStartingTeamComponent?tabKey=3&teamId={{awayId}}&{_NODE}",
+    f"{_API}/MatchCentreApi/GetFormComponent?tabKey=4&{_NODE}",
+    f"{_API}/StatisticsApi/GetTeamStatsComponentMC?tabKey=5&{_NODE}",
+    f"{_API}/StatisticsApi/GetPlayerStatsComponentMC?tabKey=6&{_NODE}",
+]
+def _needsTeamIds(endpoint: str) -> bool:
+    return "{homeId}" in endpoint or "{awayId}" in endpoint
+
+_TEAM_ID = re.compile(r"GetStartingTeamComponent\?[^\s\"']*teamId=([0-9]+)")
+
+# the score of a single match (a few hundred bytes instead of the whole LiveScores feed)
+_LIVE_RESULT = f"https://{_API}/CompetitionApi/GetLiveResultScoreByMatchId?matchid={{matchId}}"
+
 
 class MatchCache(IFullMatch):
     """snapshot of Match (all match data retrieved from Cache)"""
@@ -92,6 +118,46 @@ class MatchCache(IFullMatch):
             "playByPlay": self.playByPlay.toJson() if self.playByPlay else None,
         }
 
+    def toJsonBytes(self) -> bytes:
+        """
+        serialises straight to json bytes (same content as toJson()).
+        immutable parts (result, report, info, play by play) are only serialised once
+        """
+        return dumpsObject([
+            ("state", dumps(self._state.value)),
+            ("result", self._result.toJsonBytes()),
+            ("homeTeam", dumps(self._homeTeam.toJson())),
+            ("awayTeam", dumps(self._awayTeam.toJson())),
+            ("competition", dumpsOptional(self._competition)),
+            ("duration", dumps(str(self._duration))),
+            ("startTime", dumps(str(self._startTime))),
+            ("matchCentreLink", dumps(self._matchCentreLink)),
+            ("watchLink", dumps(self._watchLink)),
+            ("highlightsLink", dumps(self._highlightsLink)),
+            ("venue", dumps(self._venue)),
+            ("report", dumpsOptional(self._report)),
+            ("info", dumpsOptional(self._info)),
+            ("topPlayers", dumps(self._topPlayers.toJson())),
+            ("gallery", dumps(self._gallery)),
+            ("playByPlay", dumpsOptional(self._playByPlay)),
+        ])
+
+    def diff(self, other: MatchCache) -> List[jsonDelta.Operation]:
+        """
+        the changes from this snapshot to other (json patch operations on toJson()),
+        usually a lot smaller than other.toJson()
+        """
+        return jsonDelta.diff(self.toJson(), other.toJson())
+
+    def apply(self, delta: List[jsonDelta.Operation]) -> JObject:
+        """the snapshot delta leads to (as json tree), e.g. apply(diff(other)) == other.toJson()"""
+        return jsonDelta.patch(self.toJson(), delta) # type: ignore
+
+    def changedSections(self, other: MatchCache) -> List[str]:
+        """the top level keys of toJson() that differ (e.g. [ "state", "result" ])"""
+        mine = self.toJson()
+        return [ key for key, value in other.toJson().items() if mine.get(key) != value ]
+
     @property
     def valid(self) -> bool:
         return True
@@ -173,46 +239,135 @@ class MatchCache(IFullMatch):
         return f"(cevlib.match.MatchCache) {self.toJson()}"
 
 
-class Match(IFullMatch):
+class Match(IFullMatch): # pylint: disable=too-many-public-methods,too-many-instance-attributes
     """match class"""
-    def __init__(self, html: str, url: str) -> None:
-        self._invalidMatchCentre = "This page can be replaced with a custom 404. Check the documentation for" in html or \
-                                   "Object reference not set to an instance of an object." in html # pylint: disable=line-too-long
-        #if self._invalidMatchCentre:
-            #raise AttributeError("404")
-        self._umbracoLinks = [ match[0] for match in re.finditer(r"([\w_-]+(?:(?:\.[\w_-]+)+))([\w.,@;?^=%&:\/~+#-]*umbraco[\w.,@;?^=%&:\/~+#-]*[\w@?^=%&\/~+#-])", html) ] # pylint: disable=line-too-long
-        self._gallery = [ match[0] for match in re.finditer(r"([\w_-]+(?:(?:\.[\w_-]+)+))([\w.,@;?^=%&:\/~+#-]*Upload\/Photo\/[\w .,@;?^=%&:\/~+#-]*[\w@?^=%&\/~+#-]).(jpg|JPG)", html) ] # pylint: disable=line-too-long
-        embeddedVideos = [ match[0] for match in re.finditer(r"([\w_-]+(?:(?:\.[\w_-]+)+))([\w.,@;?^=%&:\/~+#-]*\/embed\/[\w .,@;?^=%&:\/~+#-]*[\w@?^=%&\/~+#-])", html) ] # pylint: disable=line-too-long
+    def __init__(self, html: Optional[str], url: str) -> None:
+        # the html is only analysed on first use (and released once everything is extracted)
+        self._html: Optional[str] = html
+        self._links: Optional[MatchCentreLinks] = None
+        self._invalid = False
         self._highlightsLinkCache: Optional[str] = None
-        if len(embeddedVideos):
-            self._highlightsLinkCache = "https://" + embeddedVideos[0].replace("/embed/", "/v/") \
-                                                                      .split("?")[0]
         #self._nodeId = self._getParameter(self._getLink("livescorehero"), "nodeId")
-        self._html = html
         self._matchId: Optional[int] = None
         self._liveScoresCache: Optional[JObject] = None
         self._formCache: Optional[JObject] = None
+        self._playerStatsRequest: Optional[asyncio.Future[PlayerStatisticIndex]] = None
         self._finished = False
+        # only set once LiveScores (or the score endpoint) reports the match as finished or
+        # it started more than a day ago. the score hero fallback only sets _finished
+        self._finishedForGood = False
         self._matchCentreLink: str = url
         self._initialised = False
         self._reportCache: Optional[MatchReport] = None
         self._infoCache: Optional[Info] = None
         self._scoreObservers: List[TScoreObserver] = [ ]
-        self._scoreObserverInterval = 20
-        self._init = asyncio.create_task(self._startInit())
-        asyncio.create_task(self._observeScore())
+        self._scoreObserverPolicy = PollPolicy()
+        self._lastScore: Optional[Result] = None
+        self._init: Optional[asyncio.Task[None]] = None
+        self._scoreObserverJob: Optional[PollJob] = None
+        # set by byId (the endpoints are built instead of scanned)
+        self._nodeId: Optional[int] = None
+        self._host = ""
+        self._teamIds: Optional[Tuple[int, int]] = None
+        self._pageRequest: Optional[asyncio.Future[None]] = None
+        # see result()
+        self._liveResultSupported = True
+        self._finalResult: Optional[Result] = None
 
     @property
     def valid(self) -> bool:
-        return bool(self._umbracoLinks)
+        if self._nodeId is not None:
+            return True
+        return bool(self._analyse().umbraco)
+
+    def _analyse(self) -> MatchCentreLinks:
+        if self._links is None:
+            html = self._html or ""
+            self._invalid = "This page can be replaced with a custom 404. Check the documentation for" in html or \
+                            "Object reference not set to an instance of an object." in html # pylint: disable=line-too-long
+            #if self._invalid:
+                #raise AttributeError("404")
+            self._links = scanMatchCentre(html)
+            if self._links.videos and not self._highlightsLinkCache:
+                self._highlightsLinkCache = "https://" + self._links.videos[0] \
+                                                             .replace("/embed/", "/v/") \
+                                                             .split("?")[0]
+            self._releaseHtml()
+        return self._links
+
+    def _releaseHtml(self) -> None:
+        if None not in (self._links, self._reportCache, self._infoCache):
+            self._html = None
+
+    @property
+    def _invalidMatchCentre(self) -> bool:
+        if self._nodeId is not None:
+            return False
+        self._analyse()
+        return self._invalid
 
     async def _startInit(self) -> None:
-        self._matchId = await self._getMatchId()
+        if self._nodeId is not None:
+            await self._resolveTeamIds()
+        else:
+            self._matchId = await self._getMatchId()
         self._initialised = True
 
+    async def _findLiveScoresMatch(self) -> DictEx:
+        # by id, without the livescorehero fallback (it needs the team ids)
+        jdata = DictEx(await self._requestLiveScoresJson())
+        for competition in jdata.ensure("competitions", ListEx).iterate(DictEx):
+            for match in competition.ensure("matches", ListEx).iterate(DictEx):
+                if match.ensure("matchId", int) == self._matchId:
+                    return match
+        return DictEx()
+
+    async def _resolveTeamIds(self) -> None:
+        if self._teamIds is not None:
+            return
+        match = await self._findLiveScoresMatch()
+        homeId, awayId = match.tryGet("homeTeamId", int), match.tryGet("awayTeamId", int)
+        if homeId and awayId:
+            self._teamIds = (homeId, awayId)
+            return
+        # not part of the feed (anymore): the match centre page lists them
+        await self._loadPage()
+        ids = [ int(teamId) for teamId in _TEAM_ID.findall(self._html or "") ]
+        if len(ids) >= 2:
+            self._teamIds = (ids[0], ids[1])
+
+    async def _requestPage(self) -> None:
+        if not self._matchCentreLink:
+            self._matchCentreLink = (await self._findLiveScoresMatch()).ensure("matchCentreLink",
+                                                                               str)
+        html = (await transport.get(self._matchCentreLink)).text() \
+               if self._matchCentreLink else ""
+        self._html = html
+        self._links = None # analysed again, with the page
+        self._analyse()
+
+    @property
+    def _pageLoaded(self) -> bool:
+        # byId: the page has been downloaded and lists the endpoints
+        return self._pageRequest is not None and self._pageRequest.done() and \
+               self._links is not None and bool(self._links.umbraco)
+
+    async def _loadPage(self) -> None:
+        """downloads the match centre page if byId created this match (byUrl already has it)"""
+        if self._nodeId is None:
+            return
+        if self._pageRequest is None:
+            self._pageRequest = asyncio.ensure_future(self._requestPage())
+        await asyncio.shield(self._pageRequest)
+
+    async def _ensureInitialised(self) -> None:
+        if not self._initialised:
+            await self.init()
+
     def init(self) -> asyncio.Task[None]:
         """
-        caches the match id, required for:
+        caches the match id (started on first call, awaited by every method that needs it).
+        required for:
         - homeTeam/awayTeam
         - currentScore
         - startTime
@@ -222,6 +377,8 @@ class Match(IFullMatch):
         - watchLink
         - highlightsLink
         """
+        if self._init is None:
+            self._init = asyncio.create_task(self._startInit())
         return self._init
 
 
@@ -236,9 +393,18 @@ class Match(IFullMatch):
 #        except:
 #            return None
 
+    def _endpoints(self) -> List[str]:
+        if self._nodeId is None or self._pageLoaded:
+            return self._analyse().umbraco
+        homeId, awayId = self._teamIds or (None, None)
+        return [ endpoint.format(host = self._host, nodeId = self._nodeId, matchId = self._matchId,
+                                 homeId = homeId, awayId = awayId)
+                 for endpoint in _ENDPOINTS
+                 if self._teamIds is not None or not _needsTeamIds(endpoint) ]
+
     def _getLinks(self, contains: str) -> List[str]:
         eligibleLinks = [ ]
-        for umbracoLink in self._umbracoLinks:
+        for umbracoLink in self._endpoints():
             if contains in umbracoLink:
                 eligibleLinks.append("https://" + umbracoLink.replace("amp;", ""))
         return eligibleLinks
@@ -250,31 +416,42 @@ class Match(IFullMatch):
         return ""
 
     async def _getForm(self) -> JObject:
+        metrics.cacheLookup("form", self._formCache is not None)
         if self._formCache is None:
-            async with aiohttp.ClientSession() as client:
-                async with client.get(self._getLink("GetFormComponent")) as resp:
-                    self._formCache = json.loads(await resp.json(content_type=None))
+            resp = await transport.get(self._getLink("GetFormComponent"))
+            self._formCache = json.loads(resp.json())
         return self._formCache
 
+    async def _requestPlayerStats(self) -> PlayerStatisticIndex:
+        resp = await transport.get(self._getLink("GetPlayerStatsComponentMC"))
+        return PlayerStatisticIndex.parse(json.loads(resp.json()))
+
+    async def _getPlayerStats(self) -> PlayerStatisticIndex:
+        # home and away team are built concurrently and share one request (and index)
+        request = self._playerStatsRequest
+        metrics.cacheLookup("playerStats", request is not None and not request.done())
+        if request is None or request.done():
+            request = self._playerStatsRequest = asyncio.ensure_future(self._requestPlayerStats())
+        return await asyncio.shield(request)
+
     async def _getMatchId(self) -> Optional[int]:
         try:
-            async with aiohttp.ClientSession() as client:
-                async with client.get(self._getLink("livescorehero")) as resp:
-                    jdata = await resp.json(content_type=None)
-                    return int(jdata.get("MatchId"))
+            jdata = (await transport.get(self._getLink("livescorehero"))).json()
+            return int(jdata.get("MatchId"))
         except: # pylint: disable=bare-except
             return None
 
     async def _requestLiveScoresJson(self, useCache: bool = True) -> JObject:
         if useCache and self._liveScoresCache:
+            metrics.cacheLookup("liveScores", True)
             return self._liveScoresCache
-        async with aiohttp.ClientSession() as client:
-            async with client.get("https://weblivefeed.cev.eu/LiveScores.json") as resp:
-                if resp.status == 200:
-                    self._liveScoresCache = DictEx(await resp.json(content_type=None))
-                    return self._liveScoresCache
-                self._liveScoresCache = DictEx()
-                return self._liveScoresCache
+        metrics.cacheLookup("liveScores", False)
+        resp = await transport.get("https://weblivefeed.cev.eu/LiveScores.json")
+        if resp.status == 200:
+            self._liveScoresCache = DictEx(resp.json())
+            return self._liveScoresCache
+        self._liveScoresCache = DictEx()
+        return self._liveScoresCache
 
     async def _requestLiveScoresJsonByMatchSafe(self, useCache: bool = True) ->  Optional[JObject]:
         return await (self._requestLiveScoresJsonByMatchId(useCache) if not self._invalidMatchCentre
@@ -287,7 +464,7 @@ class Match(IFullMatch):
         for competition in jdata.ensure("competitions", ListEx).iterate(DictEx):
             for match in competition.ensure("matches", ListEx).iterate(DictEx):
                 if match.ensure("matchCentreLink", str) == self._matchCentreLink:
-                    self._finished = match.ensure("matchState_String", str) == "FINISHED"
+                    self._setState(match.ensure("matchState_String", str))
                     match["competition"] = { "name": competition.tryGet("competitionName", str),
                                             "id": competition.tryGet("competitionId", int) }
                     return match
@@ -299,42 +476,58 @@ class Match(IFullMatch):
         for competition in jdata.ensure("competitions", ListEx).iterate(DictEx):
             for match in competition.ensure("matches", ListEx).iterate(DictEx):
                 if match.ensure("matchId", int) == self._matchId:
-                    self._finished = match.ensure("matchState_String", str) == "FINISHED"
+                    self._setState(match.ensure("matchState_String", str))
                     return match
         return await self._tryGetFinishedGameData()
 
     async def _tryGetFinishedGameData(self, trulyFinished: bool = True) -> Optional[JObject]:
         if self._invalidMatchCentre:
             return None
-        async with aiohttp.ClientSession() as client:
-            self._finished = trulyFinished
-            livescorehero = { }
-            matchpolldata = [ ]
-            async with client.get(self._getLink("getlivescorehero")) as resp:
-                livescorehero = await resp.json(content_type=None)
-            async with client.get(self._getLink("GetMatchPoll")) as resp:
-                matchpolldata = await resp.json(content_type=None)
-            return ScoreHeroToJson.convert(livescorehero, matchpolldata)
+        self._finished = trulyFinished
+        livescorehero = (await transport.get(self._getLink("getlivescorehero"))).json()
+        matchpolldata = (await transport.get(self._getLink("GetMatchPoll"))).json()
+        return ScoreHeroToJson.convert(livescorehero, matchpolldata)
+
+    def _liveResultLink(self) -> str:
+        # a www.cev.eu endpoint, whatever host the match centre is on (unless byId says otherwise)
+        return _LIVE_RESULT.format(host = self._host or "www.cev.eu", matchId = self._matchId)
+
+    async def _requestLiveResult(self) -> Optional[JObject]:
+        """the match from the per match score endpoint (None if it can't answer)"""
+        if not self._liveResultSupported or not self._matchId:
+            return None
+        try:
+            resp = await transport.get(self._liveResultLink())
+            match = LiveResultToJson.convert(resp.json()) if resp.status == 200 else { }
+        except Exception: # pylint: disable=broad-except
+            match = { }
+        if not match:
+            # not served for this match (host), LiveScores answers from now on
+            self._liveResultSupported = False
+            return None
+        state = DictEx(match).tryGet("matchState_String", str)
+        if state:
+            self._setState(state)
+        return match
+
+    def _setState(self, state: str) -> None:
+        """state reported by LiveScores or the score endpoint (authoritative)"""
+        self._finished = state == "FINISHED"
+        self._finishedForGood = self._finishedForGood or self._finished
 
     async def _getTeam(self, index: int, home: bool) -> Optional[Team]:
         try:
-            async with aiohttp.ClientSession() as client:
-                playerStatsData = { }
-                teamData = { }
-                teamStatsData = { }
-                matchPoll = [ ]
-                async with client.get(self._getLink("GetStartingTeamComponent", index)) as resp:
-                    teamData = await resp.json(content_type=None)
-                async with client.get(self._getLink("GetPlayerStatsComponentMC")) as resp:
-                    playerStatsData = json.loads(await resp.json(content_type=None))
-                async with client.get(self._getLink("GetTeamStatsComponentMC")) as resp:
-                    teamStatsData = json.loads(await resp.json(content_type=None))
-                async with client.get(self._getLink("GetMatchPoll")) as resp:
-                    matchPoll = await resp.json(content_type=None)
-                liveScore = DictEx(await self._requestLiveScoresJsonByMatchSafe())
-                form = await self._getForm()
+            playerStats = await self._getPlayerStats()
+            teamData = (await transport.get(self._getLink("GetStartingTeamComponent",
+                                                          index))).json()
+            teamStatsData = json.loads((await transport.get(
+                                            self._getLink("GetTeamStatsComponentMC"))).json())
+            matchPoll = (await transport.get(self._getLink("GetMatchPoll"))).json()
+            liveScore = DictEx(await self._requestLiveScoresJsonByMatchSafe())
+            form = await self._getForm()
+            with metrics.measure("build", "Team"):
                 return Team(teamData,
-                            playerStatsData,
+                            playerStats,
                             TeamStatistics(teamStatsData, home),
                             matchPoll,
                             form["HomeTeam"] if home else form["AwayTeam"],
@@ -359,35 +552,60 @@ class Match(IFullMatch):
 
 
     def setScoreObserverInterval(self, intervalS: int) -> None:
-        """the interval the score observer uses"""
-        self._scoreObserverInterval = intervalS
+        """the interval the score observer uses during sets (see setScoreObserverPolicy)"""
+        self._scoreObserverPolicy.live = intervalS
+
+    def setScoreObserverPolicy(self, policy: PollPolicy) -> None:
+        """the intervals the score observer uses (by match state)"""
+        self._scoreObserverPolicy = policy
+        if self._scoreObserverJob:
+            self._scoreObserverJob.policy = policy
 
     def addScoreObserver(self, observer: TScoreObserver) -> None:
         """adds a new score observer"""
         self._scoreObservers.append(observer)
+        if self._scoreObserverJob is None or not self._scoreObserverJob.active:
+            # all matches are polled by one scheduler (see helpers.scheduler)
+            self._scoreObserverJob = getScheduler().add(self._observeScore,
+                                                        self._scoreObserverPolicy)
 
     def removeScoreObserver(self, observer: TScoreObserver) -> None:
         """removes a score observer"""
         self._scoreObservers.remove(observer)
-
-    async def _observeScore(self) -> None:
-        lastScore: Optional[Result] = None
-        while True:
-            try:
-                if len(self._scoreObservers) > 0:
-                    result = await self.result()
-                    if lastScore != result:
-                        lastScore = result
-                        for observer in self._scoreObservers:
-                            await observer(self, lastScore)
-            except: # pylint: disable=bare-except
-                pass
-            await asyncio.sleep(self._scoreObserverInterval)
+        if not self._scoreObservers and self._scoreObserverJob:
+            getScheduler().remove(self._scoreObserverJob)
+            self._scoreObserverJob = None
+
+    async def _observeScore(self) -> PollResult:
+        result = await self.result()
+        changed = self._lastScore != result
+        if changed:
+            self._lastScore = result
+            for observer in list(self._scoreObservers):
+                await observer(self, result)
+        # result() just refreshed the live scores, the state is derived without another request
+        startTime = await self.startTime()
+        now = datetime.utcnow()
+        finished = self._finishedForGood or now - startTime > timedelta(days = 1)
+        latestSet = result.latestSet
+        return PollResult(MatchState.parse(now >= startTime, finished),
+                          startTime,
+                          bool(latestSet and latestSet.isInPlay),
+                          changed)
 
     async def result(self) -> Result:
-        if not self._initialised:
-            raise NotInitialisedException
-        match = await self._requestLiveScoresJsonByMatchSafe(self._finished)
+        # the cheapest source that can answer, by match state:
+        #   finished: the final result (never changes, no request)
+        #   unknown:  LiveScores (state and start time come with it, see startTime())
+        #   upcoming / live: the per match score endpoint (LiveScores if unavailable)
+        # the score hero is the fallback for matches that aren't in LiveScores (anymore)
+        metrics.cacheLookup("result", self._finalResult is not None)
+        if self._finalResult is not None:
+            return self._finalResult
+        await self._ensureInitialised()
+        match = await self._requestLiveResult() if self._liveScoresCache else None
+        if match is None:
+            match = await self._requestLiveScoresJsonByMatchSafe(self._finished)
         assert match is not None
         res = Result(match)
 
@@ -396,11 +614,12 @@ class Match(IFullMatch):
             assert match is not None
             res = Result(match)
 
+        if self._finishedForGood and not res.empty:
+            self._finalResult = res
         return res
 
     async def startTime(self) -> datetime:
-        if not self._initialised:
-            raise NotInitialisedException
+        await self._ensureInitialised()
         match = DictEx(await self._requestLiveScoresJsonByMatchSafe())
         return datetime.strptime(match.ensure("utcStartDate", str), "%Y-%m-%dT%H:%M:%SZ")
 
@@ -409,14 +628,15 @@ class Match(IFullMatch):
         return datetime.utcnow() >= startTime
 
     async def finished(self) -> bool:
-        if not self._initialised:
-            raise NotInitialisedException
+        await self._ensureInitialised()
+        if self._finishedForGood:
+            return True # no need to ask again
         await self._requestLiveScoresJsonByMatchSafe(False)
 
         startTime = await self.startTime()
         duration = datetime.utcnow() - startTime
         if duration > timedelta(days = 1):
-            self._finished = True
+            self._finished = self._finishedForGood = True
         return self._finished
 
     async def state(self) -> MatchState:
@@ -424,46 +644,44 @@ class Match(IFullMatch):
         return MatchState.parse(started, finished)
 
     async def venue(self) -> str:
-        if not self._initialised:
-            raise NotInitialisedException
+        await self._ensureInitialised()
         match = DictEx(await self._requestLiveScoresJsonByMatchSafe())
         return match.ensure("matchLocation", str)
 
     async def playByPlay(self) -> Optional[PlayByPlay]:
         try:
-            async with aiohttp.ClientSession() as client:
-                async with client.get(self._getLink("GetPlayByPlayComponent")) as resp:
-                    jdata = await resp.json(content_type=None)
-                    return PlayByPlay(jdata)
+            resp = await transport.get(self._getLink("GetPlayByPlayComponent"))
+            with metrics.measure("build", "PlayByPlay"):
+                return await parsePool.build(PlayByPlay, resp)
         except Exception:
             return None
 
     async def homeTeam(self) -> Team:
-        if not self._initialised:
-            raise NotInitialisedException
+        await self._ensureInitialised()
         team = await self._getTeam(0, True)
         assert team
         return team
 
     async def awayTeam(self) -> Team:
-        if not self._initialised:
-            raise NotInitialisedException
+        await self._ensureInitialised()
         team = await self._getTeam(1, False)
         assert team
         return team
 
     @property
     def gallery(self) -> List[str]:
-        return self._gallery
+        return self._analyse().gallery
 
     async def report(self) -> Optional[MatchReport]:
-        if not self._reportCache:
-            self._reportCache = await asyncRunInThreadWithReturn(MatchReport, self._html)
+        metrics.cacheLookup("report", self._reportCache is not None)
+        if self._reportCache is None:
+            await self._loadPage()
+            self._reportCache = await parsePool.parse(MatchReport, self._html)
+            self._releaseHtml()
         return self._reportCache or None
 
     async def duration(self) -> timedelta:
-        if not self._initialised:
-            raise NotInitialisedException
+        await self._ensureInitialised()
         if not await self.finished():
             startTime = await self.startTime()
             if datetime.utcnow() < startTime:
@@ -473,40 +691,33 @@ class Match(IFullMatch):
                 return duration
         if self._invalidMatchCentre:
             return timedelta()
-        async with aiohttp.ClientSession() as client:
-            async with client.get(self._getLink("getlivescorehero")) as resp:
-                jdata = await resp.json(content_type=None)
-                return timedelta(minutes = float(jdata.get("Duration").split(" ")[0]))
+        jdata = (await transport.get(self._getLink("getlivescorehero"))).json()
+        return timedelta(minutes = float(jdata.get("Duration").split(" ")[0]))
 
     @property
     def matchCentreLink(self) -> str:
         return self._matchCentreLink
 
     async def watchLink(self) -> Optional[str]:
-        if not self._initialised:
-            raise NotInitialisedException
+        await self._ensureInitialised()
         jdata = DictEx(await self._requestLiveScoresJsonByMatchSafe())
         link = jdata.tryGet("watchLink", str)
         if link:
             return link
 
-        async with aiohttp.ClientSession() as client:
-            async with client.get(self._getLink("getlivescorehero")) as resp:
-                jdata = DictEx(await resp.json(content_type=None))
-                return jdata.tryGet("HighLightUrl", str)
+        jdata = DictEx((await transport.get(self._getLink("getlivescorehero"))).json())
+        return jdata.tryGet("HighLightUrl", str)
 
     async def highlightsLink(self) -> Optional[str]:
+        self._analyse()
         if not self._highlightsLinkCache:
-            if not self._initialised:
-                raise NotInitialisedException
+            await self._ensureInitialised()
             jdata = DictEx(await self._requestLiveScoresJsonByMatchSafe())
             self._highlightsLinkCache = jdata.tryGet("highlightsLink", str)
 
             if not self._highlightsLinkCache:
-                async with aiohttp.ClientSession() as client:
-                    async with client.get(self._getLink("getlivescorehero")) as resp:
-                        jdata = DictEx(await resp.json(content_type=None))
-                        self._highlightsLinkCache = jdata.tryGet("HighLightUrl", str)
+                jdata = DictEx((await transport.get(self._getLink("getlivescorehero"))).json())
+                self._highlightsLinkCache = jdata.tryGet("HighLightUrl", str)
 
         return self._highlightsLinkCache
 
@@ -523,25 +734,25 @@ class Match(IFullMatch):
                 "GroupPool": jdata.ensure("groupName", str),
                 "MatchNumber": jdata.ensure("matchNumber", str)
             })
-        async with aiohttp.ClientSession() as client:
-            async with client.get(self._getLink("getlivescorehero")) as resp:
-                jdata = await resp.json(content_type=None)
-                assert jdata is not None
-                return MatchCompetition(jdata)
+        jdata = (await transport.get(self._getLink("getlivescorehero"))).json()
+        assert jdata is not None
+        return MatchCompetition(jdata)
 
     async def topPlayers(self) -> TopPlayers:
+        await self._loadPage() # byId: the categories are only listed by the page
         topPlayers = TopPlayers()
         links = self._getLinks("GetTopStatisticsComponent")
         for link in links:
-            async with aiohttp.ClientSession() as client:
-                async with client.get(link) as resp:
-                    jdata = await resp.json(content_type=None)
-                    topPlayers.append(TopPlayer(jdata))
+            jdata = (await transport.get(link)).json()
+            topPlayers.append(TopPlayer(jdata))
         return topPlayers
 
     async def info(self) -> Info:
+        metrics.cacheLookup("info", self._infoCache is not None)
         if self._infoCache is None:
-            self._infoCache = await asyncRunInThreadWithReturn(Info, self._html)
+            await self._loadPage()
+            self._infoCache = await parsePool.parse(Info, self._html)
+            self._releaseHtml()
         assert self._infoCache
         return self._infoCache
 
@@ -552,9 +763,26 @@ class Match(IFullMatch):
     @staticmethod
     async def byUrl(url: str) -> Match:
         """creates a match by match url (link/href)"""
-        async with aiohttp.ClientSession() as client:
-            async with client.get(url) as resp:
-                return Match(await resp.text(), url)
+        return Match((await transport.get(url)).text(), url)
+
+    @staticmethod
+    def byId(matchId: int,
+             nodeId: int,
+             host: str = "www.cev.eu",
+             teamIds: Optional[Tuple[int, int]] = None) -> Match:
+        """
+        creates a match by its ids (e.g. from LiveScores) without downloading the match centre:
+        the endpoints are built from the ids. the page is only downloaded by info(), report()
+        and cache() (gallery stays empty until then).
+        teamIds (home, away) are looked up in LiveScores if not passed
+        """
+        # pylint: disable=protected-access
+        match = Match(None, "")
+        match._matchId = matchId
+        match._nodeId = nodeId
+        match._host = host.removeprefix("https:").removeprefix("http:").removeprefix("//")
+        match._teamIds = teamIds
+        return match
 
 
     # CONVERT
@@ -563,6 +791,9 @@ class Match(IFullMatch):
     async def toJson(self) -> Dict[str, Any]:
         return (await self.cache()).toJson()
 
+    async def toJsonBytes(self) -> bytes:
+        return (await self.cache()).toJsonBytes()
+
     async def cache(self,) -> MatchCache:
         """
         gets a snapshot of the current data.
@@ -583,6 +814,10 @@ class Match(IFullMatch):
                     #highlightsLink = True,
                     #finished = True,
                     #report = True,) -> MatchCache:
+        with metrics.trace("cache"):
+            return await self._cache()
+
+    async def _cache(self) -> MatchCache:
         afterInit: List[Coroutine[Any, Any, Any]] = [ ]
 
         afterInit.append(self.playByPlay())
@@ -591,8 +826,7 @@ class Match(IFullMatch):
         afterInit.append(self.report())
         afterInit.append(self.info())
 
-        if not self._initialised:
-            await self.init()
+        await self._ensureInitialised()
 
         afterInit.append(self.result())
         afterInit.append(self.duration())
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""cevlib"""
+from __future__ import annotations
+__copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
+
+# metadata (type, size, dimensions) of gallery photos and videos, resolved concurrently.
+#
+#   resolver = MediaResolver(concurrency = 8)
+#   photos = await resolver.resolveAll(match.gallery)
+#
+# the type and dimensions of a photo are part of the first bytes of the file, so a photo
+# costs a single range request (its size is the total of the Content-Range header).
+# youtube videos are resolved through their oembed endpoint. urls are deduplicated and
+# every result is cached by url. a url that can't be resolved (error status, connection
+# error, timeout) gives an invalid MediaInfo, it doesn't fail the others.
+
+import asyncio
+import os
+import re
+import struct
+from typing import Dict, Iterable, Optional, Tuple
+
+from cevlib.exceptions import NotRecordedException
+from cevlib.helpers import metrics, transport
+from cevlib.helpers.dictTool import DictEx
+from cevlib.helpers.transport import Response
+from cevlib.types.iType import IType, JObject
+
+HEADER_BYTES = 64 * 1024 # the headers of a jpeg (exif included) usually fit
+CHUNK_BYTES = 256 * 1024 # per range request of a thumbnail download
+TIMEOUT = 30.0 # seconds per url (resolve)
+
+_YOUTUBE = re.compile(r"youtube(?:-nocookie)?\.com\/(?:embed|v)\/([\w-]+)")
+_CONTENT_RANGE = re.compile(r"bytes [0-9]+-[0-9]+\/([0-9]+)")
+
+Dimensions = Tuple[Optional[str], Optional[int], Optional[int]] # content type, width, height
+
+
+def _absolute(url: str) -> str:
+    # match centre photos are scraped without a scheme (and may contain spaces)
+    url = url.replace(" ", "%20")
+    return url if "://" in url else f"https://{url.lstrip('/')}"
+
+def _total(response: Response) -> Optional[int]:
+    match = _CONTENT_RANGE.match(response.headers.get("content-range", ""))
+    return int(match.group(1)) if match else None
+
+
+def _jpeg(data: bytes) -> Dimensions:
+    position = 2
+    while position + 9 <= len(data) and data[position] == 0xFF:
+        marker = data[position + 1]
+        if marker == 0xFF: # fill byte
+            position += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8: # no length
+            position += 2
+            continue
+        # start of frame (0xC4, 0xC8 and 0xCC aren't)
+        if 0xC0 <= marker <= 0xCF and marker not in ( 0xC4, 0xC8, 0xCC ):
+            height, width = struct.unpack(">HH", data[position + 5:position + 9])
+            return "image/jpeg", width, height
+        position += 2 + struct.unpack(">H", data[position + 2:position + 4])[0]
+    return "image/jpeg", None, None # the frame is past the bytes read
+
+def _webp(data: bytes) -> Dimensions:
+    chunk = data[12:16]
+    if chunk == b"VP8X":
+        return ("image/webp",
+                int.from_bytes(data[24:27], "little") + 1,
+                int.from_bytes(data[27:30], "little") + 1)
+    if chunk == b"VP8 ":
+        width, height = struct.unpack("<HH", data[26:30])
+        return "image/webp", width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L":
+        bits = int.from_bytes(data[21:25], "little")
+        return "image/webp", (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    return "image/webp", None, None
+
+def dimensions(data: bytes) -> Dimensions:
+    """content type, width and height of an image (by its first bytes, None if unknown)"""
+    if data[:8] == b"\x89PNG\r\n\x1a\n" and len(data) >= 24:
+        width, height = struct.unpack(">II", data[16:24])
+        return "image/png", width, height
+    if data[:2] == b"\xff\xd8":
+        return _jpeg(data)
+    if data[:6] in ( b"GIF87a", b"GIF89a" ) and len(data) >= 10:
+        width, height = struct.unpack("<HH", data[6:10])
+        return "image/gif", width, height
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP" and len(data) >= 30:
+        return _webp(data)
+    return None, None, None
+
+
+class MediaInfo(IType):
+    """metadata of a photo or video"""
+    def __init__(self, data: JObject) -> None:
+        self._data = data
+        dex = DictEx(data)
+        self._url = dex.ensureString("url")
+        self._kind = dex.ensureString("kind")
+        self._contentType = dex.tryGet("contentType", str)
+        self._size = dex.tryGet("size", int)
+        self._width = dex.tryGet("width", int)
+        self._height = dex.tryGet("height", int)
+        self._title = dex.tryGet("title", str)
+        self._thumbnail = dex.tryGet("thumbnail", str)
+
+    @property
+    def url(self) -> str:
+        """the url as passed to the resolver"""
+        return self._url
+
+    @property
+    def kind(self) -> str:
+        """photo or video"""
+        return self._kind
+
+    @property
+    def contentType(self) -> Optional[str]:
+        """e.g. image/jpeg (photos)"""
+        return self._contentType
+
+    @property
+    def size(self) -> Optional[int]:
+        """file size in bytes (photos)"""
+        return self._size
+
+    @property
+    def width(self) -> Optional[int]:
+        """width in pixels"""
+        return self._width
+
+    @property
+    def height(self) -> Optional[int]:
+        """height in pixels"""
+        return self._height
+
+    @property
+    def title(self) -> Optional[str]:
+        """title (videos)"""
+        return self._title
+
+    @property
+    def thumbnail(self) -> Optional[str]:
+        """thumbnail url (videos)"""
+        return self._thumbnail
+
+    @property
+    def valid(self) -> bool:
+        return bool(self._contentType or self._title)
+
+    def toJson(self) -> JObject:
+        return self._data
+
+    def __repr__(self) -> str:
+        return f"(cevlib.media.MediaInfo) {self._kind} {self._url} ({self._contentType}, {self._width}x{self._height}, {self._size} bytes)" # pylint: disable=line-too-long
+
+
+class MediaResolver:
+    """resolves the metadata of media urls, at most concurrency requests at a time"""
+    def __init__(self, concurrency: int = 8) -> None:
+        self._concurrency = concurrency
+        self._cache: Dict[str, MediaInfo] = { }
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _limit(self) -> asyncio.Semaphore:
+        # a semaphore belongs to the loop it's first used in
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    def cached(self, url: str) -> Optional[MediaInfo]:
+        """the metadata of url if it has been resolved"""
+        return self._cache.get(url)
+
+    async def resolve(self, url: str) -> MediaInfo:
+        """metadata of a photo or video (not cached if the request failed)"""
+        import aiohttp # pylint: disable=import-outside-toplevel
+        cached = self._cache.get(url)
+        metrics.cacheLookup("media", cached is not None)
+        if cached is not None:
+            return cached
+        video = _YOUTUBE.search(url)
+        async with self._limit():
+            try:
+                info = await asyncio.wait_for(self._video(url, video.group(1)) if video
+                                              else self._photo(url), TIMEOUT)
+            except (aiohttp.ClientError, asyncio.TimeoutError, NotRecordedException):
+                info = MediaInfo({ "url": url, "kind": "video" if video else "photo" })
+        if info.valid:
+            self._cache[url] = info
+        return info
+
+    async def resolveAll(self, urls: Iterable[str]) -> Dict[str, MediaInfo]:
+        """metadata of every (distinct) url, in the order of their first appearance"""
+        unique = list(dict.fromkeys(urls))
+        return dict(zip(unique, await asyncio.gather(*(self.resolve(url) for url in unique))))
+
+    @staticmethod
+    async def _photo(url: str) -> MediaInfo:
+        response = await transport.getRange(_absolute(url), 0, HEADER_BYTES - 1)
+        if response.status not in ( 200, 206 ):
+            return MediaInfo({ "url": url, "kind": "photo" })
+        contentType, width, height = dimensions(response.body)
+        if contentType is None and response.headers.get("content-type", "").startswith("image/"):
+            contentType = response.headers["content-type"].split(";")[0]
+        size = _total(response) if response.status == 206 else len(response.body)
+        return MediaInfo({ "url": url, "kind": "photo", "contentType": contentType,
+                           "size": size, "width": width, "height": height })
+
+    @staticmethod
+    async def _video(url: str, videoId: str) -> MediaInfo:
+        response = await transport.get("https://www.youtube.com/oembed?format=json"
+                                       f"&url=https://www.youtube.com/watch?v={videoId}")
+        data = response.json() if response.status == 200 else None
+        dex = DictEx(data if isinstance(data, dict) else { })
+        return MediaInfo({ "url": url, "kind": "video",
+                           "title": dex.tryGet("title", str),
+                           "width": dex.tryGet("width", int),
+                           "height": dex.tryGet("height", int),
+                           "thumbnail": dex.tryGet("thumbnail_url", str) })
+
+    async def saveThumbnail(self, url: str, path: str, width: int = 320) -> bool:
+        """
+        downloads a thumbnail of a photo (scaled to width by cev.eu) or video to path,
+        CHUNK_BYTES per range request (an interrupted download continues where it stopped)
+        """
+        if _YOUTUBE.search(url):
+            source = (await self.resolve(url)).thumbnail
+        else:
+            source = f"{_absolute(url)}{'&' if '?' in url else '?'}width={width}"
+        if not source:
+            return False
+        partial = path + ".part"
+        offset = os.path.getsize(partial) if os.path.exists(partial) else 0
+        async with self._limit():
+            with open(partial, "ab") as file:
+                while True:
+                    response = await transport.getRange(source, offset, offset + CHUNK_BYTES - 1)
+                    if response.status == 200: # the range was ignored, this is the whole file
+                        file.truncate(0)
+                        file.write(response.body)
+                        break
+                    if response.status == 416 and offset: # downloaded before
+                        break
+                    if response.status != 206:
+                        return False
+                    file.write(response.body)
+                    offset += len(response.body)
+                    total = _total(response)
+                    if not response.body or total is None or offset >= total:
+                        break
+        os.replace(partial, path)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __repr__(self) -> str:
+        return f"(cevlib.media.MediaResolver) {len(self._cache)} cached, {self._concurrency} concurrent" # pylint: disable=line-too-long
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""cevlib"""
+from __future__ import annotations
+__copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
+
+# a local gateway: any number of clients share one cache and one LiveScores loop.
+#
+# GET /match?url=<match centre link>        MatchCache
+# GET /competition?url=<competition link>   Competition
+#     (only https links of cev.eu and its subdomains, anything else is a 400: the gateway
+#     isn't a proxy)
+# GET /calendar?month=3&year=2022           matches of a month
+# GET /calendar/upcoming, /calendar/recent  upcoming / recent matches
+# GET /live                                 latest LiveScores snapshot
+# GET /live/events                          live events (server-sent events)
+# GET /live/ws                              live events (websocket)
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from aiohttp import web
+
+from cevlib import live
+from cevlib.calendar import Calendar, CalendarMatch
+from cevlib.competitions import Competition
+from cevlib.helpers import metrics
+from cevlib.helpers.jsonTool import dumps, dumpsArray, dumpsObject
+from cevlib.match import Match
+
+TLoader = Callable[[], Awaitable[bytes]]
+
+HOST = "cev.eu" # and its subdomains (www., championsleague., ...)
+
+
+class SharedCache:
+    """
+    serialised responses by key. concurrent requests for the same key share one
+    upstream request, the result is kept for ttl seconds. at most maxEntries
+    (loaded) responses are kept, the least recently used are dropped first
+    """
+    def __init__(self, ttl: float = 30, maxEntries: int = 256) -> None:
+        self._ttl = ttl
+        self._maxEntries = maxEntries
+        # in order of use (least recently used first)
+        self._entries: Dict[str, Tuple[float, asyncio.Future[bytes]]] = { }
+
+    def _prune(self, now: float) -> None:
+        for key in [ key for key, (expires, future) in self._entries.items()
+                     if future.done() and expires <= now ]:
+            del self._entries[key]
+        # requests still running aren't dropped, they are shared by their clients
+        loaded = [ key for key, (_, future) in self._entries.items() if future.done() ]
+        for key in loaded[:max(0, len(self._entries) - self._maxEntries + 1)]:
+            del self._entries[key]
+
+    async def _load(self, key: str, loader: TLoader) -> bytes:
+        body = await loader()
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries[key] = (asyncio.get_running_loop().time() + self._ttl, entry[1])
+        return body
+
+    async def get(self, key: str, loader: TLoader) -> bytes:
+        """cached body of key (loads it if missing or expired)"""
+        now = asyncio.get_running_loop().time()
+        entry = self._entries.get(key)
+        hit = entry is not None and (not entry[1].done() or now < entry[0])
+        metrics.cacheLookup("gateway", hit)
+        if entry is not None and hit:
+            self._entries[key] = self._entries.pop(key) # most recently used
+        else:
+            self._prune(now)
+            # expires once loaded (float("inf") while the request is running)
+            entry = (float("inf"), asyncio.ensure_future(self._load(key, loader)))
+            self._entries[key] = entry
+        try:
+            return await asyncio.shield(entry[1])
+        except Exception:
+            if self._entries.get(key) is entry:
+                del self._entries[key] # failures aren't cached
+            raise
+
+    def clear(self) -> None:
+        """drops all entries"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _matchesToJson(matches: List[CalendarMatch]) -> bytes:
+    return dumpsArray(dumps(match.toJson()) for match in matches)
+
+def _eventToBytes(event: live.LiveEvent) -> bytes:
+    return dumps(event.toJson())
+
+
+class Gateway:
+    """serves cevlib data to many clients (create the app with .app())"""
+    def __init__(self, ttl: float = 30, liveInterval: Optional[float] = None,
+                 maxEntries: int = 256) -> None:
+        self._cache = SharedCache(ttl, maxEntries)
+        self._liveInterval = liveInterval
+
+    @property
+    def cache(self) -> SharedCache:
+        """shared response cache"""
+        return self._cache
+
+    def app(self) -> web.Application:
+        """aiohttp application"""
+        app = web.Application()
+        app.add_routes([ web.get("/match", self._match),
+                         web.get("/competition", self._competition),
+                         web.get("/calendar", self._calendar),
+                         web.get("/calendar/upcoming", self._upcoming),
+                         web.get("/calendar/recent", self._recent),
+                         web.get("/live", self._snapshot),
+                         web.get("/live/events", self._events),
+                         web.get("/live/ws", self._websocket) ])
+        app.on_startup.append(self._startLive)
+        app.on_cleanup.append(self._stopLive)
+        return app
+
+    def run(self, host: str = "127.0.0.1", port: int = 8080) -> None:
+        """runs the gateway (blocking)"""
+        web.run_app(self.app(), host = host, port = port)
+
+    async def _startLive(self, _: web.Application) -> None:
+        if self._liveInterval is not None:
+            live.setRefreshInterval(self._liveInterval)
+        live.feed().start()
+
+    async def _stopLive(self, _: web.Application) -> None:
+        live.feed().stop()
+
+    async def _respond(self, key: str, loader: TLoader) -> web.Response:
+        try:
+            body = await self._cache.get(key, loader)
+        except Exception as exc: # pylint: disable=broad-except
+            error = dumpsObject([ ("error", dumps(str(exc))) ]).decode("utf-8")
+            raise web.HTTPBadGateway(text = error, content_type = "application/json")
+        return web.Response(body = body, content_type = "application/json")
+
+    @staticmethod
+    def _query(request: web.Request, name: str) -> str:
+        value = request.query.get(name)
+        if not value:
+            raise web.HTTPBadRequest(text = f"missing query parameter '{name}'")
+        return value
+
+    @staticmethod
+    def _cevUrl(request: web.Request) -> str:
+        # the url query parameter, if it's a cev.eu link (as https://<host>/<path>)
+        url = Gateway._query(request, "url")
+        try:
+            parts = urlsplit(url)
+            port = parts.port
+        except ValueError as exc:
+            raise web.HTTPBadRequest(text = "url must be a https link of cev.eu") from exc
+        host = parts.hostname or ""
+        if parts.scheme != "https" or not (host == HOST or host.endswith("." + HOST)) or \
+           port is not None or parts.username is not None or not parts.path.startswith("/"):
+            raise web.HTTPBadRequest(text = "url must be a https link of cev.eu")
+        return f"https://{host}{parts.path}"
+
+    async def _match(self, request: web.Request) -> web.Response:
+        url = self._cevUrl(request)
+        async def load() -> bytes:
+            return (await (await Match.byUrl(url)).cache()).toJsonBytes()
+        return await self._respond(f"match:{url}", load)
+
+    async def _competition(self, request: web.Request) -> web.Response:
+        url = self._cevUrl(request)
+        async def load() -> bytes:
+            return dumps((await Competition.fromUrl(url)).toJson())
+        return await self._respond(f"competition:{url}", load)
+
+    async def _calendar(self, request: web.Request) -> web.Response:
+        try:
+            month = int(request.query["month"]) if "month" in request.query else None
+            year = int(request.query["year"]) if "year" in request.query else None
+        except ValueError as exc:
+            raise web.HTTPBadRequest(text = "month and year must be numbers") from exc
+        async def load() -> bytes:
+            return _matchesToJson(await Calendar.matchesOfMonth(month, year))
+        return await self._respond(f"calendar:{month}:{year}", load)
+
+    async def _upcoming(self, _: web.Request) -> web.Response:
+        async def load() -> bytes:
+            return _matchesToJson(await Calendar.upcomingMatches())
+        return await self._respond("calendar:upcoming", load)
+
+    async def _recent(self, _: web.Request) -> web.Response:
+        async def load() -> bytes:
+            return _matchesToJson(await Calendar.recentMatches())
+        return await self._respond("calendar:recent", load)
+
+    async def _snapshot(self, _: web.Request) -> web.Response:
+        # served from the shared loop, never requests cev.eu itself
+        body = dumpsObject((str(matchId), dumps(match.toJson()))
+                           for matchId, match in live.feed().snapshot.items())
+        return web.Response(body = body, content_type = "application/json")
+
+    async def _events(self, request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(headers = { "Content-Type": "text/event-stream",
+                                                  "Cache-Control": "no-cache" })
+        await response.prepare(request)
+        stream = live.stream()
+        try:
+            async for event in stream:
+                await response.write(b"event: " + event.type.value.encode("utf-8") +
+                                     b"\ndata: " + _eventToBytes(event) + b"\n\n")
+        except ConnectionResetError:
+            pass # client disconnected
+        finally:
+            await stream.aclose() # type: ignore
+        return response
+
+    async def _websocket(self, request: web.Request) -> web.WebSocketResponse:
+        socket = web.WebSocketResponse()
+        await socket.prepare(request)
+
+        async def push() -> None:
+            async for event in live.stream():
+                await socket.send_str(_eventToBytes(event).decode("utf-8"))
+
+        pushTask = asyncio.create_task(push())
+        try:
+            async for _ in socket:
+                pass # clients don't send anything, this only waits for the close
+        finally:
+            pushTask.cancel()
+            # retrieves the exception of a failed send (the client is gone)
+            await asyncio.gather(pushTask, return_exceptions = True)
+        return socket
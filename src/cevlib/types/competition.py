@@ -3,14 +3,22 @@
 from __future__ import annotations
 __copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
 
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from cevlib.helpers.dictTool import DictEx
 
+from cevlib.types import entities
 from cevlib.types.iType import IType, JObject
 from cevlib.types.types import CompetitionGender
 
 
+def _restore(state: Dict[str, Any]) -> MatchCompetition:
+    # unpickling (e.g. a parse pool result) interns into the store of this process
+    competition = MatchCompetition.__new__(MatchCompetition)
+    competition.__dict__.update(state)
+    return entities.canonicalCompetition(competition)
+
+
 class MatchCompetition(IType):
     """a match's competition info"""
     def __init__(self, data: JObject) -> None:
@@ -50,6 +58,9 @@ class MatchCompetition(IType):
             "CompetitionLogo": logo
         })
 
+    def __reduce__(self) -> Tuple[Callable[..., MatchCompetition], Tuple[Any, ...]]:
+        return _restore, (self.__dict__,)
+
     @property
     def name(self) -> str:
         """competition name"""
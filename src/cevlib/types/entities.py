@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""cevlib"""
+from __future__ import annotations
+__copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
+
+# canonical teams, players and competitions.
+# the same clubs appear in every calendar month, form list and draw. models that only
+# reference them share one instance per entity instead of allocating one per appearance.
+# models built in worker processes of the parse pool are interned into the store of the
+# parent when they are unpickled (teams, players and competitions pickle themselves
+# through it), so the pool doesn't bypass the store.
+#
+# sharing is opt-in: setStore(EntityStore()). the store only holds weak references, an
+# entity is dropped once no model uses it. shared instances are shared by every model that
+# references them, they are never modified (treat them as read-only): an appearance that
+# knows more (e.g. the logo, or the id of a team known by name) gets a new instance, which
+# replaces the old one in the store. models built before keep theirs unchanged.
+
+from typing import TYPE_CHECKING, Hashable, List, Optional, Tuple
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:
+    from cevlib.types.competition import MatchCompetition
+    from cevlib.types.team import Player, TeamRef
+
+
+class EntityStore:
+    """
+    team references by id (by name if the id is unknown), players without match stats
+    and competitions by their values (weakly referenced, as long as they are in use)
+    """
+    def __init__(self) -> None:
+        self._teamsById: WeakValueDictionary[int, TeamRef] = WeakValueDictionary()
+        self._teamsByName: WeakValueDictionary[Optional[str], TeamRef] = WeakValueDictionary()
+        self._players: WeakValueDictionary[Hashable, Player] = WeakValueDictionary()
+        self._competitions: WeakValueDictionary[Tuple[Hashable, ...], MatchCompetition] = WeakValueDictionary() # pylint: disable=line-too-long
+
+    @property
+    def teams(self) -> List[TeamRef]:
+        """all canonical teams"""
+        # teams with an id are indexed by their name as well
+        return list(self._teamsById.values()) + \
+               [ team for team in self._teamsByName.values() if not team.id ]
+
+    @property
+    def players(self) -> List[Player]:
+        """all canonical players"""
+        return list(self._players.values())
+
+    @property
+    def competitions(self) -> List[MatchCompetition]:
+        """all canonical competitions"""
+        return list(self._competitions.values())
+
+    def team(self, id_: Optional[int], name: Optional[str]) -> Optional[TeamRef]:
+        """the canonical team (None if it hasn't been added yet)"""
+        if id_:
+            team = self._teamsById.get(id_)
+            if team is not None:
+                return team
+        team = self._teamsByName.get(name)
+        # a team known by its name only is the same team once its id is known
+        if team is not None and (not id_ or not team.id):
+            return team
+        return None
+
+    def addTeam(self, team: TeamRef) -> TeamRef:
+        """adds (or replaces) the canonical team"""
+        if team.id:
+            self._teamsById[team.id] = team
+        self._teamsByName[team.name] = team
+        return team
+
+    def player(self, player: Player) -> Player:
+        """
+        the canonical player (players with match stats are never shared).
+        one per player id, a player that changed (e.g. the number) replaces it
+        """
+        if player.stats is not None:
+            return player
+        values = (player.id, player.name, player.number, player.position, player.zone,
+                  player.image, player.isCaptain)
+        key: Hashable = player.id or values
+        known = self._players.get(key)
+        if known is not None and values == (known.id, known.name, known.number, known.position,
+                                            known.zone, known.image, known.isCaptain):
+            return known
+        self._players[key] = player
+        return player
+
+    def competition(self, competition: MatchCompetition) -> MatchCompetition:
+        """the canonical competition"""
+        key = (competition.name, competition.gender, competition.groupPool, competition.leg,
+               competition.phase, competition.season, competition.matchNumber, competition.logo)
+        return self._competitions.setdefault(key, competition)
+
+    def clear(self) -> None:
+        """drops all entities"""
+        self._teamsById.clear()
+        self._teamsByName.clear()
+        self._players.clear()
+        self._competitions.clear()
+
+    def __len__(self) -> int:
+        return len(self.teams) + len(self._players) + len(self._competitions)
+
+
+_store: Optional[EntityStore] = None # pylint: disable=invalid-name
+
+
+def getStore() -> Optional[EntityStore]:
+    """the store in use (None if entities aren't shared)"""
+    return _store
+
+def setStore(store: Optional[EntityStore]) -> Optional[EntityStore]:
+    """replaces the store (None: every appearance gets its own instance), returns the previous one""" # pylint: disable=line-too-long
+    global _store # pylint: disable=global-statement
+    previous = _store
+    _store = store
+    return previous
+
+def canonicalPlayer(player: Player) -> Player:
+    """the canonical player (player itself if no store is used)"""
+    return _store.player(player) if _store is not None else player
+
+def canonicalCompetition(competition: MatchCompetition) -> MatchCompetition:
+    """the canonical competition (competition itself if no store is used)"""
+    return _store.competition(competition) if _store is not None else competition
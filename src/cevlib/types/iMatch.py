@@ -1,20 +1,23 @@
 # -*- coding: utf-8 -*-
 """cevlib"""
+from __future__ import annotations
 __copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
 
 from abc import abstractmethod
 from datetime import datetime, timedelta
-from typing import Any, Coroutine, List, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Coroutine, List, Optional, TypeVar, Union
 
-from cevlib.types.competition import MatchCompetition
 from cevlib.types.iType import IType
-from cevlib.types.playByPlay import PlayByPlay
-from cevlib.types.results import Result
-from cevlib.types.team import Team
-from cevlib.types.types import MatchState
-from cevlib.types.stats import TopPlayers
-from cevlib.types.report import MatchReport
-from cevlib.types.info import Info
+
+if TYPE_CHECKING:
+    from cevlib.types.competition import MatchCompetition
+    from cevlib.types.playByPlay import PlayByPlay
+    from cevlib.types.results import Result
+    from cevlib.types.team import TeamRef
+    from cevlib.types.types import MatchState
+    from cevlib.types.stats import TopPlayers
+    from cevlib.types.report import MatchReport
+    from cevlib.types.info import Info
 
 
 T = TypeVar("T")
@@ -36,11 +39,11 @@ class IMatch(IType):
         """competition"""
 
     @abstractmethod
-    def homeTeam(self) -> FunOrProp[Team]:
+    def homeTeam(self) -> FunOrProp[TeamRef]:
         """home team"""
 
     @abstractmethod
-    def awayTeam(self) -> FunOrProp[Team]:
+    def awayTeam(self) -> FunOrProp[TeamRef]:
         """away team"""
 
     @abstractmethod
@@ -5,12 +5,16 @@ __copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
 from abc import ABC, abstractmethod
 from typing import Any, Coroutine, Dict, List, Union
 
+from cevlib.helpers.jsonTool import dumps
+
 
 JObject = Dict[str, Any]
 JArray = List[Dict[str, Any]]
 
 class IType(ABC):
     """model interface"""
+    __slots__ = ( )
+
     @property
     @abstractmethod
     def valid(self) -> bool:
@@ -26,3 +30,7 @@ class IType(ABC):
                           Coroutine[Any, Any, JObject],
                           Coroutine[Any, Any, JArray]]:
         """serialise"""
+
+    def toJsonBytes(self) -> Union[bytes, Coroutine[Any, Any, bytes]]:
+        """serialise directly to (utf-8 encoded) json, equivalent to toJson()"""
+        return dumps(self.toJson())
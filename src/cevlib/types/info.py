@@ -1,20 +1,29 @@
 # -*- coding: utf-8 -*-
 """cevlib"""
+from __future__ import annotations
 __copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
 
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 import re
 
-from bs4 import BeautifulSoup # type: ignore
-from bs4.element import Tag # type: ignore
+from cevlib.helpers import htmlParser, metrics
+from cevlib.helpers.jsonTool import dumps
 
 from cevlib.types.iType import IType, JObject
 
+if TYPE_CHECKING:
+    from bs4.element import Tag
+
+
+def _string(tag: Any) -> Optional[str]:
+    # plain str, a NavigableString would keep the whole document alive (and pickle it)
+    return str(tag.string) if tag.string is not None else None
+
 
 class Referee(IType):
     """referee"""
     def __init__(self, tag: Tag) -> None:
-        self._type = tag.find("div", class_="u-border-grey-light").string
+        self._type = _string(tag.find("div", class_="u-border-grey-light"))
         imgStyle = tag.find("div", class_="accordion-content__image").get("style")
         imgMatch: Optional[re.Match[str]] = re.search(r"https:\/\/([\w_-]+(?:(?:\.[\w_-]+)+))([\w.,@;?^=%&:\/~+#-]*Images\/Officials\/[\w .,@;?^=%&:\/~+#-]*[\w@?^=%&\/~+#-])", # pylint: disable=line-too-long
                                                       imgStyle)
@@ -23,11 +32,26 @@ class Referee(IType):
         nameAndNat = tag.find("div", class_="accordion-content__item")
         name = nameAndNat.find("div")
 
-        self._name = name.string
+        self._name = _string(name)
         name.decompose()
 
         nat = nameAndNat.find("div")
-        self._nationality = nat.string
+        self._nationality = _string(nat)
+
+    @property
+    def name(self) -> Optional[str]:
+        """referee's name"""
+        return self._name
+
+    @property
+    def type(self) -> Optional[str]:
+        """role (e.g. 1st Referee)"""
+        return self._type
+
+    @property
+    def nationality(self) -> Optional[str]:
+        """referee's nationality"""
+        return self._nationality
 
     def __repr__(self) -> str:
         return f"(cevlib.types.info.Referee) {self._name} {self._type} ({self._nationality}) {self._img}" # pylint: disable=line-too-long
@@ -84,11 +108,13 @@ def _getAccordionTitle(tag: Tag) -> Optional[str]:
 class Info(IType):
     """match info"""
     def __init__(self, html: str) -> None:
-        soup = BeautifulSoup(html, "html.parser")
+        with metrics.measure("htmlParse", "Info", len(html)):
+            soup = htmlParser.parse(html)
         infoText = soup.find("div", class_="text-container")
         self._infoText = infoText.get_text(strip=True, separator='<br>') if infoText else None
         self._officials: List[Referee] = [ ]
         self._venue: Optional[Venue] = None
+        self._jsonBytes: Optional[bytes] = None
 
         infoContainer = soup.find("div", class_="match-info")
         if not infoContainer:
@@ -101,6 +127,16 @@ class Info(IType):
             if _getAccordionTitle(infoItem) == "How To Attend":
                 self._venue = Venue(infoItem)
 
+    @property
+    def officials(self) -> List[Referee]:
+        """referees and other officials"""
+        return self._officials
+
+    @property
+    def venue(self) -> Optional[Venue]:
+        """venue (if listed)"""
+        return self._venue
+
     def __repr__(self) -> str:
         return f"(cevlib.types.info.Info) {self._infoText} {self._officials} {self._venue}"
 
@@ -114,3 +150,9 @@ class Info(IType):
             "officials": [ official.toJson() for official in self._officials ],
             "venue": self._venue.toJson() if self._venue else None
         }
+
+    def toJsonBytes(self) -> bytes:
+        # parsed from a static html page
+        if self._jsonBytes is None:
+            self._jsonBytes = dumps(self.toJson())
+        return self._jsonBytes
@@ -3,9 +3,10 @@
 from __future__ import annotations
 __copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
 
-from typing import List
+from typing import List, Optional
 
 from cevlib.helpers.dictTool import DictEx, ListEx
+from cevlib.helpers.jsonTool import dumps
 
 from cevlib.types.iType import IType, JObject
 from cevlib.types.results import SetResult
@@ -50,6 +51,16 @@ class Play(IType):
         """player that performed that play"""
         return self._playerName
 
+    @property
+    def playerNumber(self) -> int:
+        """number of that player"""
+        return self._playerNumber
+
+    @property
+    def isHome(self) -> bool:
+        """performed by the home team"""
+        return self._isHome
+
     def __repr__(self) -> str:
         return f"(cevlib.types.playByPlay.Play) {self._type} {self._currentScore} by {self._playerName}" # pylint: disable=line-too-long
 
@@ -90,6 +101,7 @@ class PlayByPlay(IType):
     def __init__(self, data: JObject) -> None:
         self._sets = [ Set(playEvent)
                        for playEvent in DictEx(data).ensure("PlayEvents", list) ]
+        self._jsonBytes: Optional[bytes] = None
 
     @property
     def valid(self) -> bool:
@@ -105,5 +117,11 @@ class PlayByPlay(IType):
             "sets": [ set_.toJson() for set_ in self.sets ]
         }
 
+    def toJsonBytes(self) -> bytes:
+        # plays never change once they are recorded
+        if self._jsonBytes is None:
+            self._jsonBytes = dumps(self.toJson())
+        return self._jsonBytes
+
     def __repr__(self) -> str:
         return f"(cevlib.types.playByPlay.PlayByPlay) {self._sets}"
@@ -3,21 +3,28 @@
 from __future__ import annotations
 __copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
 
-from typing import List, Optional, Union
-from bs4 import BeautifulSoup # type: ignore
-from bs4.element import Tag, NavigableString # type: ignore
+from typing import TYPE_CHECKING, List, Optional, Union
+
+from cevlib.helpers import htmlParser, metrics
+from cevlib.helpers.jsonTool import dumps
 
 from cevlib.types.iType import IType, JObject
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+    from bs4.element import Tag, NavigableString
+
 
 class MatchReport(IType):
     """match report"""
     def __init__(self, html: str) -> None:
-        soup = BeautifulSoup(html, "html.parser")
+        with metrics.measure("htmlParse", "MatchReport", len(html)):
+            soup = htmlParser.parse(html)
         self._quotes: List[MatchQuote] = [ ]
         self._inNumbers: List[MatchInNumber]  = [ ]
         self._body: Optional[str] = None
         self._headline: Optional[str] = None
+        self._jsonBytes: Optional[bytes] = None
         try:
             matchReport = soup.find("div", class_="match-report")
             try:
@@ -40,12 +47,18 @@ class MatchReport(IType):
 
     def toJson(self) -> JObject:
         return {
-            "headline": self.headline,
-            "body": self.body,
-            "quotes": [ quote.toJson() for quote in self.quotes ],
-            "inNumbers": [ inNumber.toJson() for inNumber in self.inNumbers ]
+            "headline": self._headline,
+            "body": self._body,
+            "quotes": [ quote.toJson() for quote in self._quotes ],
+            "inNumbers": [ inNumber.toJson() for inNumber in self._inNumbers ]
         }
 
+    def toJsonBytes(self) -> bytes:
+        # parsed from a static html page
+        if self._jsonBytes is None:
+            self._jsonBytes = dumps(self.toJson())
+        return self._jsonBytes
+
     @property
     def headline(self) -> Optional[str]:
         """headline"""
@@ -89,9 +102,9 @@ class MatchInNumber(IType):
 
     def toJson(self) -> JObject:
         return {
-            "title": self.title,
-            "description": self.description,
-            "value": self.value
+            "title": self._title,
+            "description": self._description,
+            "value": self._value
         }
 
     @property
@@ -141,9 +154,9 @@ class MatchQuote(IType):
 
     def toJson(self) -> JObject:
         return {
-            "quote": self.quote,
-            "cite": self.cite,
-            "citeDescription": self.citeDescription
+            "quote": self._quote,
+            "cite": self._cite,
+            "citeDescription": self._citeDescription
         }
 
     @property
@@ -4,9 +4,10 @@ from __future__ import annotations
 __copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
 
 import re
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from cevlib.helpers.dictTool import DictEx, ListEx
+from cevlib.helpers.jsonTool import dumps, dumpsArray, dumpsObject
 
 from cevlib.types.iType import IType, JArray, JObject
 
@@ -19,6 +20,16 @@ class SetResult(IType):
         self._awayScore: int = dex.ensure("awayScore", int)
         self._setNumber: int = dex.ensure("setNumber", int)
         self._isInPlay: bool = dex.ensure("isInPlay", bool)
+        self._key = (self._homeScore, self._awayScore, self._setNumber, self._isInPlay)
+        self._jsonBytes: Optional[bytes] = None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SetResult):
+            return False
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
 
     def toJson(self) -> JObject:
         return {
@@ -28,6 +39,11 @@ class SetResult(IType):
             "isInPlay": self.isInPlay
         }
 
+    def toJsonBytes(self) -> bytes:
+        if self._jsonBytes is None:
+            self._jsonBytes = dumps(self.toJson())
+        return self._jsonBytes
+
     @property
     def valid(self) -> bool:
         return None not in (self._homeScore, self._awayScore, self._setNumber, self._isInPlay)\
@@ -90,11 +106,20 @@ class Result(IType):
         self._hasGoldenSet: bool = dex.ensure("hasGoldenSet", bool)
         self._homeScore: int = dex.ensure("homeSetsWon", int)
         self._awayScore: int = dex.ensure("awaySetsWon", int)
+        # results never change after parsing, the key covers everything toJson() exposes
+        self._key: Tuple[object, ...] = (self._hasGoldenSet,
+                                         self._homeScore,
+                                         self._awayScore,
+                                         tuple(set_._key for set_ in self._sets))
+        self._jsonBytes: Optional[bytes] = None
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Result):
             return False
-        return self.toJson() == other.toJson()
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
 
     def toJson(self) -> JObject:
         return {
@@ -106,6 +131,20 @@ class Result(IType):
             "awayScore": self.awayScore
         }
 
+    def toJsonBytes(self) -> bytes:
+        # results are immutable snapshots, so are their serialised sets
+        if self._jsonBytes is None:
+            sets = [ set_.toJsonBytes() for set_ in self._sets ]
+            regularSets = sets[:-1] if self._hasGoldenSet else sets
+            goldenSet = sets[-1] if self._hasGoldenSet and sets else b"null"
+            self._jsonBytes = dumpsObject([ ("hasGoldenSet", dumps(self._hasGoldenSet)),
+                                            ("sets", dumpsArray(sets)),
+                                            ("regularSets", dumpsArray(regularSets)),
+                                            ("goldenSet", goldenSet),
+                                            ("homeScore", dumps(self._homeScore)),
+                                            ("awayScore", dumps(self._awayScore)) ])
+        return self._jsonBytes
+
     @staticmethod
     def parseFromForm(data: JObject) -> Result:
         """parses from form match"""
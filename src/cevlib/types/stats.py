@@ -3,7 +3,7 @@
 from __future__ import annotations
 __copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from cevlib.helpers.dictTool import DictEx
 
@@ -136,13 +136,13 @@ class PlayerStatistic(IType):
 
     def toJson(self) -> JObject:
         return {
-            "points": self.points,
-            "serves": self.serves,
-            "spikes": self.spikes,
-            "blocks": self.blocks,
-            "receptions": self.receptions,
-            "spikePercentage": self.spikePercentage,
-            "receptionPercentage": self.receptionPercentage
+            "points": self._points,
+            "serves": self._serves,
+            "spikes": self._spikes,
+            "blocks": self._blocks,
+            "receptions": self._receptions,
+            "spikePercentage": self._spikePerc,
+            "receptionPercentage": self._receptionPerc
         }
 
     @property
@@ -191,6 +191,35 @@ class PlayerStatistic(IType):
         return f"(cevlib.types.stats.PlayerStatistic) Spikes: {self._spikes} Blocks: {self._blocks} Points: {self._points} Serves: {self._serves} Receptions: {self._receptions}" # pylint: disable=line-too-long
 
 
+class PlayerStatisticIndex:
+    """all player stats rows of a match, indexed by the player number"""
+    def __init__(self, players: JArray) -> None:
+        self._byNumber: Dict[int, List[Tuple[str, JObject]]] = { }
+        for player in players:
+            dex = DictEx(player)
+            self._byNumber.setdefault(dex.ensure("PlayerNumber", int), [ ]) \
+                          .append((dex.ensure("Name", str).title(), player))
+
+    @staticmethod
+    def parse(data: JObject) -> PlayerStatisticIndex:
+        """parses the player stats component (rows of both teams)"""
+        players: JArray = [ ]
+        for team in data.get("Teams") or [ ]:
+            players.extend(team.get("Players"))
+        return PlayerStatisticIndex(players)
+
+    def find(self, name: str, number: int) -> Optional[PlayerStatistic]:
+        """stats of a player (the name only tells players sharing a number apart)"""
+        firstName = name.split(" ")[0]
+        for statsName, player in self._byNumber.get(number, ()):
+            if firstName in statsName:
+                return PlayerStatistic(player)
+        return None
+
+    def __repr__(self) -> str:
+        return f"(cevlib.types.stats.PlayerStatisticIndex) {len(self._byNumber)} numbers"
+
+
 class TopPlayerPlayer(IType):
     """one of the top players of a TopPlayerType"""
     def __init__(self, data: JObject) -> None:
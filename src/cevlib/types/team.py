@@ -4,20 +4,28 @@ from __future__ import annotations
 __copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from cevlib.helpers.dictTool import DictEx, ListEx
 
+from cevlib.types import entities
 from cevlib.types.iType import IType, JArray, JObject
 from cevlib.types.matchPoll import TeamPoll
-from cevlib.types.stats import PlayerStatistic, TeamStatistics
+from cevlib.types.stats import PlayerStatistic, PlayerStatisticIndex, TeamStatistics
 from cevlib.types.types import Position, Zone
 from cevlib.types.results import Result
 
 
+def _restorePlayer(state: Dict[str, Any]) -> Player:
+    # unpickling (e.g. a parse pool result) interns into the store of this process
+    player = Player.__new__(Player)
+    player.__dict__.update(state)
+    return entities.canonicalPlayer(player)
+
+
 class Player(IType):
     """player model"""
-    def __init__(self, data: JObject, playerStatsData: JArray) -> None:
+    def __init__(self, data: JObject, playerStatsData: Union[JArray, PlayerStatisticIndex]) -> None:
         dex = DictEx(data)
         self._number = dex.ensure("Number", int)
         self._name = dex.ensure("Name", str, "N/A").title()
@@ -26,18 +34,17 @@ class Player(IType):
         self._isCaptain = dex.ensure("isCaptain", bool)
         self._zone = Zone.parse(dex.ensure("PositionNumber", int))
         self._id = dex.ensure("PlayerId", int)
-        self._stats: Optional[PlayerStatistic] = None
-        for value in playerStatsData:
-            player = DictEx(value)
-            if self._name.split(" ")[0] in player.ensure("Name", str).title() and \
-               player.ensure("PlayerNumber", int) == self._number:
-                self._stats = PlayerStatistic(player)
-                break
+        if not isinstance(playerStatsData, PlayerStatisticIndex):
+            playerStatsData = PlayerStatisticIndex(playerStatsData)
+        self._stats: Optional[PlayerStatistic] = playerStatsData.find(self._name, self._number)
 
     @property
     def valid(self) -> bool:
         return self._id is not None
 
+    def __reduce__(self) -> Tuple[Callable[..., Player], Tuple[Any, ...]]:
+        return _restorePlayer, (self.__dict__,)
+
     def toJson(self) -> JObject:
         return {
             "zone": self.zone.value,
@@ -73,6 +80,16 @@ class Player(IType):
         """the player's number"""
         return self._number
 
+    @property
+    def image(self) -> Optional[str]:
+        """the player's image (link)"""
+        return self._image
+
+    @property
+    def isCaptain(self) -> bool:
+        """whether the player is the team's captain"""
+        return self._isCaptain
+
     @property
     def stats(self) -> Optional[PlayerStatistic]:
         """the player's stats"""
@@ -82,13 +99,135 @@ class Player(IType):
         return f"(cevlib.types.team.Player) {self._name} ({self._number}/{self._id}) {self._position} ({self._zone})" # pylint: disable=line-too-long
 
 
+_UNKNOWN = (None, "", "N/A") # team codes
+
+
+class TeamRef(IType):
+    """
+    a team as calendar matches, form matches and draws know it (name, logo, code, id).
+    promote() builds a full Team
+    """
+    __slots__ = ("_name", "_logo", "_nickname", "_id", "__weakref__") # see entities
+
+    def __init__(self,
+                 name: Optional[str],
+                 logo: Optional[str],
+                 code: Optional[str],
+                 id_: Optional[int] = 0) -> None:
+        self._name = name
+        self._logo = logo
+        self._nickname = code
+        self._id = id_
+
+    @staticmethod
+    def canonical(name: str, logo: str, code: str, id_: int = 0) -> TeamRef:
+        """
+        the canonical team reference (see cevlib.types.entities, a new one without store).
+        it's shared by every model that references the team, don't modify it
+        """
+        store = entities.getStore()
+        if store is None:
+            return TeamRef(name, logo, code, id_)
+        known = store.team(id_, name)
+        if known is None:
+            return store.addTeam(TeamRef(name, logo, code, id_))
+        merged = known._merge(name, logo, code, id_) # pylint: disable=protected-access
+        return known if merged is None else store.addTeam(merged)
+
+    def __reduce__(self) -> Tuple[Callable[..., TeamRef], Tuple[Any, ...]]:
+        # unpickling (e.g. a parse pool result) interns into the store of this process
+        return TeamRef.canonical, (self._name, self._logo, self._nickname, self._id)
+
+    def _merge(self,
+               name: Optional[str],
+               logo: Optional[str],
+               code: Optional[str],
+               id_: Optional[int]) -> Optional[TeamRef]:
+        # an appearance completed by what this (canonical) team knows, None if it's this team.
+        # appearances differ in what they know (e.g. draws have no code). the canonical
+        # team is shared, it's replaced instead of modified
+        merged = (name,
+                  self._logo if not logo and self._logo else logo,
+                  self._nickname if code in _UNKNOWN and self._nickname not in _UNKNOWN else code,
+                  id_ or self._id)
+        if merged == (self._name, self._logo, self._nickname, self._id):
+            return None
+        return TeamRef(*merged)
+
+    def promote(self, home: bool = True) -> Team:
+        """a full team (without stats, players, poll and form)"""
+        # empty statistics don't depend on home
+        return Team({ "TeamLogo": {
+                            "AltText": self._name,
+                            "Url": self._logo
+                        }
+                    }, { }, TeamStatistics({ }, home), [ ], { },
+                    self._logo, self._nickname, self._id or 0)
+
+    def toJson(self) -> JObject:
+        # same shape as Team.toJson()
+        return {
+            "name": self.name,
+            "nickname": self.nickname,
+            "logo": self.logo,
+            "id": self.id,
+            "stats": { "setStats": [ ] },
+            "poll": None,
+            "form": [ ],
+            "players": [ ]
+        }
+
+    @property
+    def valid(self) -> bool:
+        return None not in (self._name, self._id)
+
+    def __repr__(self) -> str:
+        return f"(cevlib.types.team.TeamRef) {self._name} ({self._nickname}/{self._id})"
+
+    def __eq__(self, other: object) -> bool:
+        # by id if both know it, by name otherwise. there's no key consistent with that
+        # (the same id may come with different names), so teams aren't hashable
+        if not isinstance(other, TeamRef):
+            return False
+        if self._id and other._id:
+            return self._id == other._id
+        return self._name == other._name
+
+    __hash__ = None # type: ignore
+
+    @property
+    def name(self) -> Optional[str]:
+        """the team's name"""
+        return self._name
+
+    @property
+    def nickname(self) -> Optional[str]:
+        """the team's nickname (3 chars)"""
+        return self._nickname
+
+    @property
+    def code(self) -> Optional[str]:
+        """the team's (club) code, same as nickname"""
+        return self._nickname
+
+    @property
+    def logo(self) -> Optional[str]:
+        """the team's logo (link)"""
+        return self._logo
+
+    @property
+    def id(self) -> Optional[int]:
+        """the team's id"""
+        return self._id
+
+
 class FormMatch(IType):
     """a very minimal match that is part of a team's 'form'"""
     def __init__(self,
                  won: bool,
                  link: str,
-                 homeTeam: Team,
-                 awayTeam: Team,
+                 homeTeam: TeamRef,
+                 awayTeam: TeamRef,
                  result: Result,
                  startTime: datetime) -> None:
         self._won = won
@@ -127,12 +266,12 @@ class FormMatch(IType):
                 break
             matches.append(FormMatch(data["RecentForm"][index],
                                     match["MatchCentreUrl"],
-                                    Team.build(match["HomeTeam"]["Name"],
-                                                match["HomeTeam"]["Logo"]["Url"],
-                                                "N/A", True),
-                                    Team.build(match["AwayTeam"]["Name"],
-                                                match["AwayTeam"]["Logo"]["Url"],
-                                                "N/A", False),
+                                    TeamRef.canonical(match["HomeTeam"]["Name"],
+                                                      match["HomeTeam"]["Logo"]["Url"],
+                                                      "N/A"),
+                                    TeamRef.canonical(match["AwayTeam"]["Name"],
+                                                      match["AwayTeam"]["Logo"]["Url"],
+                                                      "N/A"),
                                     Result.parseFromForm(match),
                                     datetime.strptime(match["MatchDateTime"], "%Y-%m-%dT%H:%M:%S")))
         return matches
@@ -145,11 +284,18 @@ class FormMatch(IType):
         return f"(cevlib.types.team.FormMatch) {self._won} ({self._link})"
 
 
-class Team(IType):
+def _restoreTeam(state: Dict[str, Any]) -> Team:
+    team = Team.__new__(Team)
+    for name, value in state.items():
+        setattr(team, name, value)
+    return team
+
+
+class Team(TeamRef):
     """team"""
     def __init__(self,
             data: JObject,
-            playerStatsData: JObject,
+            playerStatsData: Union[JObject, PlayerStatisticIndex],
             stats: TeamStatistics,
             matchPollData: JArray,
             form: JObject,
@@ -159,16 +305,16 @@ class Team(IType):
         dex = DictEx(data)
         pollData = ListEx(matchPollData)
         self._stats = stats
-        playerStatsList: JArray = [ ]
-        for team in playerStatsData.get("Teams") or [ ]:
-            playerStatsList.extend(team.get("Players"))
+        # built once per match by Match, so both teams share the index
+        playerStatsList = playerStatsData if isinstance(playerStatsData, PlayerStatisticIndex) \
+                          else PlayerStatisticIndex.parse(playerStatsData)
 
         teamLogo = dex.ensure("TeamLogo", DictEx)
         self._form = FormMatch.parse(form)
-        self._nickname: Optional[str] = nickname
-        self._name: Optional[str] = teamLogo.tryGet("AltText", str)
-        self._logo: Optional[str] = icon or teamLogo.tryGet("Url", str)
-        self._id: Optional[int] = id_ or dex.ensure("TeamId", int)
+        super().__init__(teamLogo.tryGet("AltText", str),
+                         icon or teamLogo.tryGet("Url", str),
+                         nickname,
+                         id_ or dex.ensure("TeamId", int))
 
         self._poll: Optional[TeamPoll] = None
         if len(pollData) == 2:
@@ -177,29 +323,21 @@ class Team(IType):
                 team = pollData.ensure(1, DictEx)
             self._poll = TeamPoll(team)
 
-        self._players: List[Player] = [ ]
+        players: List[JObject] = [ ]
         if "TopLeftPlayer" in data: # assume that the others are as well, might improve
-            self._players.append(Player(dex.ensure("TopLeftPlayer", dict), playerStatsList))
-            self._players.append(Player(dex.ensure("TopMidPlayer", dict), playerStatsList))
-            self._players.append(Player(dex.ensure("TopRightPlayer", dict), playerStatsList))
-            self._players.append(Player(dex.ensure("BottomLeftPlayer", dict), playerStatsList))
-            self._players.append(Player(dex.ensure("BottomMidPlayer", dict), playerStatsList))
-            self._players.append(Player(dex.ensure("BottomRightPlayer", dict), playerStatsList))
-            self._players.append(Player(dex.ensure("HeadCoach", dict), playerStatsList))
-        self._players.extend([ Player(player, playerStatsList)
-                               for player in dex.ensure("FeaturedPlayers", list) ])
-        self._players.extend([ Player(player, playerStatsList)
-                               for player in dex.ensure("SubPlayers", list) ])
+            players.extend(dex.ensure(position, dict)
+                           for position in ("TopLeftPlayer", "TopMidPlayer", "TopRightPlayer",
+                                            "BottomLeftPlayer", "BottomMidPlayer",
+                                            "BottomRightPlayer", "HeadCoach"))
+        players.extend(dex.ensure("FeaturedPlayers", list))
+        players.extend(dex.ensure("SubPlayers", list))
+        self._players: List[Player] = [ entities.canonicalPlayer(Player(player, playerStatsList))
+                                        for player in players ]
 
     @staticmethod # TODO (swap with ctor (make parse))
     def build(name: str, icon: str, nickname: str, home: bool, id_: int = 0) -> Team:
         """builds a team"""
-        return Team({ "TeamLogo": {
-                            "AltText": name,
-                            "Url": icon
-                        }
-                    }, { }, TeamStatistics({ }, home), [ ], { },
-                    icon, nickname, id_)
+        return TeamRef.canonical(name, icon, nickname, id_).promote(home)
 
     def toJson(self) -> JObject:
         return {
@@ -222,36 +360,15 @@ class Team(IType):
         """the team's form"""
         return self._form
 
+    def __reduce__(self) -> Tuple[Callable[..., Team], Tuple[Any, ...]]:
+        # a full team isn't interned (see TeamRef.__reduce__), it's pickled as it is
+        state = { name: getattr(self, name) for name in TeamRef.__slots__ if name != "__weakref__" }
+        state.update(self.__dict__)
+        return _restoreTeam, (state,)
+
     def __repr__(self) -> str:
         return f"(cevlib.types.team.Team) {self._name} ({self._nickname}/{self._id}) \nplayers={self._players}\nform={self._form}" # pylint: disable=line-too-long
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Team):
-            return False
-        if self.id and other.id:
-            return self.id == other.id
-        return self.name == other.name
-
-    @property
-    def name(self) -> Optional[str]:
-        """the team's name"""
-        return self._name
-
-    @property
-    def nickname(self) -> Optional[str]:
-        """the team's nickname (3 chars)"""
-        return self._nickname
-
-    @property
-    def logo(self) -> Optional[str]:
-        """the team's logo (link)"""
-        return self._logo
-
-    @property
-    def id(self) -> Optional[int]:
-        """the team's id"""
-        return self._id
-
     @property
     def stats(self) -> TeamStatistics:
         """the team's stats"""
@@ -172,3 +172,11 @@ class MatchState(Enum):
         if finished:
             return MatchState.Finished
         return MatchState.Unknown
+
+
+class LiveEventType(Enum):
+    """all changes a live stream reports"""
+    MatchStarted = "matchStarted"
+    SetStarted = "setStarted"
+    ScoreChanged = "scoreChanged"
+    MatchFinished = "matchFinished"
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""cevlib"""
+from __future__ import annotations
+__copyright__ = ("Copyright (c) 2022 https://github.com/dxstiny")
+
+# a warm start cache for short lived processes: the competition registry (homepage menu)
+# and parsed competitions are written to one file and read back with a single read.
+#
+#   cache = WarmStartCache("competitions.cache")
+#   if not cache.load():
+#       await cache.revalidate([ url ])  # cold start: download, parse and save
+#   else:
+#       cache.revalidateInBackground()   # serve the cached data, refresh meanwhile
+#
+# the file is a pickle, only load files written by this library.
+
+import asyncio
+import os
+import pickle
+import tempfile
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from cevlib.competitions import Competition, CompetitionLink, Competitions
+from cevlib.helpers import metrics
+from cevlib.helpers.jsonTool import dumps
+from cevlib.homepage import Homepage
+
+# bump whenever a cached model changes (files of other versions are ignored)
+FORMAT_VERSION = 3
+_MAGIC = b"cevlib-warm-start\n"
+
+TContent = Tuple[List[CompetitionLink], Dict[str, Competition]]
+
+
+class WarmStartCache:
+    """the competition registry and competitions, stored in a file"""
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._task: Optional[asyncio.Task[bool]] = None
+
+    @property
+    def path(self) -> str:
+        """the cache file"""
+        return self._path
+
+    @staticmethod
+    def _header() -> bytes:
+        return _MAGIC + str(FORMAT_VERSION).encode("ascii") + b"\n"
+
+    def _read(self) -> Optional[TContent]:
+        try:
+            with open(self._path, "rb") as file:
+                data = file.read()
+        except OSError:
+            return None
+        header = self._header()
+        if not data.startswith(header):
+            return None # other version (or not a cache file at all)
+        try:
+            links, competitions = pickle.loads(memoryview(data)[len(header):])
+        except Exception: # pylint: disable=broad-except
+            return None # written by an incompatible cevlib version
+        return links, competitions
+
+    def load(self) -> bool:
+        """installs the cached data (False if the file is missing, outdated or unreadable)"""
+        with metrics.measure("warmStart", "load"):
+            content = self._read()
+        metrics.cacheLookup("warmStart", content is not None)
+        if content is None:
+            return False
+        links, competitions = content
+        Competitions._competitionsCache = links # pylint: disable=protected-access
+        Competition._competitionCache.update(competitions) # pylint: disable=protected-access
+        return True
+
+    def save(self) -> None:
+        """writes the installed data (atomically, readers never see a partial file)"""
+        content = (Competitions._competitionsCache, # pylint: disable=protected-access
+                   dict(Competition._competitionCache)) # pylint: disable=protected-access
+        body = self._header() + pickle.dumps(content, protocol = pickle.HIGHEST_PROTOCOL)
+        directory = os.path.dirname(os.path.abspath(self._path))
+        handle, temporary = tempfile.mkstemp(dir = directory, prefix = ".warmStart-")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                file.write(body)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary, self._path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    async def revalidate(self, urls: Optional[Iterable[str]] = None) -> bool:
+        """
+        downloads the registry and the competitions (urls, default: all cached ones) again,
+        installs them and saves the file if anything changed
+        """
+        # pylint: disable=protected-access
+        homepage = await Homepage.get(maxAge = 0)
+        links = await homepage.derive(Competitions._parseLinks)
+        changed = _serialise(links) != _serialise(Competitions._competitionsCache)
+        Competitions._competitionsCache = links
+        for url in list(urls if urls is not None else Competition._competitionCache):
+            competition = await Competition._fetch(url)
+            previous = Competition._competitionCache.get(url)
+            if previous is None or dumps(previous.toJson()) != dumps(competition.toJson()):
+                changed = True
+            Competition._competitionCache[url] = competition
+        if changed:
+            await asyncio.get_running_loop().run_in_executor(None, self.save)
+        return changed
+
+    def revalidateInBackground(self, urls: Optional[Iterable[str]] = None) -> asyncio.Task[bool]:
+        """revalidate() as task (a running one is reused)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.revalidate(urls))
+        return self._task
+
+
+def _serialise(links: List[CompetitionLink]) -> bytes:
+    return dumps([ link.toJson() for link in links ])
+
+
+def clear() -> None:
+    """forgets the installed data (cevlib downloads everything again)"""
+    Competitions._competitionsCache = [ ] # pylint: disable=protected-access
+    Competition._competitionCache.clear() # pylint: disable=protected-access
+    Homepage.clear()
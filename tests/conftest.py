@@ -0,0 +1,73 @@
+import asyncio
+import random
+from typing import Iterator
+
+import pytest
+
+
+def _page(seed: int, size: int) -> str:
+    """a match centre like page (lots of markup, a few links of every kind)"""
+    rand = random.Random(seed)
+    words = "lorem ipsum dolor sit amet volley match centre player team set point".split()
+    parts = [ ]
+    for i in range(size):
+        parts.append(f"<div class=\"c-{i}\"><p>{' '.join(rand.choice(words) for _ in range(8))}</p></div>\n")
+        if i % 100 == 0:
+            parts.append("<div data-score-endpoint=\"//championsleague.cev.eu/umbraco/api/MatchCentreApi/"
+                         f"GetPlayByPlayComponent?tabKey={i}&amp;nodeId=179940&amp;culture=en-US\"></div>")
+        if i % 60 == 0:
+            parts.append(f"<img src=\"https://www.cev.eu/Upload/Photo/2022/03/Photo {i}.jpg\" alt=\"x\">")
+            parts.append(f"<img src=\"/media/{i}/gallery.JPG\">")
+        if i % 500 == 0:
+            parts.append(f"<iframe src=\"https://www.youtube.com/embed/v{i}?rel=0\"></iframe>")
+    return "".join(parts)
+
+
+@pytest.fixture(scope = "session")
+def matchCentreHtml() -> str:
+    return _page(2, 6000)
+
+
+@pytest.fixture(scope = "session")
+def recording(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """records the fake site once (like recording cev.eu), returns the recording's directory"""
+    # pylint: disable=import-outside-toplevel
+    from cevlib.helpers.transport import RecordingTransport
+    from fakeSite import StaticTransport, pages
+    directory = str(tmp_path_factory.mktemp("recording"))
+    recorder = RecordingTransport(directory, StaticTransport())
+    async def record() -> None:
+        for url in pages():
+            await recorder.get(url)
+    asyncio.run(record())
+    return directory
+
+
+@pytest.fixture
+def replay(recording: str) -> Iterator[str]:
+    """replays the recording instead of requesting cev.eu (for a single test)"""
+    # pylint: disable=import-outside-toplevel
+    from cevlib.helpers.transport import ReplayTransport, setTransport
+    previous = setTransport(ReplayTransport(recording))
+    yield recording
+    setTransport(previous)
+
+
+@pytest.fixture
+def liveFeed(monkeypatch: pytest.MonkeyPatch) -> Iterator[object]:
+    """a fresh shared LiveScores loop (the module wide one keeps its snapshot between tests)"""
+    # pylint: disable=import-outside-toplevel
+    from cevlib import live
+    feed = live.LiveScoresFeed()
+    monkeypatch.setattr(live, "_feed", feed)
+    yield feed
+
+
+@pytest.fixture(autouse = True)
+def freshHomepage() -> Iterator[None]:
+    """every test downloads the homepage itself (the snapshot is shared process wide)"""
+    # pylint: disable=import-outside-toplevel
+    from cevlib.homepage import Homepage
+    Homepage.clear()
+    yield
+    Homepage.clear()
@@ -0,0 +1,364 @@
+"""
+an offline stand-in for cev.eu (one match, one competition, one calendar month and the homepage,
+plus a knockout bracket).
+conftest records it like the live site, the tests then replay the recording.
+"""
+from datetime import datetime, timedelta
+import json
+from typing import Dict, List, Optional, Tuple
+
+from cevlib.helpers.transport import Response, Transport
+
+
+HOST = "https://www.cev.eu"
+MATCH_URL = f"{HOST}/match-centres/2022-european-cups/cev-cup-2022-women/ccw-54-home-v-away/"
+COMPETITION_URL = f"{HOST}/competitions/cev-cup-2022-women/"
+LIVE_SCORES_URL = "https://weblivefeed.cev.eu/LiveScores.json"
+CALENDAR_URL = f"{HOST}/umbraco/api/CalendarApi/GetCalendar?nodeId=11346&culture=en-US&date=2022-03-01T00:00:00Z" # pylint: disable=line-too-long
+ROUND_URL = f"{HOST}/umbraco/api/CompetitionApi/GetResults?nodeId=4&culture=en-US"
+LIVE_RESULT_URL = f"{HOST}/umbraco/api/CompetitionApi/GetLiveResultScoreByMatchId?matchid=45970"
+MATCH_ID = 45970
+HOME_ID = 12240
+AWAY_ID = 12381
+SETS = [ (25, 20), (25, 19), (22, 25), (25, 17) ]
+
+_API = "//www.cev.eu/umbraco/api"
+_NODE = "nodeId=179940&amp;culture=en-US"
+ENDPOINTS = {
+    "getlivescorehero": f"{_API}/matchcentreapi/getlivescorehero?{_NODE}",
+    "GetPlayByPlayComponent": f"{_API}/MatchCentreApi/GetPlayByPlayComponent?tabKey=1&amp;{_NODE}",
+    "GetMatchPoll": f"{_API}/MatchCentreApi/GetMatchPoll?matchPollUid={MATCH_ID}_{HOME_ID}_{AWAY_ID}-0", # pylint: disable=line-too-long
+    "GetTopStatisticsComponent": f"{_API}/MatchCentreApi/GetTopStatisticsComponent?key=1&amp;tabKey=2&amp;{_NODE}", # pylint: disable=line-too-long
+    "GetTopStatisticsComponentBlocker": f"{_API}/MatchCentreApi/GetTopStatisticsComponent?key=3&amp;tabKey=7&amp;{_NODE}", # pylint: disable=line-too-long
+    "GetStartingTeamComponentHome": f"{_API}/TeamComponentsApi/GetStartingTeamComponent?tabKey=3&amp;teamId={HOME_ID}&amp;{_NODE}", # pylint: disable=line-too-long
+    "GetStartingTeamComponentAway": f"{_API}/TeamComponentsApi/GetStartingTeamComponent?tabKey=3&amp;teamId={AWAY_ID}&amp;{_NODE}", # pylint: disable=line-too-long
+    "GetFormComponent": f"{_API}/MatchCentreApi/GetFormComponent?tabKey=4&amp;{_NODE}",
+    "GetTeamStatsComponentMC": f"{_API}/StatisticsApi/GetTeamStatsComponentMC?tabKey=5&amp;{_NODE}",
+    "GetPlayerStatsComponentMC": f"{_API}/StatisticsApi/GetPlayerStatsComponentMC?tabKey=6&amp;{_NODE}", # pylint: disable=line-too-long
+}
+
+
+def _url(endpoint: str) -> str:
+    return "https:" + ENDPOINTS[endpoint].replace("amp;", "")
+
+
+def _player(number: int, name: str, position: str, zone: int) -> dict:
+    return { "Number": number, "Name": name, "Position": position, "PositionNumber": zone,
+             "PlayerId": number * 100, "Image": f"{HOST}/players/{number}.png" }
+
+
+def _startingTeam(teamId: int, name: str) -> dict:
+    positions = [ "Setter", "Outside spiker", "Middle blocker",
+                  "Opposite", "Outside spiker", "Middle blocker" ]
+    slots = [ "TopLeftPlayer", "TopMidPlayer", "TopRightPlayer",
+              "BottomLeftPlayer", "BottomMidPlayer", "BottomRightPlayer" ]
+    team = { slot: _player(i + 1, f"{name} PLAYER{i + 1}", positions[i], i + 1)
+             for i, slot in enumerate(slots) }
+    team["HeadCoach"] = _player(0, f"{name} COACH", "Head Coach", 0)
+    team["FeaturedPlayers"] = [ _player(7, f"{name} LIBERO", "Libero", 7) ]
+    team["SubPlayers"] = [ _player(10 + i, f"{name} SUB{i}", "Outside spiker", 0)
+                           for i in range(6) ]
+    team["TeamId"] = teamId
+    team["TeamLogo"] = { "AltText": name, "Url": f"{HOST}/GameHub/Teams/{teamId}.png" }
+    return team
+
+
+def _statsPlayers(name: str) -> list:
+    return [ { "Name": f"{name} PLAYER{i}", "PlayerNumber": i, "Points": 10 + i, "Serves": i,
+               "Spikes": 5 + i, "Blocks": i % 3, "Reception": 4, "SpikePerc": f"{40 + i}%",
+               "PositiveReceptionPerc": "50%" }
+             for i in range(1, 7) ]
+
+
+def _teamStats() -> dict:
+    names = [ "Winning Spikes", "Kill Blocks", "Aces", "Opponent Errors", "Points" ]
+    return { "Tabs": [ { "Name": f"Set {tab}",
+                         "Statistics": [ { "Name": name, "HomeTeamValue": 3 + i,
+                                           "AwayTeamValue": 2 + i, "HomeTeamPercent": 30.5,
+                                           "AwayTeamPercent": 25.0 }
+                                         for i, name in enumerate(names) ] }
+                       for tab in range(1, 4) ] }
+
+
+def _formTeam(name: str) -> dict:
+    return { "RecentForm": [ True, False ],
+             "Matches": [ { "MatchCentreUrl": f"{HOST}/match-centres/form-{i}/",
+                            "HomeTeam": { "Name": name, "Logo": { "Url": "" }, "Score": 3 },
+                            "AwayTeam": { "Name": f"Rival {i}", "Logo": { "Url": "" }, "Score": i },
+                            "SetsFormatted": "<span>(25-20, 25-22, 25-18)</span>",
+                            "MatchDateTime": f"2022-02-0{i + 1}T18:00:00" }
+                          for i in range(2) ] }
+
+
+def _playByPlay() -> dict:
+    titles = [ "Spike", "Serve", "Block", "First Serve" ]
+    return { "PlayEvents": [ { "TabName": f"Set {tab}",
+                               "Events": [ { "Title": titles[i % 4], "SetNumber": tab,
+                                             "Description": f"{i // 2}-{(i + 1) // 2}",
+                                             "PlayerName": f"PLAYER {i % 6}",
+                                             "PlayerNumber": i % 6 + 1, "IsHome": i % 2 == 0 }
+                                           for i in range(45) ] }
+                             for tab in range(1, 4) ] }
+
+
+def _liveScoresMatch() -> dict:
+    return { "matchId": MATCH_ID, "matchCentreLink": MATCH_URL, "matchState_String": "FINISHED",
+             "utcStartDate": "2022-03-02T18:00:00Z", "matchLocation": "Liberec",
+             "homeTeam": "Home Volley", "awayTeam": "Away Volley",
+             "homeTeamIcon": f"{HOST}/GameHub/Teams/{HOME_ID}.png",
+             "awayTeamIcon": f"{HOST}/GameHub/Teams/{AWAY_ID}.png",
+             "homeTeamNickname": "HOM", "awayTeamNickname": "AWA",
+             "homeSetsWon": 3, "awaySetsWon": 1, "hasGoldenSet": False,
+             "setResults": [ { "homeScore": home, "awayScore": away, "setNumber": i + 1,
+                               "isInPlay": False } for i, (home, away) in enumerate(SETS) ],
+             "currentSetScore": { "homeScore": 0, "awayScore": 0, "setNumber": 0,
+                                  "isInPlay": False },
+             "phaseName": "Pool A", "legName": "Leg 1", "groupName": "A", "matchNumber": "54",
+             "watchLink": "https://www.eurovolley.tv/watch/54" }
+
+
+def liveResult(state: str, sets: list, current: Optional[tuple] = None) -> dict:
+    """the per match score endpoint (the fields of a LiveScores match, capitalised)"""
+    return { "MatchId": MATCH_ID, "MatchState_String": state,
+             "HomeSetsWon": sum(home > away for home, away in sets),
+             "AwaySetsWon": sum(away > home for home, away in sets), "HasGoldenSet": False,
+             "SetResults": [ { "HomeScore": home, "AwayScore": away, "SetNumber": i + 1,
+                               "IsInPlay": False } for i, (home, away) in enumerate(sets) ],
+             "CurrentSetScore": { "HomeScore": current[0], "AwayScore": current[1],
+                                  "SetNumber": len(sets) + 1, "IsInPlay": True }
+                                if current else { } }
+
+
+def _matchCentre() -> str:
+    links = "\n".join(f"<div data-endpoint=\"{link}\"></div>" for link in ENDPOINTS.values())
+    filler = "\n".join(f"<div class=\"c-{i}\"><p>volley match centre text {i}</p></div>"
+                       for i in range(3000))
+    return f"""<html><body>
+{filler}
+{links}
+<img src="https://www.cev.eu/Upload/Photo/2022/03/CCW-54 1.jpg">
+<img src="https://www.cev.eu/Upload/Photo/2022/03/CCW-54 2.jpg">
+<iframe src="https://www.youtube.com/embed/abcdef?rel=0"></iframe>
+<div class="match-report"><h2>Home win the first leg</h2>
+<div class="match-report__summary-container"><p>Home Volley beat Away Volley 3-1.</p></div></div>
+<div class="quote-block"><p>“A great team effort”</p><cite>Head Coach<br>Home Volley</cite></div>
+<div class="match-report"><div class="column-container"><span>96</span>
+<span class="col__content-title">Minutes</span><p>played</p></div></div>
+<div class="text-container"><p>First leg of the quarter finals</p></div>
+<div class="match-info"><ul>
+<li class="accordion-item"><a class="accordion-title">Officials</a>
+<div class="u-flex-1"><div class="u-border-grey-light">1st Referee</div>
+<div class="accordion-content__image" style="background: url(https://www.cev.eu/Images/Officials/1.png)"></div>
+<div class="accordion-content__item"><div>Jane Referee</div><div>CZE</div></div></div></li>
+<li class="accordion-item"><a class="accordion-title">How To Attend</a>
+<img class="u-object-cover" src="https://www.cev.eu/hall.jpg">
+<p><span><strong>Capacity</strong>4000</span>Home Arena</p></li>
+</ul></div>
+{filler}
+</body></html>"""
+
+
+def _homepage() -> str:
+    return f"""<html><body><ul>
+<li class="c-nav__list__item"><a class="menuItem">European Cups</a>
+<div class="menuSlab"><div class="menuSlab__row"><div>
+<a class="title">CEV Cup</a>
+<ul><li><a title="Women" href="{COMPETITION_URL}">Women</a></li>
+<li><a title="Men" href="{HOST}/competitions/cev-cup-2022-men/">Men</a></li></ul>
+</div></div></div></li>
+<li class="c-nav__list__item"><a class="menuItem">Beach Volleyball</a>
+<div class="menuSlab"><div class="menuSlab__row"><div>
+<a class="title">Beach</a><ul><li><a title="Women" href="{HOST}/beach/">Women</a></li></ul>
+</div></div></div></li></ul>
+<img src="/media/1234/news.jpg"><img src="/media/5678/gallery.JPG">
+<iframe src="https://www.youtube.com/embed/home123?rel=0"></iframe>
+</body></html>"""
+
+
+def _competitionPage() -> str:
+    rows = "\n".join(f"<tr><td>{i + 1}</td><td><a href=\"/team/{100 + i}-team-{i}\">Team {i}</a></td>"
+                     f"<td>{6 - i}</td><td>{i}</td><td>{9 - i}</td><td>{i * 2}</td></tr>"
+                     for i in range(4))
+    return f"""<html><body>
+<ul><li class="tabs-title">Pool Phase</li></ul>
+<div class="competition-components-container">
+<div data-score-endpoint="{ROUND_URL.removeprefix('https:')}"></div>
+<div class="pool-standings-table"><table>
+<thead><tr><th></th><th></th><th>Matches</th><th>Sets</th></tr>
+<tr><th>Pos</th><th class="u-pr-8">Team</th><th>W</th><th class="u-pr-8">L</th><th>W</th><th>L</th></tr></thead>
+<tbody>{rows}</tbody></table></div>
+</div></body></html>"""
+
+
+def _round() -> dict:
+    def result(home: int, away: int, complete: bool) -> dict:
+        return { "MatchCentreUrl": f"{HOST}/match-centres/{home}-{away}/",
+                 "HomeTeam": { "Name": f"Team {home}", "Link": f"/team/{home}-team-{home}",
+                               "Logo": { "Name": f"team{home}.png" }, "Score": 3 },
+                 "AwayTeam": { "Name": f"Team {away}", "Link": f"/team/{away}-team-{away}",
+                               "Logo": { "Name": f"team{away}.png" }, "Score": 1 },
+                 "SetsFormatted": "<span>(25-20, 22-25, 25-18, 25-19)</span>",
+                 "Location": "Arena", "MatchDateTime": "2022-03-02T18:00:00",
+                 "IsComplete": complete, "MatchName": f"M{home}{away}" }
+    return { "Pools": [ { "Name": "Pool A",
+                          "Results": [ result(0, 1, True), result(2, 3, True),
+                                       result(1, 0, False), result(3, 2, False) ] } ] }
+
+
+BRACKET_URL = f"{HOST}/competitions/cev-cup-2022-men/"
+# a knockout bracket: quarter finals (2 legs), semi finals (2 legs) and the final
+BRACKET = [ ("Quarter Finals", [ (0, 1), (2, 3), (4, 5), (6, 7) ]),
+            ("Semi Finals", [ (0, 2), (4, 6) ]),
+            ("Final", [ (0, 4) ]) ]
+
+
+def bracketRoundUrl(index: int) -> str:
+    """score endpoint of a round of the bracket"""
+    return f"{HOST}/umbraco/api/CompetitionApi/GetResults?nodeId={10 + index}&culture=en-US"
+
+
+def bracketRound(pairs: List[Tuple[int, int]], legs: int = 2) -> dict:
+    """a round of the bracket (the first leg at home of the first team)"""
+    def result(home: int, away: int) -> dict:
+        return { "MatchCentreUrl": f"{HOST}/match-centres/men-{home}-{away}/",
+                 "HomeTeam": { "Name": f"Club {home}", "Link": f"/team/{200 + home}-club-{home}",
+                               "Logo": { "Name": f"club{home}.png" }, "Score": 3 },
+                 "AwayTeam": { "Name": f"Club {away}", "Link": f"/team/{200 + away}-club-{away}",
+                               "Logo": { "Name": f"club{away}.png" }, "Score": 0 },
+                 "SetsFormatted": "<span>(25-20, 25-22, 25-18)</span>",
+                 "Location": "Arena", "MatchDateTime": "2022-04-02T18:00:00",
+                 "IsComplete": True, "MatchName": f"M{home}{away}" }
+    results = [ result(home, away) for home, away in pairs ]
+    if legs == 2:
+        results += [ result(away, home) for home, away in pairs ]
+    return { "Pools": [ { "Name": "Knockout", "Results": results } ] }
+
+
+def bracketPage(rounds: int) -> str:
+    """the competition page of the first rounds of the bracket"""
+    tabs = "".join(f"<li class=\"tabs-title\">{name}</li>" for name, _ in BRACKET[:rounds])
+    containers = "\n".join("<div class=\"competition-components-container\">"
+                           f"<div data-score-endpoint=\"{bracketRoundUrl(i).removeprefix('https:')}\"></div></div>" # pylint: disable=line-too-long
+                           for i in range(rounds))
+    return f"<html><body><ul>{tabs}</ul>\n{containers}\n</body></html>"
+
+
+def bracketPages(rounds: int = len(BRACKET)) -> Dict[str, bytes]:
+    """the bracket's page and score endpoints (the final has one leg)"""
+    site = { bracketRoundUrl(i): json.dumps(bracketRound(pairs, 1 if name == "Final" else 2)).encode("utf-8") # pylint: disable=line-too-long
+             for i, (name, pairs) in enumerate(BRACKET[:rounds]) }
+    site[BRACKET_URL] = bracketPage(rounds).encode("utf-8")
+    return site
+
+
+def _calendar() -> dict:
+    return { "Dates": [ { "Matches": [ { "MatchCentreUrl": MATCH_URL if i == 0 else "",
+                                         "CompetitionName": "CEV Cup | Women",
+                                         "PhaseName": "Pool A",
+                                         "HomeTeamName": f"Team {i}", "GuestTeamName": f"Team {i + 1}",
+                                         "HomeClubCode": "T", "GuestClubCode": "G",
+                                         "StadiumName": "Arena",
+                                         "MatchDateTime_UTC": f"2022-03-{day:02d}T18:00:00",
+                                         "WonSetHome": 3, "WonSetGuest": i % 3,
+                                         "Finalized": True }
+                                       for i in range(5) ] }
+                        for day in range(1, 29) ] }
+
+
+def pages() -> Dict[str, bytes]:
+    """every url the library requests for the fake site"""
+    jsonPages = {
+        _url("getlivescorehero"): {
+            "MatchId": MATCH_ID, "Duration": "96 min", "Competition": "CEV Cup | Women 2022",
+            "Phase": "Quarter Finals", "Leg": "Leg 1", "Season": "2022", "MatchNumber": "54",
+            "HomeTeam": { "Name": "Home Volley", "Score": 3, "Logo": { "Url": "" } },
+            "AwayTeam": { "Name": "Away Volley", "Score": 1, "Logo": { "Url": "" } },
+            "SetsFormatted": "<span>(25-20, 25-19, 22-25, 25-17)</span>", "GoldenSet": "",
+            "HighLightUrl": "https://www.youtube.com/v/abcdef"
+        },
+        _url("GetPlayByPlayComponent"): _playByPlay(),
+        _url("GetMatchPoll"): [ { "Id": HOME_ID, "Value": "HOM", "Percent": 60.0, "VoteCount": 60 },
+                                { "Id": AWAY_ID, "Value": "AWA", "Percent": 40.0, "VoteCount": 40 } ],
+        _url("GetTopStatisticsComponent"): {
+            "Type": "Scorer",
+            "Match": { "Players": [ { "Number": 4, "Name": "HOME PLAYER4", "Position": "Opposite",
+                                      "Score": 24, "Team": "HOM", "Image": "" } ] }
+        },
+        _url("GetTopStatisticsComponentBlocker"): {
+            "Type": "Blocker",
+            "Match": { "Players": [ { "Number": 12, "Name": "AWAY PLAYER12", "Position": "Middle Blocker",
+                                      "Score": 5, "Team": "AWA", "Image": "" } ] }
+        },
+        _url("GetStartingTeamComponentHome"): _startingTeam(HOME_ID, "HOME"),
+        _url("GetStartingTeamComponentAway"): _startingTeam(AWAY_ID, "AWAY"),
+        # some umbraco components return their json as a (json encoded) string
+        _url("GetFormComponent"): json.dumps({ "HomeTeam": _formTeam("Home Volley"),
+                                               "AwayTeam": _formTeam("Away Volley") }),
+        _url("GetTeamStatsComponentMC"): json.dumps(_teamStats()),
+        _url("GetPlayerStatsComponentMC"): json.dumps({ "Teams": [
+            { "Players": _statsPlayers("HOME") }, { "Players": _statsPlayers("AWAY") } ] }),
+        LIVE_SCORES_URL: { "competitions": [ { "competitionName": "CEV Cup | Women",
+                                               "competitionId": 4,
+                                               "matches": [ _liveScoresMatch() ] } ] },
+        CALENDAR_URL: _calendar(),
+        ROUND_URL: _round(),
+        LIVE_RESULT_URL: liveResult("FINISHED", SETS),
+    }
+    site = { url: json.dumps(data).encode("utf-8") for url, data in jsonPages.items() }
+    site[MATCH_URL] = _matchCentre().encode("utf-8")
+    site[f"{HOST}/"] = _homepage().encode("utf-8")
+    site[COMPETITION_URL] = _competitionPage().encode("utf-8")
+    return site
+
+
+class StaticTransport(Transport):
+    """serves the fake site (404 for everything else)"""
+    def __init__(self) -> None:
+        self._pages = pages()
+
+    async def get(self, url: str) -> Response:
+        if url not in self._pages:
+            return Response(url, 404, b"")
+        return Response(url, 200, self._pages[url])
+
+
+def liveScores(state: str, startDate: str, sets: list, current: Optional[tuple] = None) -> bytes:
+    """a LiveScores feed with a single match"""
+    match = { "matchId": 1, "matchCentreLink": "", "matchState_String": state,
+              "utcStartDate": startDate, "matchLocation": "Arena",
+              "homeTeam": "Home", "awayTeam": "Away",
+              "homeSetsWon": sum(home > away for home, away in sets),
+              "awaySetsWon": sum(away > home for home, away in sets),
+              "setResults": [ { "homeScore": home, "awayScore": away, "setNumber": i + 1,
+                                "isInPlay": False } for i, (home, away) in enumerate(sets) ],
+              "currentSetScore": { "homeScore": current[0], "awayScore": current[1],
+                                   "setNumber": len(sets) + 1, "isInPlay": True }
+                                 if current else { } }
+    return json.dumps({ "competitions": [ { "competitionName": "Cup", "competitionId": 1,
+                                            "matches": [ match ] } ] }).encode("utf-8")
+
+
+LATER = (datetime.utcnow() + timedelta(hours = 1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+EARLIER = (datetime.utcnow() - timedelta(hours = 1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+LIVE_SNAPSHOTS = [
+    liveScores("UPCOMING", LATER, [ ]),
+    liveScores("UPCOMING", LATER, [ ]), # unchanged
+    liveScores("LIVE", EARLIER, [ ], (1, 1)),
+    liveScores("LIVE", EARLIER, [ ], (2, 1)),
+    liveScores("LIVE", EARLIER, [ (25, 20) ], (1, 1)),
+    liveScores("FINISHED", EARLIER, [ (25, 20), (25, 18), (25, 10) ]),
+]
+
+
+class SnapshotTransport(Transport):
+    """serves the live snapshots one after another (LiveScores only)"""
+    def __init__(self, held: bool = False) -> None:
+        self.requests = 0
+        self.held = held # serves the first snapshot until released
+
+    async def get(self, url: str) -> Response:
+        if self.held:
+            return Response(url, 200, LIVE_SNAPSHOTS[0])
+        body = LIVE_SNAPSHOTS[min(self.requests, len(LIVE_SNAPSHOTS) - 1)]
+        self.requests += 1
+        return Response(url, 200, body)
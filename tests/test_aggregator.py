@@ -0,0 +1,69 @@
+import asyncio
+import json
+import random
+
+import pytest
+
+from cevlib.aggregator import StatsAggregator
+from cevlib.match import Match
+
+from fakeSite import MATCH_URL, _statsPlayers
+
+
+def _payload(home="HOME", away="AWAY"):
+    return json.dumps({ "Teams": [ { "Players": _statsPlayers(home) },
+                                   { "Players": _statsPlayers(away) } ] })
+
+
+def test_matchCache(replay):
+    async def main():
+        return await (await Match.byUrl(MATCH_URL)).cache()
+    cache = asyncio.run(main())
+    aggregator = StatsAggregator()
+    aggregator.addMatch(cache)
+    aggregator.addMatch(cache) # the same match again: replaced
+    assert aggregator.matches == [ MATCH_URL ]
+    best = aggregator.topPlayers("points", 1)[0]
+    assert (best.name, best.number, best.matches, best.stats["points"]) == ("Home Player6", 6, 1, 16) # pylint: disable=line-too-long
+    assert aggregator.team("HOME").stats["spikes"] == sum(5 + i for i in range(1, 7))
+
+
+def test_liveMatchIsNotCountedTwice():
+    aggregator = StatsAggregator()
+    aggregator.addPlayerStats(1, _payload(), ("Home", "Away"))
+    aggregator.addPlayerStats(2, _payload(), ("Home", "Rival"))
+    live = json.loads(_payload())
+    live["Teams"][0]["Players"][0]["Points"] = 40
+    aggregator.addPlayerStats(2, live, ("Home", "Rival")) # the live match went on
+    player = aggregator.player("Home", "HOME PLAYER1")
+    assert (player.matches, player.stats["points"]) == (2, 11 + 40)
+    assert aggregator.topPlayers("points", 1)[0].name == "Home Player1"
+    assert aggregator.team("Home").matches == 2
+
+    assert aggregator.remove(2)
+    assert not aggregator.remove(2)
+    assert aggregator.player("Home", "Home Player1").stats["points"] == 11
+    assert aggregator.team("Rival") is None
+    assert [ total.name for total in aggregator.topTeams("points") ] == [ "Home", "Away" ]
+
+
+def test_topMatchesSorting():
+    rand = random.Random(4)
+    aggregator = StatsAggregator()
+    keys = list(range(60))
+    for key in keys:
+        players = [ { "Name": f"P{i}", "PlayerNumber": i, "Points": rand.randint(0, 30),
+                      "Blocks": rand.randint(0, 5) } for i in range(rand.randint(1, 20)) ]
+        aggregator.addPlayerStats(key, { "Teams": [ { "Players": players } ] }, (f"T{key % 7}", ""))
+    for key in rand.sample(keys, 25):
+        aggregator.remove(key)
+    for stat in ( "points", "blocks", "serves" ):
+        expected = sorted(aggregator.players(), key = lambda total: -total.stats[stat])
+        top = aggregator.topPlayers(stat, 15)
+        assert [ total.stats[stat] for total in top ] == [ total.stats[stat] for total in expected[:15] ] # pylint: disable=line-too-long
+        assert len({ (total.team, total.name) for total in top }) == 15
+
+
+def test_unknownStat():
+    with pytest.raises(ValueError):
+        StatsAggregator().topPlayers("aces")
@@ -0,0 +1,76 @@
+import asyncio
+from datetime import datetime
+
+from cevlib.archive import Archive
+from cevlib.calendar import CalendarMatch
+from cevlib.competitions import Competition
+from cevlib.match import Match, MatchCache
+
+from fakeSite import COMPETITION_URL, MATCH_URL
+
+
+def _calendarMatch(i, url=None):
+    return CalendarMatch.parse({ "MatchCentreUrl": url or f"https://www.cev.eu/match-centres/m-{i}/",
+                                 "CompetitionName": "CEV Cup | Women" if i % 2 else "Champions League | Men", # pylint: disable=line-too-long
+                                 "PhaseName": f"Pool {'ABCD'[i % 4]}",
+                                 "HomeTeamName": f"Team {i % 12}", "GuestTeamName": f"Team {(i + 5) % 12}", # pylint: disable=line-too-long
+                                 "StadiumName": f"Arena {i % 12}",
+                                 "MatchDateTime_UTC": f"{2019 + i % 3}-{1 + i % 12:02d}-{1 + i % 28:02d}T18:00:00", # pylint: disable=line-too-long
+                                 "WonSetHome": 3, "WonSetGuest": i % 3, "Finalized": True })
+
+
+def _cache():
+    async def main():
+        return await (await Match.byUrl(MATCH_URL)).cache()
+    return asyncio.run(main())
+
+
+def test_queries(replay):
+    cache = _cache()
+    with Archive(":memory:") as archive:
+        archive.addAll(_calendarMatch(i) for i in range(600))
+        archive.add(cache)
+        archive.add(_calendarMatch(0, MATCH_URL)) # the snapshot stays
+        assert len(archive) == 601
+
+        teamMatches = archive.query().team("Team 4").competition("CEV Cup").season("2021").all()
+        assert teamMatches and all(match.competition == "CEV Cup" and match.season == "2021" and
+                                   "Team 4" in match.teams for match in teamMatches)
+        march = archive.query().finished().between(datetime(2021, 3, 1), datetime(2021, 4, 1))
+        assert all(match.startTime.month == 3 for match in march.all())
+        assert march.count() == 50
+        assert archive.query().venue("Arena 5").phase("Pool B").count() == 50
+
+        refereed = archive.query().official("Jane Referee").all()
+        assert [ match.matchCentreLink for match in refereed ] == [ MATCH_URL ]
+        assert refereed[0]._model is None # hydrated on first use
+        assert isinstance(refereed[0].model, MatchCache)
+        assert refereed[0].model.toJson() == cache.toJson()
+        assert archive.query().team(cache.homeTeam.id).first().matchCentreLink == MATCH_URL
+
+        assert archive.remove(MATCH_URL)
+        assert MATCH_URL not in archive
+        assert not archive.query().official("Jane Referee").all()
+
+
+def test_competition(replay):
+    competition = asyncio.run(Competition.fromUrl(COMPETITION_URL))
+    with Archive(":memory:") as archive:
+        archive.add(competition)
+        matches = [ match for round_ in competition.rounds for pool in round_.pools
+                    for draw in pool.draws for match in draw.matches if match.matchCentreLink ]
+        assert len(archive) == len({ match.matchCentreLink for match in matches })
+        team = matches[0].homeTeam
+        assert archive.query().team(team).count() == \
+               len({ match.matchCentreLink for match in matches if team in match.teams })
+
+
+def test_reopen(tmp_path):
+    path = str(tmp_path / "archive.db")
+    with Archive(path) as archive:
+        archive.add(_calendarMatch(1))
+    with Archive(path) as archive:
+        assert archive.query().first().model.toJson() == _calendarMatch(1).toJson()
+        archive.execute("PRAGMA user_version = 999")
+    with Archive(path) as archive: # another version: rebuilt
+        assert len(archive) == 0
@@ -0,0 +1,108 @@
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+
+from cevlib.calendar import Calendar
+from cevlib.competitions import Competition
+from cevlib.helpers import linkScanner, parsePool
+from cevlib.match import Match
+from cevlib.types.info import Info
+from cevlib.types.report import MatchReport
+
+from fakeSite import COMPETITION_URL, MATCH_URL, pages
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_scanMatchCentre(benchmark, matchCentreHtml):
+    benchmark(linkScanner.scanMatchCentre, matchCentreHtml)
+
+
+def test_scanMatchCentreRegex(benchmark, matchCentreHtml):
+    # the previous implementation, kept as a reference point
+    def scan(html):
+        return [ [ match[0] for match in pattern.finditer(html) ]
+                 for pattern in (linkScanner.UMBRACO, linkScanner.PHOTO, linkScanner.EMBED) ]
+    benchmark(scan, matchCentreHtml)
+
+
+def test_matchConstruction(benchmark, matchCentreHtml):
+    benchmark(lambda: Match(matchCentreHtml, "https://www.cev.eu/match-centres/x/").gallery)
+
+
+# the following benchmarks replay a recorded site (see conftest), no network involved
+
+def _cache():
+    async def main():
+        return await (await Match.byUrl(MATCH_URL)).cache()
+    return asyncio.run(main())
+
+
+def test_matchCache(benchmark, replay):
+    benchmark(_cache)
+
+
+def test_matchCacheToJson(benchmark, replay):
+    cache = _cache()
+    benchmark(cache.toJson)
+
+
+def test_matchCacheToJsonBytes(benchmark, replay):
+    cache = _cache()
+    benchmark(cache.toJsonBytes)
+
+
+def test_competitionFromUrl(benchmark, replay):
+    benchmark(lambda: asyncio.run(Competition.fromUrl(COMPETITION_URL)))
+
+
+def test_calendarMatchesOfMonth(benchmark, replay):
+    benchmark(lambda: asyncio.run(Calendar.matchesOfMonth(3, 2022)))
+
+
+def test_infoParsing(benchmark):
+    html = pages()[MATCH_URL].decode("utf-8")
+    benchmark(Info, html)
+
+
+def test_reportParsing(benchmark):
+    html = pages()[MATCH_URL].decode("utf-8")
+    benchmark(MatchReport, html)
+
+
+@pytest.mark.parametrize("processes", [ False, True ], ids = [ "threads", "processes" ])
+def test_bulkParsing(benchmark, processes):
+    # a backfill: many match pages parsed at once
+    html = pages()[MATCH_URL].decode("utf-8")
+    async def parseAll():
+        return await asyncio.gather(*(parsePool.parse(Info, html) for _ in range(4)))
+    if processes:
+        parsePool.enable()
+    try:
+        benchmark.pedantic(lambda: asyncio.run(parseAll()), rounds = 3)
+    finally:
+        parsePool.disable()
+
+
+def test_importCalendar(benchmark):
+    # a fresh interpreter each round, -X importtime reports the import itself (microseconds)
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    def run():
+        return subprocess.run([ sys.executable, "-X", "importtime", "-c", "import cevlib.calendar" ],
+                              env = { **os.environ, "PYTHONPATH": src }, check = True,
+                              capture_output = True, text = True).stderr
+    report = benchmark(run)
+    line = next(line for line in report.splitlines() if line.endswith("| cevlib.calendar"))
+    benchmark.extra_info["importMicroseconds"] = int(line.split("|")[1])
+
+
+def test_archiveQuery(benchmark):
+    from cevlib.archive import Archive # pylint: disable=import-outside-toplevel
+    from test_archive import _calendarMatch # pylint: disable=import-outside-toplevel
+    with Archive(":memory:") as archive:
+        archive.addAll(_calendarMatch(i) for i in range(20000)) # a few seasons
+        query = lambda: archive.query().team("Team 4").competition("CEV Cup").season("2021").all() # pylint: disable=unnecessary-lambda-assignment
+        assert benchmark(query)
@@ -0,0 +1,110 @@
+import asyncio
+import json
+
+import pytest
+
+from cevlib.competitions import Competition
+from cevlib.helpers import transport
+from cevlib.helpers.transport import Response, Transport
+
+from fakeSite import (BRACKET, BRACKET_URL, COMPETITION_URL, ROUND_URL, bracketPages,
+                      bracketRound, bracketRoundUrl, pages)
+
+
+class MutableTransport(Transport):
+    """the fake site, pages may be replaced (records every request)"""
+    def __init__(self) -> None:
+        self.pages = { **pages(), **bracketPages(2) } # the bracket up to the semi finals
+        self.requests = [ ]
+
+    async def get(self, url: str) -> Response:
+        self.requests.append(url)
+        if url not in self.pages:
+            return Response(url, 404, b"")
+        return Response(url, 200, self.pages[url])
+
+    def updateRound(self, update) -> None:
+        payload = json.loads(self.pages[ROUND_URL])
+        update(payload["Pools"][0]["Results"])
+        self.pages[ROUND_URL] = json.dumps(payload).encode("utf-8")
+
+    def updateBracket(self, index: int, pairs, legs: int = 2) -> None:
+        self.pages[bracketRoundUrl(index)] = json.dumps(bracketRound(pairs, legs)).encode("utf-8")
+
+
+@pytest.fixture
+def site():
+    site = MutableTransport()
+    previous = transport.setTransport(site)
+    yield site
+    transport.setTransport(previous)
+
+
+def test_refreshWithoutChanges(site):
+    competition = asyncio.run(Competition.fromUrl(COMPETITION_URL))
+    site.requests.clear()
+    assert asyncio.run(competition.refresh()) == { }
+    assert site.requests == [ ROUND_URL ] # the page isn't downloaded again
+
+
+def test_refreshPatchesInPlace(site):
+    competition = asyncio.run(Competition.fromUrl(COMPETITION_URL))
+    round_ = competition.get(0)
+    pool = round_.get(0)
+    draw = pool.get(0)
+    standings = pool.standingsPool
+    def secondLeg(results):
+        results[2]["SetsFormatted"] = "<span>(25-20, 25-22, 25-18)</span>"
+        results[2]["AwayTeam"]["Score"] = 0
+    site.updateRound(secondLeg)
+
+    changes = asyncio.run(competition.refresh())
+    assert list(changes) == [ round_.name ]
+    assert changes[round_.name] # a json patch of the round
+    # the objects handed out before are up to date
+    assert competition.get(0) is round_ and round_.get(0) is pool
+    assert pool.get(0) is draw and pool.standingsPool is standings
+    assert draw.matches[1].result.awayScore == 0
+    assert competition.toJson() == asyncio.run(Competition._fetch(COMPETITION_URL)).toJson()
+
+
+def _fresh(url):
+    return asyncio.run(Competition._fetch(url)).toJson()
+
+def _firstTeams(round_):
+    return [ draw.firstTeam.name for draw in round_.get(0).draws ]
+
+
+def test_refreshRearrangesEveryEarlierRound(site):
+    site.pages.update(bracketPages())
+    competition = asyncio.run(Competition.fromUrl(BRACKET_URL))
+    quarterFinals, semiFinals, final = competition.rounds
+    assert _firstTeams(quarterFinals) == [ "Club 0", "Club 2", "Club 4", "Club 6" ]
+    site.updateBracket(2, [ (4, 0) ], legs = 1) # the final is played at the other club
+
+    changes = asyncio.run(competition.refresh())
+    # the final rearranges the semi finals, they rearrange the quarter finals
+    assert set(changes) == { final.name, semiFinals.name, quarterFinals.name }
+    assert _firstTeams(quarterFinals) == [ "Club 4", "Club 6", "Club 0", "Club 2" ]
+    assert competition.rounds == [ quarterFinals, semiFinals, final ]
+    assert competition.toJson() == _fresh(BRACKET_URL)
+
+
+def test_refreshRebuildsAddedAndRemovedRounds(site):
+    competition = asyncio.run(Competition.fromUrl(BRACKET_URL))
+    quarterFinals, semiFinals = competition.rounds
+    site.pages.update(bracketPages()) # the final is drawn
+    site.updateBracket(1, BRACKET[1][1][::-1]) # and the semi finals change
+
+    changes = asyncio.run(competition.refresh())
+    assert "Final" in changes and changes["Final"][0]["op"] == "replace"
+    assert competition.rounds[:2] == [ quarterFinals, semiFinals ] # patched in place
+    assert [ round_.name for round_ in competition.rounds ] == [ name for name, _ in BRACKET ]
+    assert competition.toJson() == _fresh(BRACKET_URL)
+
+    site.pages.update(bracketPages(2)) # the final is removed again
+    site.updateBracket(1, BRACKET[1][1])
+    changes = asyncio.run(competition.refresh())
+    assert "Final" in changes
+    assert competition.rounds == [ quarterFinals, semiFinals ]
+    assert competition.toJson() == _fresh(BRACKET_URL)
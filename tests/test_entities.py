@@ -0,0 +1,80 @@
+from typing import Iterator
+
+import pytest
+
+from cevlib.calendar import Calendar
+from cevlib.types import entities
+from cevlib.types.stats import TeamStatistics
+from cevlib.types.team import Team, TeamRef
+
+from fakeSite import _calendar
+
+
+@pytest.fixture
+def store() -> Iterator[entities.EntityStore]:
+    """a fresh entity store (none is used by default)"""
+    store = entities.EntityStore()
+    previous = entities.setStore(store)
+    yield store
+    entities.setStore(previous)
+
+
+def test_teamsAreSharedById(store):
+    team = TeamRef.canonical("Team A", "", "N/A", 12)
+    assert TeamRef.canonical("Team A", "", "N/A", 12) is team
+    completed = TeamRef.canonical("Team A", "a.png", "TMA", 12)
+    assert completed is not team and (team.logo, team.code) == ("", "N/A") # never modified
+    # completed by the canonical team, which it replaced
+    assert TeamRef.canonical("Team A", "", "N/A", 12) is completed
+    other = TeamRef.canonical("Team A", "", "N/A", 13)
+    assert other is not completed
+    assert len(store.teams) == 2
+
+
+def test_nameOnlyTeamsGetTheirId(store):
+    byName = TeamRef.canonical("Team B", "b.png", "N/A")
+    withId = TeamRef.canonical("Team B", "", "TMB", 20)
+    assert (withId.id, withId.logo, withId.code) == (20, "b.png", "TMB")
+    assert byName.id == 0
+    assert TeamRef.canonical("Team B", "", "N/A") is withId
+    assert store.teams == [ withId ]
+
+
+def test_modelsDontDependOnOtherModels(store):
+    first = TeamRef.canonical("Team C", "", "N/A", 30).toJson()
+    other = TeamRef.canonical("Team C", "c.png", "TMC", 30)
+    assert TeamRef.canonical("Team C", "", "N/A", 30) is other
+    del other # the completed team is gone
+    assert TeamRef.canonical("Team C", "", "N/A", 30).toJson() == first
+
+
+def test_teamsWithoutIdAreSharedByName(store):
+    assert TeamRef.canonical("Team A", "", "N/A") is TeamRef.canonical("Team A", "", "N/A")
+    assert TeamRef.canonical("Team A", "", "N/A") is not TeamRef.canonical("Team B", "", "N/A")
+
+
+def test_calendarSharesTeamsAndCompetitions(store):
+    matches = Calendar._parseMonth(_calendar())
+    assert matches[0].homeTeam is matches[5].homeTeam # every day
+    assert matches[0].awayTeam is not matches[1].homeTeam # the codes differ (G / T)
+    assert all(match.competition is matches[0].competition for match in matches)
+    assert len(store.competitions) == 1
+
+
+def test_playersWithoutStatsAreShared(store):
+    data = { "TeamId": 1, "FeaturedPlayers": [ { "Name": "Jane Doe", "Number": 7, "PlayerId": 3 } ] } # pylint: disable=line-too-long
+    first = Team(data, { }, TeamStatistics({ }, True), [ ], { })
+    second = Team(data, { }, TeamStatistics({ }, True), [ ], { })
+    assert first.players[0] is second.players[0]
+    assert store.players == [ first.players[0] ]
+
+    data["FeaturedPlayers"][0]["Number"] = 8 # one player per id, the latest one
+    third = Team(data, { }, TeamStatistics({ }, True), [ ], { })
+    assert third.players[0].number == 8 and first.players[0].number == 7
+    assert store.players == [ third.players[0] ]
+
+
+def test_withoutStore(store):
+    entities.setStore(None)
+    assert TeamRef.canonical("Team A", "", "N/A") is not TeamRef.canonical("Team A", "", "N/A")
+    assert not store.teams
@@ -0,0 +1,39 @@
+import pytest
+
+from cevlib.types.results import Result
+from cevlib.types.team import Team
+
+
+SCORE = {
+    "homeSetsWon": 1,
+    "awaySetsWon": 0,
+    "setResults": [ { "homeScore": 25, "awayScore": 20, "setNumber": 1, "isInPlay": False } ],
+    "currentSetScore": { "homeScore": 3, "awayScore": 5, "setNumber": 2, "isInPlay": True }
+}
+
+
+def test_resultEqualityMatchesJson():
+    changed = { **SCORE, "currentSetScore": { **SCORE["currentSetScore"], "awayScore": 6 } }
+    assert Result(SCORE) == Result(SCORE)
+    assert Result(SCORE) != Result(changed)
+    assert (Result(SCORE) == Result(changed)) == (Result(SCORE).toJson() == Result(changed).toJson())
+
+
+def test_resultsAreHashable():
+    assert len({ Result(SCORE), Result(SCORE), Result({ }) }) == 2
+
+
+def test_teamEquality():
+    home = Team.build("Dukla Liberec", "", "LIB", True, 12240)
+    byName = Team.build("Dukla Liberec", "", "LIB", False)
+    renamed = Team.build("VK Dukla LIBEREC", "", "LIB", False, 12240)
+    other = Team.build("Lube", "", "LUB", False, 1)
+    assert home == byName
+    assert home == renamed # same id
+    assert home != other
+
+
+def test_teamsAreNotHashable():
+    # equal teams may differ in every field but one, no hash could agree with __eq__
+    with pytest.raises(TypeError):
+        hash(Team.build("Lube", "", "LUB", False, 1))
@@ -0,0 +1,78 @@
+import asyncio
+import csv
+import json
+
+import pytest
+
+from cevlib.competitions import Competition
+from cevlib.export import Exporter
+from cevlib.match import Match
+
+from fakeSite import COMPETITION_URL, MATCH_URL
+from test_archive import _calendarMatch
+
+
+def _cache():
+    async def main():
+        return await (await Match.byUrl(MATCH_URL)).cache()
+    return asyncio.run(main())
+
+
+def _read(path):
+    with open(path, encoding = "utf-8", newline = "") as file:
+        return list(csv.DictReader(file))
+
+
+def test_csv(replay, tmp_path):
+    cache = _cache()
+    competition = asyncio.run(Competition.fromUrl(COMPETITION_URL))
+    with Exporter(str(tmp_path), "csv") as exporter:
+        exporter.addMatch(cache)
+        exporter.addCompetition(competition, "CEV Cup / ")
+    matches = _read(tmp_path / "matches.csv")
+    assert matches[0]["matchCentreLink"] == MATCH_URL
+    assert matches[0]["sets"] == "25-20,25-19,22-25,25-17"
+    assert len(_read(tmp_path / "plays.csv")) == sum(len(set_.plays) for set_ in cache.playByPlay.sets) # pylint: disable=line-too-long
+    stats = _read(tmp_path / "playerStats.csv")
+    assert { row["team"] for row in stats } == { cache.homeTeam.name, cache.awayTeam.name }
+    assert len(_read(tmp_path / "standings.csv")) == exporter.rows["standings"]
+
+
+def test_batchesAreFlushed(tmp_path):
+    exporter = Exporter(str(tmp_path), "ndjson", batchSize = 10)
+    for i in range(25):
+        exporter.addMatch(_calendarMatch(i))
+    assert len(exporter._buffers["matches"]) == 5 # only the last, incomplete batch is held
+    with open(tmp_path / "matches.ndjson", encoding = "utf-8") as file:
+        assert len(file.readlines()) == 20
+    exporter.close()
+    with open(tmp_path / "matches.ndjson", encoding = "utf-8") as file:
+        rows = [ json.loads(line) for line in file ]
+    assert len(rows) == 25
+    assert rows[1]["homeTeam"] == "Team 1" and rows[1]["homeScore"] == 3
+
+
+def test_unknownFormat(tmp_path):
+    with pytest.raises(ValueError):
+        Exporter(str(tmp_path), "xlsx")
+
+
+def test_parquet(tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    with Exporter(str(tmp_path), "parquet", batchSize = 10) as exporter:
+        for i in range(25):
+            exporter.addMatch(_calendarMatch(i))
+    table = parquet.read_table(str(tmp_path / "matches.parquet"))
+    assert table.num_rows == 25
+    assert table.column("homeTeam")[1].as_py() == "Team 1"
+
+
+def test_arrow(tmp_path):
+    pyarrow = pytest.importorskip("pyarrow")
+    with Exporter(str(tmp_path), "arrow", batchSize = 10) as exporter:
+        for i in range(25):
+            exporter.addMatch(_calendarMatch(i))
+    with pyarrow.memory_map(str(tmp_path / "matches.arrow")) as source:
+        reader = pyarrow.ipc.open_file(source)
+        assert reader.num_record_batches == 3
+        assert reader.read_all().num_rows == 25
@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from cevlib import homepage
+from cevlib.competitions import Competitions
+from cevlib.featured import Featured, landingPage
+from cevlib.helpers import transport
+from cevlib.homepage import Homepage
+
+from fakeSite import HOST
+from test_competitions import MutableTransport
+
+
+@pytest.fixture
+def site():
+    site = MutableTransport()
+    previous = transport.setTransport(site)
+    yield site
+    transport.setTransport(previous)
+
+
+def test_sharedBetweenFeaturedAndCompetitions(site):
+    async def perRequest():
+        featured = [ Featured() for _ in range(3) ]
+        await asyncio.gather(*(item.init() for item in featured), Competitions.getAll())
+        return featured, await Competitions.getAll()
+    featured, competitions = asyncio.run(perRequest())
+    assert site.requests == [ f"{HOST}/" ] # one download for everything
+    assert featured[0].videos == [ "https://www.youtube.com/v/home123" ]
+    assert featured[0].gallery == featured[2].gallery
+    featured[0].gallery.clear() # copies of the shared lists
+    assert featured[2].gallery
+
+    both = asyncio.run(landingPage())
+    assert both[0].toJson() == featured[1].toJson()
+    assert both[1] is competitions
+    assert site.requests == [ f"{HOST}/" ]
+
+
+def test_expiresAfterTtl(site, monkeypatch):
+    first = asyncio.run(Homepage.get())
+    assert asyncio.run(Homepage.get()) is first
+    monkeypatch.setattr(homepage, "TTL", 0.0)
+    assert asyncio.run(Homepage.get()) is not first
+    assert len(site.requests) == 2
+
+
+def test_errorsAreNotKept(site):
+    page = site.pages.pop(f"{HOST}/") # cev.eu is down (404)
+    featured = Featured()
+    asyncio.run(featured.init())
+    assert not featured.gallery
+    site.pages[f"{HOST}/"] = page
+    asyncio.run(featured.init()) # downloaded again, not the error for the whole TTL
+    assert featured.gallery
+    assert len(site.requests) == 2
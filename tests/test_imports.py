@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+
+import cevlib
+
+HEAVY = ( "bs4", "aiohttp", "cevlib.match", "concurrent.futures.process" )
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+def _loaded(code: str) -> set:
+    """the heavy modules a fresh interpreter has imported after running code"""
+    check = f"{code}\nimport sys\nprint(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    env = { **os.environ, "PYTHONPATH": SRC }
+    output = subprocess.run([ sys.executable, "-c", check ], env = env, check = True,
+                            capture_output = True, text = True).stdout.strip()
+    return set(output.split(",")) - { "" }
+
+
+def test_calendarIsLight():
+    assert not _loaded("import cevlib.calendar")
+    assert not _loaded("from cevlib.types.results import Result")
+
+
+def test_namespaceIsLazy():
+    assert not _loaded("import cevlib\ncevlib.Result, cevlib.Calendar")
+    assert _loaded("import cevlib\ncevlib.Match") == { "cevlib.match" }
+
+
+def test_dependenciesLoadOnFirstUse():
+    assert _loaded("from cevlib.types.info import Info\nInfo('<p></p>')") == { "bs4" }
+
+
+def test_namespace():
+    assert cevlib.Calendar.__module__ == "cevlib.calendar"
+    assert set(cevlib.__all__) <= set(dir(cevlib))
+    assert all(getattr(cevlib, name) for name in cevlib.__all__)
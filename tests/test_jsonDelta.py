@@ -0,0 +1,54 @@
+import copy
+import json
+
+from cevlib.helpers import jsonDelta
+from cevlib.types.results import Result
+from cevlib.types.types import MatchState
+
+from test_jsonTool import RESULT, _cache
+
+
+OLD = { "a": 1, "b": { "c": [ 1, 2, 3 ], "d/e": "x" }, "f": None, "g": [ { "h": 1 } ] }
+NEW = { "a": 2, "b": { "c": [ 1, 5 ], "d/e": "x" }, "g": [ { "h": 1 }, { "h": 2 } ], "i": True }
+
+
+def test_diffAndPatch():
+    delta = jsonDelta.diff(OLD, NEW)
+    assert jsonDelta.patch(OLD, delta) == NEW
+    assert { "op": "remove", "path": "/f" } in delta
+    assert { "op": "add", "path": "/g/-", "value": { "h": 2 } } in delta
+    assert jsonDelta.sections(delta) == [ "a", "b", "g", "i", "f" ]
+    assert jsonDelta.patch(NEW, jsonDelta.diff(NEW, OLD)) == OLD
+
+
+def test_patchDoesNotModifyItsInput():
+    old = copy.deepcopy(OLD)
+    jsonDelta.patch(old, jsonDelta.diff(OLD, NEW))
+    assert old == OLD
+
+
+def test_equalTreesHaveAnEmptyDelta():
+    assert not jsonDelta.diff(OLD, copy.deepcopy(OLD))
+    assert jsonDelta.diff(1, 2) == [ { "op": "replace", "path": "", "value": 2 } ]
+
+
+def test_typeChangesAreOperations():
+    old = { "a": 1, "b": [ True, 0 ], "c": 2.0 }
+    new = { "a": 1.0, "b": [ 1, False ], "c": 2.0 }
+    delta = jsonDelta.diff(old, new)
+    assert [ operation["path"] for operation in delta ] == [ "/a", "/b/0", "/b/1" ]
+    assert json.dumps(jsonDelta.patch(old, delta)) == json.dumps(new)
+
+
+def test_matchCacheDelta():
+    before = _cache()
+    after = copy.copy(before)
+    score = { **RESULT["currentSetScore"], "homeScore": 16 }
+    after._result = Result({ **RESULT, "currentSetScore": score })
+    after._state = MatchState.Finished
+
+    delta = before.diff(after)
+    assert before.apply(delta) == after.toJson()
+    assert before.changedSections(after) == [ "state", "result" ]
+    assert jsonDelta.sections(delta) == [ "state", "result" ]
+    assert len(json.dumps(delta)) < len(json.dumps(after.toJson())) / 10
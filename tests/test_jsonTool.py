@@ -0,0 +1,128 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from cevlib.helpers import jsonTool
+from cevlib.match import MatchCache
+from cevlib.types.competition import MatchCompetition
+from cevlib.types.info import Info
+from cevlib.types.playByPlay import PlayByPlay
+from cevlib.types.report import MatchReport
+from cevlib.types.results import Result
+from cevlib.types.stats import TeamStatistics, TopPlayer, TopPlayers
+from cevlib.types.team import Team
+from cevlib.types.types import MatchState
+
+
+RESULT = {
+    "homeSetsWon": 2,
+    "awaySetsWon": 1,
+    "hasGoldenSet": True,
+    "setResults": [
+        { "homeScore": 25, "awayScore": 20, "setNumber": 1, "isInPlay": False },
+        { "homeScore": 23, "awayScore": 25, "setNumber": 2, "isInPlay": False },
+    ],
+    "currentSetScore": { "homeScore": 15, "awayScore": 13, "setNumber": 3, "isInPlay": True }
+}
+
+PLAY_BY_PLAY = {
+    "PlayEvents": [ {
+        "TabName": "Set 1",
+        "Events": [ { "Title": "Spike", "Description": "1-0", "SetNumber": 1,
+                      "PlayerName": "JANE DOE", "PlayerNumber": 7, "IsHome": True },
+                    { "Title": "Block", "Description": "1-1", "SetNumber": 1,
+                      "PlayerName": "jöhn roe", "PlayerNumber": 3, "IsHome": False } ]
+    } ]
+}
+
+TEAM = {
+    "TeamId": 12240,
+    "TeamLogo": { "AltText": "VK Dukla LIBEREC", "Url": "https://www.cev.eu/logo.png" },
+    "FeaturedPlayers": [ { "Number": 7, "Name": "JANE DOE", "Position": "Setter",
+                           "PositionNumber": 7, "PlayerId": 1 } ]
+}
+
+PLAYER_STATS = {
+    "Teams": [ { "Players": [ { "Name": "Jane Doe", "PlayerNumber": 7, "Points": 12,
+                                "SpikePerc": "45%", "PositiveReceptionPerc": "50%" } ] } ]
+}
+
+TEAM_STATS = {
+    "Tabs": [ { "Name": "Set 1", "Statistics": [ { "Name": "Aces", "HomeTeamValue": 2,
+                                                    "HomeTeamPercent": 33.3 } ] } ]
+}
+
+INFO_HTML = """
+<div class="text-container"><p>Säison opener</p></div>
+<div class="match-info"><ul>
+<li class="accordion-item"><a class="accordion-title">How To Attend</a>
+<img class="u-object-cover" src="https://www.cev.eu/hall.jpg">
+<p><span><strong>Capacity</strong>4000</span>Home Hall</p></li>
+</ul></div>
+"""
+
+REPORT_HTML = """
+<div class="match-report"><h2>Headline</h2>
+<div class="match-report__summary-container"><p>Body</p></div></div>
+<div class="quote-block"><p>“Great game”</p><cite>Jane Doe<br>Captain</cite></div>
+<div class="match-report"><div class="column-container"><span>90</span>
+<span class="col__content-title">Minutes</span><p>played</p></div></div>
+"""
+
+
+def _team(home: bool) -> Team:
+    return Team(TEAM, PLAYER_STATS, TeamStatistics(TEAM_STATS, home), [ ], { }, None, "LIB")
+
+
+def _cache() -> MatchCache:
+    topPlayers = TopPlayers()
+    topPlayers.append(TopPlayer({ "Type": "Scorer",
+                                  "Match": { "Players": [ { "Name": "Jane", "Score": 12 } ] } }))
+    return MatchCache(playByPlay = PlayByPlay(PLAY_BY_PLAY),
+                      competition = MatchCompetition({ "Competition": "CEV Cup | Women" }),
+                      topPlayers = topPlayers,
+                      gallery = [ "https://www.cev.eu/Upload/Photo/a.jpg" ],
+                      matchCentreLink = "https://www.cev.eu/match-centres/x/",
+                      result = Result(RESULT),
+                      duration = timedelta(minutes = 96),
+                      startTime = datetime(2022, 3, 2, 18, 0),
+                      venue = "Liberec",
+                      homeTeam = _team(True),
+                      awayTeam = _team(False),
+                      watchLink = None,
+                      highlightsLink = "https://youtube.com/v/abc",
+                      state = MatchState.Live,
+                      report = MatchReport(REPORT_HTML),
+                      info = Info(INFO_HTML))
+
+
+@pytest.fixture(params = [ True, False ], ids = [ "orjson", "json" ])
+def backend(request, monkeypatch):
+    if request.param and not jsonTool._HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(jsonTool, "_HAS_ORJSON", request.param)
+
+
+@pytest.mark.parametrize("model", [
+    lambda: Result(RESULT),
+    lambda: Result({ **RESULT, "hasGoldenSet": False }),
+    lambda: Result({ }),
+    lambda: PlayByPlay(PLAY_BY_PLAY),
+    lambda: Info(INFO_HTML),
+    lambda: MatchReport(REPORT_HTML),
+    lambda: _team(True),
+    _cache,
+])
+def test_toJsonBytesEqualsToJson(backend, model):
+    instance = model()
+    assert json.loads(instance.toJsonBytes()) == instance.toJson()
+    assert instance.toJsonBytes() == jsonTool.dumps(instance.toJson())
+
+
+def test_memoisedBytesAreReused(backend):
+    cache = _cache()
+    first = cache.toJsonBytes()
+    assert cache.result.toJsonBytes() is cache.result.toJsonBytes()
+    assert cache.info.toJsonBytes() is cache.info.toJsonBytes()
+    assert cache.toJsonBytes() == first
@@ -0,0 +1,34 @@
+import random
+
+import pytest
+
+from cevlib.helpers import linkScanner
+
+
+SCANNERS = [ linkScanner._UMBRACO, linkScanner._PHOTO, linkScanner._EMBED, linkScanner._MEDIA ]
+PIECES = [ "umbraco", "Upload/Photo/", "/embed/", "/media/", ".jpg", ".JPG", "www.cev.eu", "a.b",
+           " ", "\"", "<", ">", "/", "?", "&amp;", ".", ",", "x", "-", "_", "é", "\n", "=", ":" ]
+
+
+def _regex(scanner, html):
+    return [ match[0] for match in scanner.pattern.finditer(html) ]
+
+
+@pytest.mark.parametrize("scanner", SCANNERS, ids = lambda scanner: scanner.anchor)
+def test_scannerEqualsRegex(scanner, matchCentreHtml):
+    assert linkScanner._Page(matchCentreHtml).findAll(scanner) == _regex(scanner, matchCentreHtml)
+
+
+@pytest.mark.parametrize("scanner", SCANNERS, ids = lambda scanner: scanner.anchor)
+def test_scannerEqualsRegexOnNoise(scanner):
+    rand = random.Random(1)
+    for _ in range(2000):
+        html = "".join(rand.choice(PIECES) for _ in range(rand.randint(0, 40)))
+        assert linkScanner._Page(html).findAll(scanner) == _regex(scanner, html), html
+
+
+def test_scanMatchCentre(matchCentreHtml):
+    links = linkScanner.scanMatchCentre(matchCentreHtml)
+    assert len(links.umbraco) == 60
+    assert links.gallery[0] == "www.cev.eu/Upload/Photo/2022/03/Photo 0.jpg"
+    assert links.videos[0] == "www.youtube.com/embed/v0?rel=0"
@@ -0,0 +1,80 @@
+import asyncio
+import json
+
+from cevlib import live
+from cevlib.helpers import transport
+from cevlib.types.types import LiveEventType
+
+from fakeSite import LIVE_SNAPSHOTS, SnapshotTransport
+
+
+def test_stream(liveFeed):
+    snapshots = SnapshotTransport()
+    previous = transport.setTransport(snapshots)
+    live.setRefreshInterval(0)
+
+    async def collect(count):
+        events = [ ]
+        async for event in live.stream():
+            events.append(event)
+            if len(events) == count:
+                return events
+
+    async def main():
+        # two consumers, one shared refresh loop
+        return await asyncio.wait_for(asyncio.gather(collect(6), collect(6)), 10)
+
+    try:
+        first, second = asyncio.run(main())
+    finally:
+        transport.setTransport(previous)
+
+    assert [ event.type for event in first ] == [ LiveEventType.MatchStarted,
+                                                  LiveEventType.SetStarted,
+                                                  LiveEventType.ScoreChanged,
+                                                  LiveEventType.ScoreChanged,
+                                                  LiveEventType.SetStarted,
+                                                  LiveEventType.ScoreChanged ]
+    assert [ event.type for event in second ] == [ event.type for event in first ]
+    assert first[3].result.latestSet.homeScore == 2
+    assert first[3].previousResult.latestSet.homeScore == 1
+    assert first[0].toJson()["type"] == "matchStarted"
+    assert snapshots.requests < 10
+
+
+def test_restartDoesNotReplayOldChanges():
+    snapshots = SnapshotTransport()
+    previous = transport.setTransport(snapshots)
+
+    async def main():
+        feed = live.LiveScoresFeed(interval = 3600)
+        queue = feed.subscribe()
+        for _ in range(3):
+            await asyncio.sleep(0) # the first refresh
+        feed.unsubscribe(queue) # the last subscriber leaves, the loop stops
+        assert not feed.snapshot
+
+        snapshots.requests = len(LIVE_SNAPSHOTS) - 1 # much later
+        queue = feed.subscribe()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        feed.unsubscribe(queue)
+        assert snapshots.requests == len(LIVE_SNAPSHOTS) # refreshed once after the restart
+        return queue.empty()
+
+    try:
+        assert asyncio.run(main()) # a new baseline, no burst of outdated events
+    finally:
+        transport.setTransport(previous)
+
+
+def test_diffFinished():
+    previous = { 1: _parse(LIVE_SNAPSHOTS[4])[1] }
+    events = live.diff(previous, _parse(LIVE_SNAPSHOTS[5]))
+    assert [ event.type for event in events ] == [ LiveEventType.ScoreChanged,
+                                                   LiveEventType.MatchFinished ]
+
+
+def _parse(body):
+    from cevlib.calendar import Calendar
+    return Calendar.parseLiveScores(json.loads(body))
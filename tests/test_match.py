@@ -0,0 +1,168 @@
+import asyncio
+import json
+
+import pytest
+
+from cevlib.helpers import transport
+from cevlib.match import Match
+
+from fakeSite import AWAY_ID, EARLIER, HOME_ID, LATER, LIVE_SCORES_URL, MATCH_ID, MATCH_URL
+from fakeSite import LIVE_RESULT_URL, StaticTransport, liveResult, liveScores, pages
+
+
+URL = "https://www.cev.eu/match-centres/x/"
+
+
+def test_constructionIsLazy(matchCentreHtml):
+    match = Match(matchCentreHtml, URL) # no running event loop required
+    assert match._links is None
+    assert match._init is None
+    assert match.matchCentreLink == URL
+    assert len(match.gallery) == 100
+    assert match._links is not None
+
+
+def test_htmlIsReleasedOnceAnalysed(matchCentreHtml):
+    async def main():
+        match = Match(matchCentreHtml, URL)
+        await match.report()
+        await match.info()
+        assert match._html is not None
+        assert match.valid
+        assert match._html is None
+        assert await match.highlightsLink() == "https://www.youtube.com/v/v0"
+    asyncio.run(main())
+
+
+class CountingTransport(StaticTransport):
+    """the fake site, remembering every requested url"""
+    def __init__(self) -> None:
+        super().__init__()
+        self.requested = [ ]
+
+    async def get(self, url):
+        self.requested.append(url)
+        return await super().get(url)
+
+
+@pytest.fixture
+def site():
+    counting = CountingTransport()
+    previous = transport.setTransport(counting)
+    yield counting
+    transport.setTransport(previous)
+
+
+def test_byIdBuildsTheEndpoints(site):
+    async def main():
+        match = Match.byId(MATCH_ID, 179940, "https://www.cev.eu", (HOME_ID, AWAY_ID))
+        assert match.valid
+        assert (await match.result()).homeScore == 3
+        assert (await match.homeTeam()).id == HOME_ID
+        assert (await match.playByPlay()).valid
+        assert MATCH_URL not in site.requested # no match centre page needed
+        assert (await match.info()).valid
+        assert MATCH_URL in site.requested
+    asyncio.run(main())
+
+
+def test_byIdEqualsByUrl(site):
+    async def main():
+        byUrl = await (await Match.byUrl(MATCH_URL)).cache()
+        byId = await Match.byId(MATCH_ID, 179940).cache() # team ids from the page
+        return byUrl.toJson(), byId.toJson()
+    byUrl, byId = asyncio.run(main())
+    assert [ top["type"] for top in byUrl["topPlayers"]["topPlayers"] ] == [ "scorer", "blocker" ]
+    assert byId == byUrl
+
+
+def test_byIdScansTheTopStatistics(site):
+    async def main():
+        match = Match.byId(MATCH_ID, 179940, "https://www.cev.eu", (HOME_ID, AWAY_ID))
+        await match.result()
+        assert MATCH_URL not in site.requested
+        topPlayers = await match.topPlayers() # every category the page lists
+        assert [ top.type.value for top in topPlayers.topPlayers() ] == [ "scorer", "blocker" ]
+        assert MATCH_URL in site.requested
+    asyncio.run(main())
+
+
+class LiveTransport(transport.Transport):
+    """a live match: LiveScores and the per match score endpoint (404 if results is None)"""
+    def __init__(self, results) -> None:
+        self.results = results
+        self.requested = [ ]
+
+    async def get(self, url):
+        self.requested.append(url)
+        if url == LIVE_SCORES_URL:
+            return transport.Response(url, 200, liveScores("LIVE", EARLIER, [ ], (1, 1)))
+        if self.results is None:
+            return transport.Response(url, 404, b"")
+        return transport.Response(url, 200, json.dumps(self.results.pop(0)).encode("utf-8"))
+
+
+def test_liveResultOfSubdomainMatchCentres(site):
+    async def main():
+        html = pages()[MATCH_URL].decode("utf-8")
+        match = Match(html, MATCH_URL.replace("www.cev.eu", "championsleague.cev.eu"))
+        await match.init()
+        return match._liveResultLink()
+    assert asyncio.run(main()) == LIVE_RESULT_URL # a www.cev.eu endpoint
+    byId = Match.byId(MATCH_ID, 179940, "https://championsleague.cev.eu", (HOME_ID, AWAY_ID))
+    assert byId._liveResultLink().startswith("https://championsleague.cev.eu/")
+
+
+def _pollResults(site):
+    previous = transport.setTransport(site)
+    async def main():
+        match = Match.byId(1, 179940, teamIds = (1, 2))
+        return [ await match.result() for _ in range(4) ]
+    try:
+        return asyncio.run(main())
+    finally:
+        transport.setTransport(previous)
+
+
+def test_resultPollsTheMatchOnly():
+    site = LiveTransport([ liveResult("LIVE", [ ], (2, 1)),
+                           liveResult("FINISHED", [ (25, 20), (25, 18), (25, 10) ]) ])
+    results = _pollResults(site)
+    assert results[0].latestSet.homeScore == 1 # state unknown: LiveScores
+    assert results[1].latestSet.homeScore == 2 # live: the match only
+    assert results[2].homeScore == 3
+    assert results[3] is results[2] # final, no request
+    assert site.requested.count(LIVE_SCORES_URL) == 1
+    assert len(site.requested) == 3
+
+
+class UpcomingTransport(CountingTransport):
+    """the fake site, LiveScores lists the match as upcoming"""
+    async def get(self, url):
+        if url == LIVE_SCORES_URL:
+            self.requested.append(url)
+            return transport.Response(url, 200, liveScores("UPCOMING", LATER, [ ]))
+        return await super().get(url)
+
+
+def test_upcomingMatchIsNotFinishedByTheScoreHero():
+    previous = transport.setTransport(UpcomingTransport())
+    async def main():
+        match = Match.byId(1, 179940, teamIds = (1, 2))
+        await match.result() # empty: answered by the score hero
+        assert not await match.finished()
+        await match.result()
+        assert not await match.finished()
+        assert match._finalResult is None
+    try:
+        asyncio.run(main())
+    finally:
+        transport.setTransport(previous)
+
+
+def test_resultFallsBackToLiveScores():
+    site = LiveTransport(None)
+    results = _pollResults(site)
+    assert all(result.latestSet.homeScore == 1 for result in results)
+    assert len(site.requested) == 5 # the match endpoint is only tried once
+    assert site.requested.count(LIVE_SCORES_URL) == 4
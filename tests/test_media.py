@@ -0,0 +1,119 @@
+import asyncio
+import json
+import struct
+
+import aiohttp
+import pytest
+
+from cevlib import media
+from cevlib.helpers import transport
+from cevlib.helpers.transport import Response, Transport
+from cevlib.media import MediaResolver, dimensions
+
+HOST = "https://www.cev.eu"
+
+
+def _png(width, height):
+    return b"\x89PNG\r\n\x1a\n" + b"\x00\x00\x00\rIHDR" + struct.pack(">II", width, height) + bytes(500) # pylint: disable=line-too-long
+
+def _jpeg(width, height):
+    exif = b"\xff\xe1" + struct.pack(">H", 2 + 300) + bytes(300)
+    frame = b"\xff\xc0" + struct.pack(">HBHH", 17, 8, height, width) + bytes(12)
+    return b"\xff\xd8" + exif + frame + bytes(1000)
+
+
+class MediaTransport(Transport):
+    """photos and youtube's oembed endpoint (counts requests, tracks the concurrent ones)"""
+    def __init__(self, files) -> None:
+        self.files = files
+        self.requests = [ ]
+        self.running = 0
+        self.maxRunning = 0
+
+    async def get(self, url: str) -> Response:
+        self.requests.append(url)
+        if "/broken/" in url:
+            raise aiohttp.ClientConnectionError(url)
+        if "/slow/" in url:
+            await asyncio.sleep(1)
+        self.running += 1
+        self.maxRunning = max(self.maxRunning, self.running)
+        await asyncio.sleep(0.001)
+        self.running -= 1
+        if "/oembed" in url:
+            return Response(url, 200, json.dumps({ "title": "Highlights", "width": 480, "height": 270, # pylint: disable=line-too-long
+                                                   "thumbnail_url": f"{HOST}/hq.jpg" }).encode())
+        if url.split("?")[0] not in self.files:
+            return Response(url, 404, b"")
+        return Response(url, 200, self.files[url.split("?")[0]])
+
+
+@pytest.fixture
+def site():
+    files = { f"{HOST}/Upload/Photo/{i}.jpg": _jpeg(1000 + i, 600) for i in range(120) }
+    files[f"{HOST}/media/a.png"] = _png(64, 32)
+    files[f"{HOST}/hq.jpg"] = _jpeg(480, 360)
+    site = MediaTransport(files)
+    previous = transport.setTransport(site)
+    yield site
+    transport.setTransport(previous)
+
+
+def test_dimensions():
+    assert dimensions(_png(64, 32)) == ("image/png", 64, 32)
+    assert dimensions(_jpeg(1920, 1080)) == ("image/jpeg", 1920, 1080)
+    assert dimensions(b"GIF89a" + struct.pack("<HH", 7, 9)) == ("image/gif", 7, 9)
+    assert dimensions(b"<html>") == (None, None, None)
+
+
+def test_resolveAllIsConcurrentAndDeduplicated(site):
+    resolver = MediaResolver(concurrency = 8)
+    gallery = [ f"www.cev.eu/Upload/Photo/{i % 120}.jpg" for i in range(240) ]
+    resolved = asyncio.run(resolver.resolveAll(gallery + [ f"{HOST}/media/a.png" ]))
+    assert len(resolved) == len(site.requests) == 121
+    assert 1 < site.maxRunning <= 8
+    photo = resolved["www.cev.eu/Upload/Photo/7.jpg"]
+    assert (photo.contentType, photo.width, photo.height) == ("image/jpeg", 1007, 600)
+    assert photo.size == len(site.files[f"{HOST}/Upload/Photo/7.jpg"])
+    assert resolved[f"{HOST}/media/a.png"].toJson()["width"] == 64
+
+    site.requests.clear()
+    asyncio.run(resolver.resolveAll(gallery)) # cached
+    assert not site.requests
+
+
+def test_videosAndFailures(site):
+    resolver = MediaResolver()
+    video, missing = asyncio.run(resolver.resolveAll([ "https://www.youtube.com/v/abc",
+                                                       f"{HOST}/Upload/Photo/x.jpg" ])).values()
+    assert (video.kind, video.title, video.width) == ("video", "Highlights", 480)
+    assert not missing.valid
+    assert resolver.cached(f"{HOST}/Upload/Photo/x.jpg") is None # retried next time
+
+
+def test_transportErrorsDontFailTheOthers(site, monkeypatch):
+    monkeypatch.setattr(media, "TIMEOUT", 0.05)
+    resolver = MediaResolver()
+    urls = [ f"{HOST}/Upload/Photo/{i}.jpg" for i in range(3) ]
+    resolved = asyncio.run(resolver.resolveAll([ urls[0], f"{HOST}/broken/a.jpg",
+                                                 f"{HOST}/slow/b.jpg", *urls[1:] ]))
+    assert [ info.valid for info in resolved.values() ] == [ True, False, False, True, True ]
+    assert resolved[f"{HOST}/broken/a.jpg"].kind == "photo"
+    assert resolver.cached(f"{HOST}/broken/a.jpg") is None # retried next time
+    assert len(resolver) == 3
+
+
+def test_saveThumbnailInChunks(site, tmp_path, monkeypatch):
+    monkeypatch.setattr(media, "CHUNK_BYTES", 256)
+    path = str(tmp_path / "thumb.jpg")
+    resolver = MediaResolver()
+    assert asyncio.run(resolver.saveThumbnail("www.cev.eu/Upload/Photo/3.jpg", path))
+    photo = site.files[f"{HOST}/Upload/Photo/3.jpg"]
+    with open(path, "rb") as file:
+        assert file.read() == photo
+    assert sum("width=320" in url for url in site.requests) == -(-len(photo) // 256) # a request per chunk # pylint: disable=line-too-long
+
+    assert asyncio.run(resolver.saveThumbnail("https://www.youtube.com/embed/abc", path))
+    with open(path, "rb") as file:
+        assert file.read() == site.files[f"{HOST}/hq.jpg"]
+    assert not asyncio.run(resolver.saveThumbnail(f"{HOST}/Upload/Photo/x.jpg", path))
@@ -0,0 +1,55 @@
+import asyncio
+
+from cevlib.helpers import metrics
+from cevlib.match import Match
+
+from fakeSite import MATCH_URL
+
+
+def test_endpointName():
+    assert metrics.endpointName("https://weblivefeed.cev.eu/LiveScores.json") == "LiveScores"
+    assert metrics.endpointName("https://www.cev.eu/umbraco/api/MatchCentreApi/GetMatchPoll?matchPollUid=1") == "GetMatchPoll"
+    assert metrics.endpointName("https://www.cev.eu/") == "homepage"
+    assert metrics.endpointName(MATCH_URL) == "matchCentre"
+
+
+def test_disabledByDefault():
+    assert not metrics.enabled()
+    assert metrics.measure("build", "Team") is metrics._DISABLED
+    with metrics.trace("cache") as events:
+        metrics.cacheLookup("form", True)
+    assert events == [ ]
+
+
+def test_cacheTrace(replay):
+    events = [ ]
+    collector = metrics.PrometheusCollector()
+    metrics.addHook(events.append)
+    metrics.addHook(collector)
+    try:
+        async def main():
+            match = await Match.byUrl(MATCH_URL)
+            await match.cache()
+        asyncio.run(main())
+    finally:
+        metrics.removeHook(events.append)
+        metrics.removeHook(collector)
+    assert not metrics.enabled()
+
+    trace = events[-1]
+    assert trace.kind == "trace" and trace.name == "cache"
+    kinds = { (child.kind, child.name) for child in trace.children }
+    assert ("request", "GetStartingTeamComponent") in kinds
+    assert ("jsonDecode", "getlivescorehero") in kinds
+    # parsed in a worker thread, still part of the trace
+    assert ("htmlParse", "MatchReport") in kinds
+    assert ("htmlParse", "Info") in kinds
+    assert ("build", "Team") in kinds
+    assert trace.size == sum(child.size for child in trace.children if child.kind == "request")
+
+    assert collector.value("request_seconds_count", "matchCentre") == 1
+    # concurrent getters miss the (still empty) live scores cache at the same time
+    assert collector.value("request_seconds_count", "LiveScores") == collector.value("cache_misses_total", "liveScores")
+    assert collector.value("request_bytes_total") == sum(event.size for event in events
+                                                         if event.kind == "request")
+    assert 'cevlib_request_seconds_count{endpoint="matchCentre"} 1\n' in collector.expose()
@@ -0,0 +1,61 @@
+import asyncio
+import pickle
+
+import pytest
+
+from cevlib.calendar import Calendar
+from cevlib.competitions import Competition
+from cevlib.helpers import parsePool
+from cevlib.types import entities
+from cevlib.match import Match
+from cevlib.types.info import Info
+
+from fakeSite import COMPETITION_URL, MATCH_URL, pages
+
+
+@pytest.fixture
+def processPool():
+    parsePool.enable(2)
+    yield
+    parsePool.disable()
+
+
+async def _load():
+    cache = await (await Match.byUrl(MATCH_URL)).cache()
+    competition = await Competition.fromUrl(COMPETITION_URL)
+    calendar = await Calendar.matchesOfMonth(3, 2022)
+    return cache.toJson(), competition.toJson(), [ match.toJson() for match in calendar ]
+
+
+def test_sameModels(replay, processPool):
+    assert parsePool.enabled()
+    pooled = asyncio.run(_load())
+    parsePool.disable()
+    assert not parsePool.enabled()
+    assert pooled == asyncio.run(_load())
+
+
+def test_poolResultsUseTheStore(replay, processPool):
+    store = entities.EntityStore()
+    previous = entities.setStore(store)
+    try:
+        pooled = asyncio.run(Calendar.matchesOfMonth(3, 2022))
+        assert pooled[0].homeTeam is pooled[5].homeTeam
+        assert pooled[0].competition is pooled[1].competition
+        # interned into the store of this process
+        assert any(team is pooled[0].homeTeam for team in store.teams)
+        assert store.competitions == [ pooled[0].competition ]
+        parsePool.disable()
+        inProcess = asyncio.run(Calendar.matchesOfMonth(3, 2022))
+        assert inProcess[0].homeTeam is pooled[0].homeTeam
+        assert inProcess[0].competition is pooled[0].competition
+    finally:
+        entities.setStore(previous)
+
+
+def test_modelsArePlain():
+    # models must not keep (and pickle) the parsed document
+    html = pages()[MATCH_URL].decode("utf-8")
+    info = Info(html)
+    assert info.toJson()["officials"][0]["name"] == "Jane Referee"
+    assert len(pickle.dumps(info)) < 2000
@@ -0,0 +1,91 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from cevlib.helpers.scheduler import PollPolicy, PollResult, PollScheduler
+from cevlib.match import Match
+from cevlib.types.types import MatchState
+
+from fakeSite import MATCH_URL
+
+
+def _result(state, startIn = 0.0, inPlay = False, changed = False):
+    return PollResult(state, datetime.utcnow() + timedelta(seconds = startIn), inPlay, changed)
+
+
+def test_policy():
+    policy = PollPolicy(live = 10, liveBreak = 60, upcoming = 900, nearStart = 600, backoff = 2)
+    assert policy.nextInterval(_result(MatchState.Upcoming, 86400), 0, False) == 900
+    assert 390 < policy.nextInterval(_result(MatchState.Upcoming, 1000), 0, False) <= 400
+    assert policy.nextInterval(_result(MatchState.Upcoming, 300), 900, False) == 10
+    assert policy.nextInterval(_result(MatchState.Live, inPlay = True), 40, False) == 10
+    # between sets: back off up to liveBreak
+    assert policy.nextInterval(_result(MatchState.Live), 10, False) == 20
+    assert policy.nextInterval(_result(MatchState.Live), 40, False) == 60
+    assert policy.nextInterval(_result(MatchState.Live, changed = True), 60, False) == 10
+    # finished: confirmed once, then dropped
+    assert policy.nextInterval(_result(MatchState.Finished, changed = True), 10, False) == 10
+    assert policy.nextInterval(_result(MatchState.Finished), 10, True) is None
+
+
+def _job(polls, state, inPlay = True):
+    async def poll():
+        polls.append(state)
+        return _result(state, 3600 if state == MatchState.Upcoming else 0, inPlay, False)
+    return poll
+
+
+def test_scheduler():
+    async def main():
+        scheduler = PollScheduler()
+        polls = [ ]
+        policy = PollPolicy(live = 0.01, liveBreak = 0.04, upcoming = 10, nearStart = 1)
+        live = scheduler.add(_job(polls, MatchState.Live), policy)
+        scheduler.add(_job(polls, MatchState.Upcoming), policy)
+        finished = scheduler.add(_job(polls, MatchState.Finished), policy)
+        await asyncio.sleep(0.2)
+        scheduler.remove(live)
+        await asyncio.sleep(0.05)
+        return polls, live, finished, scheduler
+    polls, live, finished, scheduler = asyncio.run(main())
+    assert polls.count(MatchState.Upcoming) == 1
+    assert polls.count(MatchState.Finished) == 2 # confirmed once
+    assert polls.count(MatchState.Live) > 5
+    assert not live.active and not finished.active
+    assert len(scheduler.jobs) == 1
+
+
+def test_budget():
+    async def main():
+        scheduler = PollScheduler(budget = 600) # one poll every 0.1s
+        polls = [ ]
+        policy = PollPolicy(live = 0.001)
+        upcoming = PollPolicy(live = 0.001, nearStart = 7200)
+        for _ in range(2):
+            scheduler.add(_job(polls, MatchState.Upcoming), upcoming)
+        for _ in range(2):
+            scheduler.add(_job(polls, MatchState.Live), policy)
+        await asyncio.sleep(0.75)
+        for job in scheduler.jobs:
+            scheduler.remove(job)
+        return polls
+    polls = asyncio.run(main())
+    assert 7 <= len(polls) <= 8
+    # every job is polled once, afterwards live polls go first (the budget is exhausted)
+    assert sorted(polls[:4], key = lambda state: state.value) == [ MatchState.Live ] * 2 + [ MatchState.Upcoming ] * 2
+    assert set(polls[4:]) == { MatchState.Live }
+
+
+def test_matchScoreObserver(replay):
+    async def main():
+        match = await Match.byUrl(MATCH_URL)
+        scores = [ ]
+        async def observer(_, score):
+            scores.append(score)
+        match.setScoreObserverPolicy(PollPolicy(live = 0.01))
+        match.addScoreObserver(observer)
+        await asyncio.sleep(0.3)
+        return scores, match._scoreObserverJob
+    scores, job = asyncio.run(main())
+    assert len(scores) == 1
+    assert scores[0].homeScore == 3
+    assert not job.active # finished and confirmed
@@ -0,0 +1,157 @@
+import asyncio
+import json
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from cevlib import live
+from cevlib.helpers import transport
+from cevlib.server import Gateway, SharedCache
+
+from fakeSite import COMPETITION_URL, MATCH_URL, SnapshotTransport
+
+
+def _serve(gateway, test):
+    async def main():
+        async with TestClient(TestServer(gateway.app())) as client:
+            return await test(client)
+    return asyncio.run(main())
+
+
+def test_sharedCache():
+    async def main():
+        cache = SharedCache(ttl = 60)
+        calls = [ ]
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return b"[]"
+        bodies = await asyncio.gather(*(cache.get("key", load) for _ in range(10)))
+        assert bodies == [ b"[]" ] * 10
+        assert await cache.get("key", load) == b"[]"
+        assert len(calls) == 1
+
+        async def fail():
+            raise ValueError("upstream down")
+        for _ in range(2):
+            try:
+                await cache.get("failing", fail)
+            except ValueError:
+                pass
+        assert await cache.get("failing", load) == b"[]" # failures aren't cached
+    asyncio.run(main())
+
+
+def test_sharedCacheIsBounded():
+    async def main():
+        cache = SharedCache(ttl = 60, maxEntries = 3)
+        async def load():
+            return b"[]"
+        for key in "abcd":
+            await cache.get(key, load)
+            if key == "b":
+                await cache.get("a", load) # a is used again, b is dropped before it
+        assert len(cache) == 3
+        calls = [ ]
+        async def count():
+            calls.append(1)
+            return b"[]"
+        await cache.get("a", count)
+        assert not calls
+        await cache.get("b", count)
+        assert calls
+    asyncio.run(main())
+
+
+def test_gateway(replay):
+    async def test(client):
+        responses = await asyncio.gather(*(client.get("/match", params = { "url": MATCH_URL })
+                                           for _ in range(3)))
+        bodies = [ await response.json() for response in responses ]
+        assert all(response.status == 200 for response in responses)
+        assert bodies[0] == bodies[2]
+        assert bodies[0]["homeTeam"]["id"] == 12240
+
+        competition = await client.get("/competition", params = { "url": COMPETITION_URL })
+        assert (await competition.json())[0]["name"] == "Pool Phase"
+
+        calendar = await client.get("/calendar", params = { "month": 3, "year": 2022 })
+        assert len(await calendar.json()) == 28 * 5
+
+        assert (await client.get("/match")).status == 400
+        missing = await client.get("/match", params = { "url": "https://www.cev.eu/missing/" })
+        assert missing.status == 502
+
+        for url in [ "http://169.254.169.254/latest/meta-data/", "https://www.cev.eu.example.com/",
+                     "https://cev.eu.example.com/", "http://championsleague.cev.eu/",
+                     "https://user@www.cev.eu/", "https://www.cev.eu:8443/", "file:///etc/passwd",
+                     "not a link" ]:
+            assert (await client.get("/match", params = { "url": url })).status == 400
+            assert (await client.get("/competition", params = { "url": url })).status == 400
+    _serve(Gateway(), test)
+
+
+class RecordingTransport(transport.Transport):
+    """requests nothing, records the urls (404)"""
+    def __init__(self) -> None:
+        self.requests = [ ]
+
+    async def get(self, url):
+        self.requests.append(url)
+        return transport.Response(url, 404, b"")
+
+
+def test_gatewayKeepsTheSubdomain():
+    site = RecordingTransport()
+    previous = transport.setTransport(site)
+    url = "https://championsleague.cev.eu/en/match-centres/cev-champions-league-volley-2022/men/clm-61/" # pylint: disable=line-too-long
+
+    async def test(client):
+        response = await client.get("/match", params = { "url": url + "?tab=stats#top" })
+        assert response.status == 502 # accepted, the page is missing
+        assert (await client.get("/match", params = { "url": "https://cev.eu/x/" })).status == 502
+        assert (await client.get("/match", params = { "url": "https://evilcev.eu/x/" })).status == 400 # pylint: disable=line-too-long
+
+    try:
+        _serve(Gateway(), test)
+    finally:
+        transport.setTransport(previous)
+    assert url in site.requests # on its own host, without query and fragment
+
+
+def test_liveEvents(liveFeed):
+    snapshots = SnapshotTransport(held = True)
+    previous = transport.setTransport(snapshots)
+
+    async def test(client):
+        async def websocket():
+            async with client.ws_connect("/live/ws") as socket:
+                return [ json.loads((await socket.receive()).data)["type"] for _ in range(3) ]
+
+        async def serverSentEvents():
+            response = await client.get("/live/events")
+            events = [ ]
+            async for line in response.content:
+                if line.startswith(b"event: "):
+                    events.append(line[len(b"event: "):].strip().decode("utf-8"))
+                if len(events) == 3:
+                    response.close()
+                    return events
+            return events
+
+        async def release():
+            while len(live.feed()._queues) < 2: # both clients subscribed
+                await asyncio.sleep(0.01)
+            snapshots.held = False
+
+        first, second, _ = await asyncio.wait_for(asyncio.gather(websocket(),
+                                                                 serverSentEvents(),
+                                                                 release()), 10)
+        snapshot = await (await client.get("/live")).json()
+        return first, second, snapshot
+
+    try:
+        first, second, snapshot = _serve(Gateway(liveInterval = 0.01), test)
+    finally:
+        transport.setTransport(previous)
+    assert first == second == [ "matchStarted", "setStarted", "scoreChanged" ]
+    assert snapshot["1"]["homeTeam"]["name"] == "Home"
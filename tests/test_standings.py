@@ -0,0 +1,54 @@
+import pickle
+
+from cevlib.competitions import Standings
+from cevlib.helpers import htmlParser
+
+
+def _table():
+    def row(rank, teamId, name, won, lost, ratio):
+        return (f"<tr><td>{rank}</td><td><a href=\"/team/{teamId}-{name.lower()}\">{name}</a></td>"
+                f"<td>{won}</td><td class=\"u-pr-8\">{lost}</td><td>{ratio}</td><td>{won * 3}</td></tr>") # pylint: disable=line-too-long
+    return htmlParser.parse(f"""<div class="pool-standings-table"><table>
+<thead><tr><th></th><th></th><th>Matches</th><th>Sets</th></tr>
+<tr><th>Pos</th><th class="u-pr-8">Team</th><th>W</th><th class="u-pr-8">L</th><th>Ratio</th><th>Points</th></tr></thead>
+<tbody>{row(1, 11, "Alpha", 4, 0, "3.000")}{row(2, 12, "Beta", 2, 2, "1,250")}{row(3, 13, "Gamma", 2, 2, "MAX")}</tbody>
+<tbody>{row(1, 21, "Delta", 3, 1, "2.000")}{row(2, 22, "Epsilon", 1, 3, "0.500")}</tbody>
+</table></div>""")
+
+
+def test_schema():
+    standings = Standings(_table())
+    assert [ (column.key, column.kind) for column in standings.columns ] == [
+        (".Pos", "int"), (".Team", "text"), ("Matches.W", "int"), ("Matches.L", "int"),
+        ("Sets.Ratio", "text"), ("Sets.Points", "int") ]
+    assert len(standings.pools) == 2
+    assert standings.get(0).columns is standings.get(1).columns # parsed once
+
+
+def test_typedValues():
+    pool = Standings(_table()).get(0)
+    assert list(pool.column("Matches.W")) == [ 4, 2, 2 ]
+    assert pool.column("Team") == [ "Alpha", "Beta", "Gamma" ]
+    assert pool.teams[1].toJson() == { ".Pos": 2, ".Team": "Beta", "Matches.W": 2,
+                                       "Matches.L": 2, "Sets.Ratio": "1,250", "Sets.Points": 6 }
+    assert pool.byTeamId(13).get("Team") == "Gamma"
+    assert pool.byTeamId(21) is None
+
+
+def test_sorting():
+    pool = Standings(_table()).get(1)
+    assert [ team.id for team in pool.sortedBy("Matches.L") ] == [ 22, 21 ]
+    assert [ team.rank for team in pool.sortedBy("Points", "Matches.L", descending = False) ] == [ 2, 1 ] # pylint: disable=line-too-long
+
+
+def test_compactAndPicklable():
+    pool = pickle.loads(pickle.dumps(Standings(_table()).get(1)))
+    columns = pool.toColumnsJson()
+    assert columns["teamIds"] == [ 21, 22 ]
+    assert columns["values"][2] == [ 3, 1 ]
+    assert [ team.toJson() for team in pool.teams ] == pool.toJson()
+
+
+def test_empty():
+    assert Standings(None).pools == [ ]
+    assert Standings(htmlParser.parse("<div><table></table></div>")).toJson() == [ ]
@@ -0,0 +1,38 @@
+from cevlib.types.stats import PlayerStatisticIndex, TeamStatistics
+from cevlib.types.team import Team, TeamRef
+
+
+PERCENTAGES = { "SpikePerc": "50%", "PositiveReceptionPerc": "40%" }
+PLAYER_STATS = {
+    "Teams": [
+        { "Players": [ { "Name": "JANE DOE", "PlayerNumber": 7, "Points": 12, **PERCENTAGES },
+                       { "Name": "ANNA SMITH", "PlayerNumber": 9, "Points": 3, **PERCENTAGES } ] },
+        { "Players": [ { "Name": "MARIA ROSSI", "PlayerNumber": 7, "Points": 20, **PERCENTAGES } ] }
+    ]
+}
+
+
+def _team(name: str, number: int, stats) -> Team:
+    return Team({ "TeamId": 1, "FeaturedPlayers": [ { "Name": name, "Number": number } ] },
+                stats, TeamStatistics({ }, True), [ ], { })
+
+
+def test_playersSharingANumberAreToldApartByName():
+    index = PlayerStatisticIndex.parse(PLAYER_STATS)
+    assert _team("Jane Doe", 7, index).players[0].stats.points == 12
+    assert _team("maria rossi", 7, index).players[0].stats.points == 20
+    assert _team("Anna Smith", 7, index).players[0].stats is None
+
+
+def test_rawStatsAreStillAccepted():
+    assert _team("Anna Smith", 9, PLAYER_STATS).players[0].stats.points == 3
+
+
+def test_teamRefIsPromotedToATeam():
+    ref = TeamRef("Dukla Liberec", "logo.png", "LIB", 12240)
+    team = ref.promote(home = False)
+    assert isinstance(team, Team)
+    assert (team.name, team.logo, team.nickname, team.id) == ("Dukla Liberec", "logo.png", "LIB", 12240)
+    assert team == ref
+    assert ref.toJson() == team.toJson()
+    assert not hasattr(ref, "__dict__")
@@ -0,0 +1,70 @@
+import asyncio
+import json
+
+import pytest
+
+from cevlib.calendar import Calendar
+from cevlib.competitions import Competition
+from cevlib.exceptions import NotRecordedException
+from cevlib.featured import Featured
+from cevlib.helpers import transport
+from cevlib.helpers.transport import RecordingTransport, ReplayTransport
+from cevlib.match import Match
+
+from fakeSite import COMPETITION_URL, MATCH_URL, StaticTransport
+
+
+def test_recordingRoundtrip(tmp_path):
+    async def main():
+        recorded = await RecordingTransport(str(tmp_path), StaticTransport()).get(MATCH_URL)
+        replayed = await ReplayTransport(str(tmp_path)).get(MATCH_URL)
+        assert replayed.status == recorded.status == 200
+        assert replayed.body == recorded.body
+        with pytest.raises(NotRecordedException):
+            await ReplayTransport(str(tmp_path)).get(COMPETITION_URL)
+    asyncio.run(main())
+
+
+def test_setTransportRestores(replay):
+    replaying = transport.getTransport()
+    assert isinstance(replaying, ReplayTransport)
+    previous = transport.setTransport(StaticTransport())
+    assert previous is replaying
+    transport.setTransport(previous)
+
+
+def test_matchCache(replay):
+    async def main():
+        match = await Match.byUrl(MATCH_URL)
+        cache = await match.cache()
+        assert cache.valid
+        assert cache.result.homeScore == 3
+        assert cache.homeTeam.id == 12240
+        assert len(cache.homeTeam.players) == 14
+        assert cache.homeTeam.players[1].stats.points == 12
+        assert cache.report.headline == "Home win the first leg"
+        assert len(cache.gallery) == 2
+        assert json.loads(cache.toJsonBytes()) == json.loads(json.dumps(cache.toJson()))
+    asyncio.run(main())
+
+
+def test_competition(replay):
+    async def main():
+        competition = await Competition.fromUrl(COMPETITION_URL)
+        assert len(competition.rounds) == 1
+        assert len(competition.rounds[0].pools[0].draws) == 2
+    asyncio.run(main())
+
+
+def test_calendar(replay):
+    matches = asyncio.run(Calendar.matchesOfMonth(3, 2022))
+    assert len(matches) == 28 * 5
+
+
+def test_featured(replay):
+    async def main():
+        featured = Featured()
+        await featured.init()
+        assert len(featured.gallery) == 2
+        assert featured.videos == [ "https://www.youtube.com/v/home123" ]
+    asyncio.run(main())
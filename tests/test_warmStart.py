@@ -0,0 +1,70 @@
+import asyncio
+import os
+
+import pytest
+
+from cevlib import warmStart
+from cevlib.competitions import Competition, Competitions
+from cevlib.helpers import transport
+from cevlib.helpers.transport import Response, Transport
+
+from fakeSite import COMPETITION_URL
+
+
+class OfflineTransport(Transport):
+    """every request fails (a warm start must not need any)"""
+    def __init__(self) -> None:
+        self.requests = 0
+
+    async def get(self, url: str) -> Response:
+        self.requests += 1
+        return Response(url, 503, b"")
+
+
+@pytest.fixture
+def warmCache(tmp_path):
+    warmStart.clear()
+    yield warmStart.WarmStartCache(str(tmp_path / "competitions.cache"))
+    warmStart.clear()
+
+
+def test_coldAndWarmStart(replay, warmCache):
+    assert not warmCache.load()
+    assert asyncio.run(warmCache.revalidate([ COMPETITION_URL ]))
+    expected = asyncio.run(Competition.fromUrl(COMPETITION_URL)).toJson()
+    links = [ link.toJson() for link in Competitions._competitionsCache ]
+
+    warmStart.clear() # a new process
+    offline = OfflineTransport()
+    previous = transport.setTransport(offline)
+    try:
+        assert warmCache.load()
+        assert asyncio.run(Competition.fromUrl(COMPETITION_URL)).toJson() == expected
+        assert asyncio.run(Competitions.getAll()).toJson() == links
+    finally:
+        transport.setTransport(previous)
+    assert offline.requests == 0
+
+
+def test_revalidationSavesChangesOnly(replay, warmCache):
+    asyncio.run(warmCache.revalidate([ COMPETITION_URL ]))
+    modified = os.stat(warmCache.path).st_mtime_ns
+    assert not asyncio.run(warmCache.revalidate())
+    assert os.stat(warmCache.path).st_mtime_ns == modified
+
+    async def background():
+        return await warmCache.revalidateInBackground()
+    assert not asyncio.run(background())
+
+
+def test_otherVersionsAreIgnored(replay, warmCache, monkeypatch):
+    asyncio.run(warmCache.revalidate([ COMPETITION_URL ]))
+    warmStart.clear()
+    monkeypatch.setattr(warmStart, "FORMAT_VERSION", warmStart.FORMAT_VERSION + 1)
+    assert not warmCache.load()
+    assert not Competitions._competitionsCache
+
+    with open(warmCache.path, "wb") as file:
+        file.write(b"garbage")
+    assert not warmCache.load()
+    assert [ name for name in os.listdir(os.path.dirname(warmCache.path)) ] == [ "competitions.cache" ]